@@ -1532,6 +1532,12 @@ ADVERSARY_PREFIXES.update(
     }
 )
 
+# First persona line per adversary, for listings (--list-adversaries etc.)
+ADVERSARY_SUMMARIES: dict[str, str] = {
+    name: adv.persona.strip().split("\n", 1)[0]
+    for name, adv in list(PRE_GAUNTLET.items()) + list(ADVERSARIES.items()) + list(FINAL_BOSS.items())
+}
+
 
 # =============================================================================
 # ID GENERATION
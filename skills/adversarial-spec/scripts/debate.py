@@ -50,6 +50,7 @@ from __future__ import annotations
 
 import argparse
 import hashlib
+import importlib.util
 import json
 import os
 import sys
@@ -61,9 +62,10 @@ from typing import Any, Optional
 warnings.filterwarnings("ignore", message="Pydantic serializer warnings")
 os.environ["LITELLM_LOG"] = "ERROR"
 
-try:
-    import litellm  # noqa: F401
-except ImportError:
+# Only check that litellm is installed: importing it takes seconds, and the
+# info/utility commands never call a model. models.get_litellm_completion()
+# loads it on the first API call.
+if importlib.util.find_spec("litellm") is None:
     print(
         "Error: litellm package not installed. Run: pip install litellm",
         file=sys.stderr,
@@ -72,6 +74,7 @@ except ImportError:
 
 import token_tracking  # noqa: E402
 from adversaries import (  # noqa: E402
+    ADVERSARY_SUMMARIES,
     FINAL_BOSS,
     PRE_GAUNTLET,
 )
@@ -642,7 +645,7 @@ def handle_info_command(args: argparse.Namespace) -> bool:
         print(f"  {'─' * 28}  {'─' * 6}  {'─' * 50}")
         all_advs = list(PRE_GAUNTLET.items()) + list(ADVERSARIES.items()) + list(FINAL_BOSS.items())
         for name, adv in all_advs:
-            first_line = adv.persona.strip().split("\n")[0][:50]
+            first_line = ADVERSARY_SUMMARIES[name][:50]
             category = "(pre-gauntlet)" if name in PRE_GAUNTLET else "(final boss)" if name in FINAL_BOSS else ""
             print(f"  {name:<30} {adv.prefix:<8} {first_line}... {category}")
         print()
@@ -0,0 +1,108 @@
+"""Provider batch API for non-interactive Phase 4 runs.
+
+With --batch-api, each OpenAI evaluation model gets its whole Phase 4
+workload as one batch job (JSONL upload to /v1/chat/completions with a 24h
+completion window) instead of one live request per batch. Batch pricing is
+about half the live rate, but jobs take minutes to hours, so this is meant
+for CI and nightly runs. Other providers stay on the live path.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import token_tracking
+from gauntlet import json_utils
+
+# Seconds between batch status polls.
+BATCH_POLL_INTERVAL = 30
+
+# Batch jobs are billed at half the live per-token rate.
+BATCH_API_DISCOUNT = 0.5
+
+_BATCH_ENDPOINT = "/v1/chat/completions"
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+def supports_batch_api(model: str) -> bool:
+    """True for models served by the OpenAI API (bare gpt-/o-series or openai/)."""
+    provider, sep, _ = model.partition("/")
+    if sep:
+        return provider == "openai"
+    return model.startswith(("gpt-", "o1", "o3", "o4"))
+
+
+def _request_line(custom_id: str, model: str, system_prompt: str, user_message: str) -> bytes:
+    body = {
+        "model": model.removeprefix("openai/"),
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_message},
+        ],
+        "temperature": 0.7,
+    }
+    record = {"custom_id": custom_id, "method": "POST", "url": _BATCH_ENDPOINT, "body": body}
+    return json_utils.dumpb(record) + b"\n"
+
+
+def run_chat_batch(
+    model: str,
+    requests: list[tuple[str, str, str]],
+    poll_interval: float = BATCH_POLL_INTERVAL,
+) -> dict[str, tuple[str, int, int]]:
+    """Run (custom_id, system_prompt, user_message) requests as one batch job.
+
+    Blocks until the job reaches a terminal status. Raises RuntimeError if the
+    job does not complete.
+
+    Returns:
+        custom_id -> (response_text, input_tokens, output_tokens) for every
+        request that succeeded; failed requests are simply absent.
+    """
+    import litellm
+
+    payload = b"".join(_request_line(cid, model, system, user) for cid, system, user in requests)
+    uploaded = litellm.create_file(
+        file=("gauntlet-batch.jsonl", payload),
+        purpose="batch",
+        custom_llm_provider="openai",
+    )
+    batch = litellm.create_batch(
+        completion_window="24h",
+        endpoint=_BATCH_ENDPOINT,
+        input_file_id=uploaded.id,
+        custom_llm_provider="openai",
+    )
+    print(f"  {model}: submitted batch {batch.id} ({len(requests)} requests)", file=sys.stderr)
+
+    while batch.status not in _TERMINAL_STATUSES:
+        time.sleep(poll_interval)
+        batch = litellm.retrieve_batch(batch_id=batch.id, custom_llm_provider="openai")
+
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"Batch {batch.id} for {model} ended with status {batch.status}")
+
+    output = litellm.file_content(file_id=batch.output_file_id, custom_llm_provider="openai")
+    replies: dict[str, tuple[str, int, int]] = {}
+    for line in output.content.splitlines():
+        if not line.strip():
+            continue
+        record = json_utils.loads(line)
+        response = record.get("response") or {}
+        if response.get("status_code") != 200:
+            continue
+        body = response.get("body") or {}
+        choices = body.get("choices") or []
+        if not choices:
+            continue
+        usage = body.get("usage") or {}
+        input_tokens = usage.get("prompt_tokens", 0)
+        output_tokens = usage.get("completion_tokens", 0)
+        token_tracking.tracker.record_call(
+            model, input_tokens, output_tokens, rate_scale=BATCH_API_DISCOUNT,
+        )
+        replies[record["custom_id"]] = (
+            choices[0]["message"].get("content") or "", input_tokens, output_tokens,
+        )
+    return replies
@@ -6,24 +6,117 @@ Extracted from gauntlet_monolith.py. Adds new flags:
 
 from __future__ import annotations
 
-import json
+import io
 import sys
 
 
+def _print_stats() -> None:
+    from gauntlet.reporting import get_adversary_leaderboard
+
+    print(get_adversary_leaderboard())
+
+
+def _print_runs(limit: int) -> None:
+    from gauntlet.persistence import list_gauntlet_runs
+
+    print(list_gauntlet_runs(limit))
+
+
+def _write_json(data, indent: bool = True) -> None:
+    """Write data as JSON to stdout, going straight to the binary buffer.
+
+    Falls back to a text write when stdout has no buffer (e.g. StringIO).
+    """
+    from gauntlet import json_utils
+
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        print(json_utils.dumps(data, indent=indent))
+        return
+    sys.stdout.flush()  # keep ordering with any text already printed
+    buffer.write(json_utils.dumpb(data, indent=indent))
+    buffer.write(b"\n")
+    buffer.flush()
+
+
+def _show_run(filename: str) -> None:
+    from gauntlet.persistence import load_gauntlet_run
+
+    run_data = load_gauntlet_run(filename)
+    if run_data:
+        _write_json(run_data)
+    else:
+        print(f"Run not found: {filename}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _print_adversaries() -> None:
+    from adversaries import ADVERSARIES, ADVERSARY_SUMMARIES
+
+    print("Available adversaries:\n")
+    for name in ADVERSARIES:
+        print(f"  {name:20} {ADVERSARY_SUMMARIES[name][:60]}...")
+
+
+def _read_spec_file(path: str) -> str:
+    """Read a spec file as UTF-8 in one call."""
+    from pathlib import Path
+
+    return Path(path).read_text(encoding="utf-8").strip()
+
+
+def _read_spec_stdin() -> str:
+    """Read the spec from stdin as raw bytes and decode once.
+
+    Skips the text layer of sys.stdin but applies the same universal-newline
+    translation; exits with an error on input that is not valid UTF-8.
+    Falls back to text reads when stdin has no binary buffer (e.g. StringIO).
+    """
+    buffer = getattr(sys.stdin, "buffer", None)
+    if buffer is None:
+        return sys.stdin.read().strip()
+    raw = buffer.read()
+    try:
+        spec = raw.decode("utf-8")
+    except UnicodeDecodeError as e:
+        print(f"Error: spec on stdin is not valid UTF-8: {e}", file=sys.stderr)
+        sys.exit(1)
+    del raw
+    return spec.replace("\r\n", "\n").replace("\r", "\n").strip()
+
+
+def _run_fast_path(argv: list[str]) -> bool:
+    """Handle the read-only fast-exit commands without building the parser.
+
+    Only exact invocations are matched (e.g. `--stats` alone); anything
+    else, including --help, falls through to argparse. Returns True if
+    the command was handled.
+    """
+    if argv == ["--stats"]:
+        _print_stats()
+    elif argv == ["--list-adversaries"]:
+        _print_adversaries()
+    elif argv == ["--list-runs"]:
+        _print_runs(10)
+    elif len(argv) == 2 and argv[0] == "--list-runs" and argv[1].isdigit():
+        _print_runs(int(argv[1]))
+    elif len(argv) == 2 and argv[0] == "--show-run" and not argv[1].startswith("-"):
+        _show_run(argv[1])
+    else:
+        return False
+    return True
+
+
 def main():
     """CLI entry point for standalone gauntlet runs."""
+    if _run_fast_path(sys.argv[1:]):
+        return
+
     import argparse
 
-    from adversaries import ADVERSARIES
+    from gauntlet.model_dispatch import PROVIDER_KEYS
     from gauntlet.orchestrator import run_gauntlet
-    from gauntlet.persistence import (
-        list_gauntlet_runs,
-        load_gauntlet_run,
-    )
-    from gauntlet.reporting import (
-        format_gauntlet_report,
-        get_adversary_leaderboard,
-    )
+    from gauntlet.reporting import format_gauntlet_report
 
     parser = argparse.ArgumentParser(
         description="Run adversarial gauntlet on a specification"
@@ -73,6 +166,11 @@ def main():
         action="store_true",
         help="Output as JSON",
     )
+    parser.add_argument(
+        "--json-compact",
+        action="store_true",
+        help="Output as unindented JSON (implies --json)",
+    )
     parser.add_argument(
         "--list-adversaries",
         action="store_true",
@@ -127,6 +225,23 @@ def main():
         action="store_true",
         help="Resume from checkpoint files if available (no-op if no valid checkpoint)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk model response cache even when ASPEC_CACHE=1 is set",
+    )
+    parser.add_argument(
+        "--concurrency",
+        action="append",
+        default=[],
+        metavar="PROVIDER=N",
+        help=(
+            "Cap in-flight calls to one provider (e.g. gemini-cli=4 or "
+            "codex/gpt-5.5=2, which caps all of codex). PROVIDER is one of: "
+            f"{', '.join(PROVIDER_KEYS)}. Repeatable. Default: 16 per provider, "
+            "or GAUNTLET_CONCURRENCY_<PROVIDER> when set."
+        ),
+    )
     parser.add_argument(
         "--eval-tier-strategy",
         default="power_law_length",
@@ -150,6 +265,25 @@ def main():
             "batching with --eval-flat-batch-size. Default: 30."
         ),
     )
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help=(
+            "Run Phase 4 for OpenAI eval models through the provider batch API "
+            "(about half the token cost; jobs can take hours). Other providers "
+            "and single-model evaluation stay on live calls. For CI/nightly runs."
+        ),
+    )
+    parser.add_argument(
+        "--eval-cascade",
+        metavar="MODEL",
+        default=None,
+        help=(
+            "Cascade Phase 4: MODEL (a cheap/fast one) evaluates every concern "
+            "first, and only verdicts it reports with confidence below 0.8 go to "
+            "the multi-model ensemble. Default: every concern goes to the ensemble."
+        ),
+    )
     parser.add_argument(
         "--eval-flat-batch-size",
         type=int,
@@ -162,40 +296,48 @@ def main():
 
     args = parser.parse_args()
 
+    if args.no_cache:
+        from gauntlet.response_cache import disable_response_cache
+
+        disable_response_cache()
+
+    if args.concurrency:
+        from gauntlet.model_dispatch import bulkhead
+
+        for entry in args.concurrency:
+            target, sep, value = entry.rpartition("=")
+            if not sep or not target or not value.isdigit() or int(value) < 1:
+                parser.error(f"--concurrency expects PROVIDER=N with N >= 1, got {entry!r}")
+            try:
+                bulkhead.set_limit(target, int(value))
+            except ValueError as e:
+                parser.error(f"--concurrency: {e}")
+
     if args.stats:
-        print(get_adversary_leaderboard())
+        _print_stats()
         return
 
     if args.list_runs is not None:
-        print(list_gauntlet_runs(args.list_runs))
+        _print_runs(args.list_runs)
         return
 
     if args.show_run:
-        run_data = load_gauntlet_run(args.show_run)
-        if run_data:
-            print(json.dumps(run_data, indent=2))
-        else:
-            print(f"Run not found: {args.show_run}", file=sys.stderr)
-            sys.exit(1)
+        _show_run(args.show_run)
         return
 
     if args.list_adversaries:
-        print("Available adversaries:\n")
-        for name, adversary in ADVERSARIES.items():
-            first_line = adversary.persona.strip().split("\n")[0][:60]
-            print(f"  {name:20} {first_line}...")
+        _print_adversaries()
         return
 
     # Read spec from file or stdin
     if args.spec_file:
         try:
-            with open(args.spec_file, "r") as f:
-                spec = f.read().strip()
+            spec = _read_spec_file(args.spec_file)
         except FileNotFoundError:
             print(f"Error: Spec file not found: {args.spec_file}", file=sys.stderr)
             sys.exit(1)
     else:
-        spec = sys.stdin.read().strip()
+        spec = _read_spec_stdin()
 
     if not spec:
         print("Error: No spec provided", file=sys.stderr)
@@ -229,33 +371,33 @@ def main():
                 else Path(".adversarial-spec/pre_gauntlet_report.json")
             )
             save_report(pre_result, report_path)
-            print(f"Pre-gauntlet report saved: {report_path}", file=sys.stderr)
 
-            # Print summary
-            print(f"Status: {pre_result.status.value}", file=sys.stderr)
-            print(
+            # Emit the summary block with one write instead of a print per line
+            summary = io.StringIO()
+            summary.write(f"Pre-gauntlet report saved: {report_path}\n")
+            summary.write(f"Status: {pre_result.status.value}\n")
+            summary.write(
                 f"Concerns: {len(pre_result.concerns)} "
-                f"({len(pre_result.get_blockers())} blockers)",
-                file=sys.stderr,
+                f"({len(pre_result.get_blockers())} blockers)\n"
             )
-            print(
+            summary.write(
                 f"Timings: git={pre_result.timings.git_ms}ms, "
                 f"build={pre_result.timings.build_ms}ms, "
-                f"total={pre_result.timings.total_ms}ms",
-                file=sys.stderr,
+                f"total={pre_result.timings.total_ms}ms\n"
             )
 
             # Check if we should proceed
             if pre_result.status != PreGauntletStatus.COMPLETE:
-                print(
-                    "\nPre-gauntlet did not complete successfully. Exiting.",
-                    file=sys.stderr,
-                )
+                summary.write("\nPre-gauntlet did not complete successfully. Exiting.\n")
+                sys.stderr.write(summary.getvalue())
+                sys.stderr.flush()
                 sys.exit(get_exit_code(pre_result.status))
 
             # Use the context-enriched spec for gauntlet
             spec = pre_result.context_markdown
-            print("\nProceeding to adversarial gauntlet...\n", file=sys.stderr)
+            summary.write("\nProceeding to adversarial gauntlet...\n\n")
+            sys.stderr.write(summary.getvalue())
+            sys.stderr.flush()
 
         except ImportError as e:
             print(
@@ -293,10 +435,12 @@ def main():
         eval_tier_strategy=args.eval_tier_strategy,
         eval_flat_batch_size=args.eval_flat_batch_size,
         eval_tier_min_concerns=args.eval_tier_min_concerns,
+        batch_api=args.batch_api,
+        eval_cascade_model=args.eval_cascade,
     )
 
     # Output
-    if args.json:
+    if args.json or args.json_compact:
         output = {
             "concerns": [
                 {
@@ -341,7 +485,7 @@ def main():
                 }
                 for c in result.clustered_concerns
             ]
-        print(json.dumps(output, indent=2))
+        _write_json(output, indent=not args.json_compact)
     else:
         print()
         print(format_gauntlet_report(result))
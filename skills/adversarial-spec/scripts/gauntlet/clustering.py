@@ -71,6 +71,33 @@ def _jaccard(a: set[str], b: set[str]) -> float:
     return inter / len(a | b)
 
 
+def _normalize_text(text: str) -> str:
+    """Lowercase, strip markdown noise and collapse whitespace for exact matching."""
+    cleaned = _MARKDOWN_NOISE.sub(" ", text.lower())
+    return " ".join(cleaned.rstrip().rstrip(".!;:").split())
+
+
+def merge_exact_duplicates(
+    concerns: list[Concern],
+) -> tuple[list[Concern], dict[str, list[Concern]]]:
+    """Collapse concerns whose normalized text is identical.
+
+    Unlike cluster_concerns this crosses adversary boundaries: two lenses
+    producing the same sentence carry no extra signal, and the member map
+    keeps every originating adversary for attribution. It is one dict pass,
+    so it runs on every gauntlet, not only above CLUSTERING_AUTO_THRESHOLD.
+
+    Returns:
+        (representatives, members) in the same shape as cluster_concerns; the
+        first occurrence of each text is its representative.
+    """
+    groups: dict[str, list[Concern]] = {}
+    for c in concerns:
+        groups.setdefault(_normalize_text(c.text), []).append(c)
+    representatives = [members[0] for members in groups.values()]
+    return representatives, {members[0].id: members for members in groups.values()}
+
+
 def _pick_representative(members: list[Concern]) -> Concern:
     """Per cluster, pick the concern with the longest text as the representative.
 
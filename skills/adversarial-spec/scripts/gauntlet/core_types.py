@@ -7,9 +7,11 @@ gauntlet modules.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from functools import cached_property
+from typing import Any, Optional
 
 from adversaries import ADVERSARIES, generate_concern_id
 
@@ -74,12 +76,26 @@ def normalize_verdict(raw: str) -> str:
     return _VERDICT_NORMALIZE.get(raw.lower().strip(), "deferred")
 
 
+VERDICTS: tuple[str, ...] = ("dismissed", "accepted", "acknowledged", "deferred")
+
+
+def bucket_by_verdict(evaluations: list[Evaluation]) -> dict[str, list[Evaluation]]:
+    """Partition evaluations by verdict in a single pass.
+
+    Every canonical verdict key is present, even when its bucket is empty.
+    """
+    buckets: dict[str, list[Evaluation]] = {v: [] for v in VERDICTS}
+    for e in evaluations:
+        buckets.setdefault(e.verdict, []).append(e)
+    return buckets
+
+
 # =============================================================================
 # CORE DATACLASSES
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Concern:
     """A concern raised by an adversary."""
 
@@ -90,12 +106,18 @@ class Concern:
     source_model: str = ""  # Which attack model generated this concern
 
     def __post_init__(self):
-        """Generate ID if not provided."""
+        """Intern the repeated label fields and generate ID if not provided."""
+        # Thousands of concerns share a handful of adversary/severity/model
+        # labels; interning keeps one string object per label. Persisted
+        # concerns may carry null labels, which fall back to the defaults.
+        self.adversary = sys.intern(self.adversary)
+        self.severity = sys.intern("medium" if self.severity is None else self.severity)
+        self.source_model = sys.intern(self.source_model or "")
         if not self.id:
             self.id = generate_concern_id(self.adversary, self.text)
 
 
-@dataclass
+@dataclass(slots=True)
 class Evaluation:
     """Frontier model's evaluation of a concern."""
 
@@ -103,6 +125,8 @@ class Evaluation:
     verdict: str  # dismissed, accepted, acknowledged, deferred
     reasoning: str
     severity: str = ""  # high, medium, low — assigned by eval model, not attack model
+    votes: dict[str, int] = field(default_factory=dict)  # verdict -> model count (multi-model eval)
+    confidence: Optional[float] = None  # model's self-reported 0-1 certainty, when given
 
     def __post_init__(self):
         self.verdict = normalize_verdict(self.verdict)
@@ -110,7 +134,7 @@ class Evaluation:
             self.severity = self.concern.severity  # fallback to attack-assigned
 
 
-@dataclass
+@dataclass(slots=True)
 class Rebuttal:
     """Adversary's response to a dismissal."""
 
@@ -228,6 +252,14 @@ class FinalBossResult:
         return self.verdict == FinalBossVerdict.PASS
 
 
+# Severity buckets in the per-adversary rebuttal stats; anything else counts
+# as medium.
+_REBUTTAL_SEVERITIES = ("high", "medium", "low")
+
+# GauntletResult fields the cached verdict buckets and adversary stats read.
+_CACHED_VIEW_INPUTS = frozenset({"concerns", "evaluations", "rebuttals", "clustered_evaluations"})
+
+
 @dataclass
 class GauntletResult:
     """Complete result of running the gauntlet."""
@@ -251,40 +283,95 @@ class GauntletResult:
     cluster_members: Optional[dict[str, list[Concern]]] = None  # representative concern id -> member concerns
     concerns_path: Optional[str] = None  # Path to saved concerns JSON
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # verdict_buckets and the adversary stats are cached on first use;
+        # reassigning one of their inputs drops both (in-place list edits are
+        # not tracked).
+        super().__setattr__(name, value)
+        if name in _CACHED_VIEW_INPUTS:
+            self.__dict__.pop("verdict_buckets", None)
+            self.__dict__.pop("_adversary_stats", None)
+
+    @cached_property
+    def verdict_buckets(self) -> dict[str, list[Evaluation]]:
+        """Phase 4 evaluations (clustered if available) grouped by verdict."""
+        phase4_evals = (
+            self.clustered_evaluations
+            if self.clustered_evaluations is not None
+            else self.evaluations
+        )
+        return bucket_by_verdict(phase4_evals)
+
     def get_adversary_stats(self) -> dict[str, dict]:
         """Get per-adversary statistics from this run.
 
         Includes cost-weighted metrics:
         - dismissal_effort: average characters in dismissal reasoning (proxy for effort)
         - signal_score: acceptance_rate * avg_dismissal_effort (higher = better signal:noise)
-        """
-        stats: dict[str, dict] = {}
 
-        for adv in ADVERSARIES.keys():
-            adv_concerns = [c for c in self.concerns if c.adversary == adv]
-            adv_evals = [e for e in self.evaluations if e.concern.adversary == adv]
-            adv_rebuttals = [r for r in self.rebuttals if r.evaluation.concern.adversary == adv]
+        Computed once per result (stats persistence and to_dict both need it).
+        """
+        return self._adversary_stats
 
-            accepted = len([e for e in adv_evals if e.verdict == "accepted"])
-            acknowledged = len([e for e in adv_evals if e.verdict == "acknowledged"])
-            dismissed = len([e for e in adv_evals if e.verdict == "dismissed"])
-            deferred = len([e for e in adv_evals if e.verdict == "deferred"])
-            rebuttals_won = len([r for r in adv_rebuttals if r.sustained])
-            rebuttals_lost = len([r for r in adv_rebuttals if not r.sustained])
+    @cached_property
+    def _adversary_stats(self) -> dict[str, dict]:
+        stats: dict[str, dict] = {}
 
-            total = len(adv_concerns)
+        # One pass over each collection, accumulating per-adversary counters.
+        counts: dict[str, dict[str, int]] = {
+            adv: {
+                "concerns": 0, "concern_chars": 0,
+                "accepted": 0, "acknowledged": 0, "dismissed": 0, "deferred": 0,
+                "dismissal_chars": 0, "won": 0, "lost": 0,
+            }
+            for adv in ADVERSARIES
+        }
+        # Rebuttal outcomes keyed flat by (adversary, severity, outcome): one
+        # lookup per rebuttal, and nested dicts are only built for the output.
+        severity_counts: dict[tuple[str, str, str], int] = {}
+
+        for c in self.concerns:
+            adv_counts = counts.get(c.adversary)
+            if adv_counts is not None:
+                adv_counts["concerns"] += 1
+                adv_counts["concern_chars"] += len(c.text)
+
+        for e in self.evaluations:
+            adv_counts = counts.get(e.concern.adversary)
+            if adv_counts is not None and e.verdict in adv_counts:
+                adv_counts[e.verdict] += 1
+                if e.verdict == "dismissed":
+                    adv_counts["dismissal_chars"] += len(e.reasoning)
+
+        for r in self.rebuttals:
+            adv = r.evaluation.concern.adversary
+            adv_counts = counts.get(adv)
+            if adv_counts is None:
+                continue
+            outcome = "won" if r.sustained else "lost"
+            adv_counts[outcome] += 1
+            severity = r.evaluation.concern.severity
+            if severity not in _REBUTTAL_SEVERITIES:
+                severity = "medium"
+            key = (adv, severity, outcome)
+            severity_counts[key] = severity_counts.get(key, 0) + 1
+
+        for adv, adv_counts in counts.items():
+            accepted = adv_counts["accepted"]
+            acknowledged = adv_counts["acknowledged"]
+            dismissed = adv_counts["dismissed"]
+            deferred = adv_counts["deferred"]
+            rebuttals_won = adv_counts["won"]
+            rebuttals_lost = adv_counts["lost"]
+
+            total = adv_counts["concerns"]
             # Valuable concerns = accepted + acknowledged (both credit the adversary)
             valuable = accepted + acknowledged
             acceptance_rate = valuable / total if total > 0 else 0.0
 
             # Cost-weighted metrics: how much effort to dismiss?
             # Longer dismissal reasoning = more expensive false positive
-            dismissed_evals = [e for e in adv_evals if e.verdict == "dismissed"]
-            dismissal_effort = (
-                sum(len(e.reasoning) for e in dismissed_evals) / len(dismissed_evals)
-                if dismissed_evals
-                else 0
-            )
+            dismissal_effort = adv_counts["dismissal_chars"] / dismissed if dismissed else 0
 
             # Signal score: accepted concerns are valuable, dismissed concerns cost effort
             # Higher is better: high acceptance + long dismissals (hard to disprove)
@@ -298,17 +385,16 @@ class GauntletResult:
                 signal_score = 0.0
 
             # Concern length stats
-            concern_lengths = [len(c.text) for c in adv_concerns]
-            avg_concern_length = sum(concern_lengths) / len(concern_lengths) if concern_lengths else 0
+            avg_concern_length = adv_counts["concern_chars"] / total if total else 0
 
             # Rebuttal success by severity
-            rebuttal_by_severity = {"high": {"won": 0, "lost": 0}, "medium": {"won": 0, "lost": 0}, "low": {"won": 0, "lost": 0}}
-            for r in adv_rebuttals:
-                severity = r.evaluation.concern.severity or "medium"
-                if r.sustained:
-                    rebuttal_by_severity[severity]["won"] += 1
-                else:
-                    rebuttal_by_severity[severity]["lost"] += 1
+            rebuttal_by_severity = {
+                severity: {
+                    "won": severity_counts.get((adv, severity, "won"), 0),
+                    "lost": severity_counts.get((adv, severity, "lost"), 0),
+                }
+                for severity in _REBUTTAL_SEVERITIES
+            }
 
             stats[adv] = {
                 "concerns_raised": total,
@@ -349,6 +435,10 @@ class GauntletResult:
             }
             if e.severity:
                 d["severity"] = e.severity
+            if e.votes:
+                d["votes"] = e.votes
+            if e.confidence is not None:
+                d["confidence"] = e.confidence
             return d
 
         def rebuttal_to_dict(r: Rebuttal) -> dict:
@@ -451,6 +541,13 @@ class GauntletConfig:
     # tiering's quality benefit only kicks in when there's enough material in
     # the easy tier to amortize the spec re-send cost.
     eval_tier_min_concerns: int = 30
+    # Send Phase 4 work for OpenAI eval models through the provider batch API
+    # (about half price, minutes-to-hours latency). For CI/nightly runs only.
+    batch_api: bool = False
+    # Cascade evaluation: this (cheap) model judges every concern first, and
+    # only verdicts it reports below CASCADE_CONFIDENCE_THRESHOLD go to the
+    # multi-model ensemble. None = every concern goes to the ensemble.
+    eval_cascade_model: Optional[str] = None
 
 
 class GauntletClusteringError(Exception):
@@ -467,6 +564,14 @@ class GauntletExecutionError(Exception):
     pass
 
 
+class FatalProviderError(Exception):
+    """Raised when a provider rejects a call permanently (bad key, no access, unknown model).
+
+    Retrying or issuing the remaining calls of a phase would fail the same way.
+    """
+    pass
+
+
 @dataclass
 class CheckpointMeta:
     """Metadata envelope for checkpoint files."""
@@ -0,0 +1,198 @@
+"""JSON helpers for the gauntlet pipeline.
+
+Uses orjson when it is installed (C-accelerated decode/encode) and falls back
+to the stdlib json module otherwise. Also hosts the extractors for JSON
+objects embedded in model responses.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, is_dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_DECODER = json.JSONDecoder()
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode JSON text. Raises ValueError (json.JSONDecodeError) on bad input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _default(obj: Any) -> Any:
+    """Fallback encoder for types neither backend handles natively."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, Path):
+        return str(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(data: Any, indent: bool = False) -> str:
+    """Encode data as a JSON string, optionally 2-space indented.
+
+    Dataclasses, enums and paths are encoded too (orjson handles dataclasses
+    natively; the stdlib path goes through _default).
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(data, default=_default, option=option).decode("utf-8")
+    return json.dumps(data, indent=2 if indent else None, default=_default)
+
+
+def dumpb(data: Any, indent: bool = False) -> bytes:
+    """Encode data as UTF-8 JSON bytes, ready for a binary stream.
+
+    orjson produces bytes directly, so this skips the str round trip that
+    dumps() + a text stream would do.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(data, default=_default, option=option)
+    return json.dumps(
+        data, indent=2 if indent else None, default=_default, ensure_ascii=False
+    ).encode("utf-8")
+
+
+def extract_first_json(text: str) -> Optional[str]:
+    """Return the first balanced {...} object in text, or None.
+
+    One pass over the string: braces are counted only outside JSON string
+    literals (honouring backslash escapes), so prose or trailing braces after
+    the object do not widen the span the way find("{")/rfind("}") does.
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+class ObjectEndDetector:
+    """Incrementally find where the first top-level JSON object closes.
+
+    Fed a streamed response chunk by chunk; uses the same string-aware brace
+    counting as extract_first_json. A balanced span only counts once it
+    decodes as JSON, so prose such as "fill in {concern_index}" ahead of the
+    real object is skipped rather than ending the stream.
+    """
+
+    __slots__ = ("depth", "in_string", "escaped", "started", "start", "offset", "_parts")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.started = False
+        self.start = 0  # offset of the current candidate's opening brace
+        self.offset = 0  # characters consumed so far
+        self._parts: list[str] = []
+
+    def _reset(self) -> None:
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.started = False
+
+    def _decodes(self) -> bool:
+        text = "".join(self._parts)
+        self._parts = [text]
+        try:
+            _DECODER.raw_decode(text, self.start)
+        except ValueError:
+            return False
+        return True
+
+    def feed(self, text: str) -> bool:
+        """Consume the next chunk; True once the first object is complete."""
+        base = self.offset
+        self._parts.append(text)
+        self.offset += len(text)
+        for i, ch in enumerate(text):
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == "\\":
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == "{":
+                if not self.started:
+                    self.start = base + i
+                self.depth += 1
+                self.started = True
+            elif not self.started:
+                continue
+            elif ch == '"':
+                self.in_string = True
+            elif ch == "}":
+                self.depth -= 1
+                if self.depth == 0:
+                    if self._decodes():
+                        return True
+                    self._reset()
+        return False
+
+
+def decode_first_object(text: str) -> Optional[dict]:
+    """Decode the first JSON object in text, or return None.
+
+    Tries each "{" in turn with the C raw_decode scanner, which stops at the
+    end of the object, so prose braces before the real payload are skipped
+    and trailing text is ignored.
+
+    JSON-mode replies are usually nothing but the object, so when the
+    stripped text is a single {...} it is handed straight to loads() (orjson
+    when installed) and the scan only runs if that fails.
+    """
+    stripped = text.strip()
+    if stripped.startswith("{") and stripped.endswith("}"):
+        try:
+            obj = loads(stripped)
+        except ValueError:
+            pass
+        else:
+            if isinstance(obj, dict):
+                return obj
+
+    start = text.find("{")
+    while start >= 0:
+        try:
+            obj, _ = _DECODER.raw_decode(text, start)
+            return obj
+        except ValueError:
+            start = text.find("{", start + 1)
+    return None
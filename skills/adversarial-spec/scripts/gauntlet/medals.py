@@ -8,14 +8,16 @@ from __future__ import annotations
 
 import json
 import re
+from collections import Counter
 from datetime import datetime
 
 from adversaries import get_version_manifest
+from gauntlet import json_utils
 from gauntlet.core_types import (
     GauntletResult,
     Medal,
 )
-from gauntlet.persistence import MEDALS_DIR, STATS_DIR
+from gauntlet.persistence import MEDALS_DIR, STATS_DIR, write_json_atomic
 
 # =============================================================================
 # CONCERN SIMILARITY
@@ -33,10 +35,12 @@ _STOPWORDS = {
     "any", "into", "out", "up", "down", "about", "above", "below", "between",
 }
 
+_KEYWORD_RE = re.compile(r"\b[a-z]{3,}\b")
+
 
 def _get_concern_keywords(text: str) -> set[str]:
     """Extract significant keywords from concern text for similarity detection."""
-    words = set(re.findall(r'\b[a-z]{3,}\b', text.lower()))
+    words = set(_KEYWORD_RE.findall(text.lower()))
     return words - _STOPWORDS
 
 
@@ -205,23 +209,24 @@ def save_medal_reports(medals: list[Medal]) -> str:
     filename = f"medals_{timestamp}_{run_id[:8]}.json"
     filepath = MEDALS_DIR / filename
 
+    type_counts = Counter(m.type for m in medals)
     data = {
         "timestamp": datetime.now().isoformat(),
         "run_id": run_id,
         "spec_hash": medals[0].spec_hash if medals else "",
         "medal_counts": {
-            "gold": len([m for m in medals if m.type == "gold"]),
-            "silver": len([m for m in medals if m.type == "silver"]),
-            "bronze": len([m for m in medals if m.type == "bronze"]),
+            "gold": type_counts["gold"],
+            "silver": type_counts["silver"],
+            "bronze": type_counts["bronze"],
         },
         "medals": [m.to_dict() for m in medals],
     }
 
-    filepath.write_text(json.dumps(data, indent=2))
+    write_json_atomic(filepath, data)
 
     medals_index = STATS_DIR / "medals_index.json"
     try:
-        index = json.loads(medals_index.read_text()) if medals_index.exists() else {"medals": []}
+        index = json_utils.loads(medals_index.read_bytes()) if medals_index.exists() else {"medals": []}
     except (json.JSONDecodeError, OSError):
         index = {"medals": []}
 
@@ -237,7 +242,7 @@ def save_medal_reports(medals: list[Medal]) -> str:
         })
 
     index["medals"] = index["medals"][-500:]
-    medals_index.write_text(json.dumps(index, indent=2))
+    write_json_atomic(medals_index, index, indent=None)
 
     return str(filepath)
 
@@ -298,7 +303,7 @@ def get_medal_leaderboard() -> str:
         return "No medals awarded yet.\n\nMedals are awarded for gauntlet runs with 6+ adversaries."
 
     try:
-        index = json.loads(medals_index.read_text())
+        index = json_utils.loads(medals_index.read_bytes())
     except (json.JSONDecodeError, OSError):
         return "Error reading medals index."
 
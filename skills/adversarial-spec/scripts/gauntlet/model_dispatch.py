@@ -6,15 +6,23 @@ limiting, and validation. No phase logic lives here.
 
 from __future__ import annotations
 
+import concurrent.futures
+import os
 import re
 import sys
-from typing import Optional
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Callable, Iterator, Optional
 
 import token_tracking
+from gauntlet import json_utils, response_cache
 from models import (
     call_claude_cli_model,
     call_codex_model,
     call_gemini_cli_model,
+    get_litellm_completion,
 )
 from providers import (
     CODEX_AVAILABLE,
@@ -22,14 +30,8 @@ from providers import (
     GEMINI_CLI_AVAILABLE,
 )
 
-try:
-    from litellm import completion
-except ImportError:
-    print(
-        "Error: litellm package not installed. Run: pip install litellm",
-        file=sys.stderr,
-    )
-    sys.exit(1)
+# Resolved lazily via models.get_litellm_completion() on the first API call.
+completion = None
 
 
 # =============================================================================
@@ -66,47 +68,221 @@ def call_model(
     timeout: int = 1800,
     codex_reasoning: str = DEFAULT_CODEX_REASONING,
     json_mode: bool = False,
+    stop_after_json: bool = False,
+    latency_optimized: bool = False,
+    cache_prefix: str = "",
 ) -> tuple[str, int, int]:
     """Call a model (CLI or API) and return response with token counts.
 
+    Every call is paced by the model's shared RateController: acquire()
+    blocks until the provider has budget, successes grow the rate, and
+    429/503 responses halve it and are retried after the provider's
+    retry-after hint. In-flight calls per provider are capped by the
+    shared bulkhead, whichever phase issues them.
+
+    Fast chat models are held to a per-model timeout cap (see timeout_for)
+    well under the run-wide timeout, and a call that hits the cap is retried
+    once instead of stalling its phase for the full budget.
+
+    With ASPEC_CACHE=1, identical requests are answered from the on-disk
+    response cache (see gauntlet.response_cache) without a provider call.
+
     Args:
         json_mode: Request JSON output via response_format (litellm path only).
             CLI models (codex/, gemini-cli/, claude-cli/) ignore this flag —
             use prompt-driven JSON requests for those.
+        stop_after_json: Stream the reply and stop reading once the first
+            top-level JSON object is complete (litellm path only), for callers
+            that parse nothing else. Token counts are then estimated locally.
+        latency_optimized: Ask the provider for its latency-optimized (pricier)
+            inference tier where one exists (see _latency_kwargs). Meant for
+            the single blocking call at the end of the run, not bulk phases.
+        cache_prefix: Leading part of user_message shared by many calls (e.g.
+            the spec), marked as a cache breakpoint for providers that only
+            cache at explicit markers (see _user_message). Does not change
+            the text sent.
 
     Returns:
         (response_text, input_tokens, output_tokens)
     """
     _validate_model_name(model)
 
-    if model.startswith("codex/"):
-        content, input_tokens, output_tokens = call_codex_model(
-            system_prompt=system_prompt,
-            user_message=user_message,
-            model=model,
-            reasoning_effort=codex_reasoning,
-            timeout=timeout,
+    cache_key = None
+    if response_cache.response_cache_enabled():
+        cache_key = response_cache.response_cache_key(
+            model, system_prompt, user_message, codex_reasoning, json_mode, stop_after_json,
         )
-        token_tracking.tracker.record_call(model, input_tokens, output_tokens)
-        return content, input_tokens, output_tokens
+        cached = response_cache.get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
+    call_timeout = timeout_for(model, timeout)
+    controller = get_rate_controller(model)
+    prompt_tokens = (len(system_prompt) + len(user_message)) // _CHARS_PER_TOKEN
+    attempt = 0
+    timeout_retries = 0
+    while True:
+        controller.acquire(prompt_tokens)
+        try:
+            with bulkhead.slot(model):
+                result = _dispatch_model_call(
+                    model, system_prompt, user_message, call_timeout, codex_reasoning,
+                    json_mode, stop_after_json, latency_optimized, cache_prefix,
+                )
+        except Exception as e:
+            # A timeout under a per-model cap is retried: the caller's own
+            # budget has not been spent, and a hung request rarely hangs twice.
+            if (
+                call_timeout < timeout
+                and _is_timeout_error(e)
+                and timeout_retries < TIMEOUT_MAX_RETRIES
+            ):
+                timeout_retries += 1
+                print(
+                    f"Warning: {model} timed out after {call_timeout}s, retrying",
+                    file=sys.stderr,
+                )
+                continue
+            if not _is_rate_limit_error(e) or attempt >= RATE_LIMIT_MAX_RETRIES:
+                raise
+            attempt += 1
+            controller.on_throttle(_retry_after_seconds(e))
+            continue
+        controller.on_success()
+        if cache_key is not None and result[0]:
+            response_cache.store_response(cache_key, result)
+        return result
+
+
+# Per-call timeout caps (seconds) for models that normally answer within
+# seconds; a hung request to one of these fails over to a retry instead of
+# holding a worker for the whole run-wide --timeout. Matched as substrings of
+# the lower-cased name, first match wins. CLI agents and reasoning/frontier
+# models are deliberately absent: their long calls are legitimate.
+_MODEL_TIMEOUT_CAPS: tuple[tuple[str, int], ...] = (
+    ("gpt-4o-mini", 120),
+    ("gpt-4o", 180),
+    ("groq/", 120),
+    ("deepseek-chat", 240),
+    ("flash", 240),
+)
+# Retries of a single call after it hits its per-model cap.
+TIMEOUT_MAX_RETRIES = 1
 
-    if model.startswith("gemini-cli/"):
-        content, input_tokens, output_tokens = call_gemini_cli_model(
-            system_prompt=system_prompt,
-            user_message=user_message,
-            model=model,
-            timeout=timeout,
-        )
-        token_tracking.tracker.record_call(model, input_tokens, output_tokens)
-        return content, input_tokens, output_tokens
 
-    if model.startswith("claude-cli/"):
-        content, input_tokens, output_tokens = call_claude_cli_model(
-            system_prompt=system_prompt,
-            user_message=user_message,
-            model=model,
-            timeout=timeout,
-        )
+@lru_cache(maxsize=256)
+def _timeout_cap(model: str) -> Optional[int]:
+    """Per-model timeout cap, or None for uncapped (CLI-routed) models."""
+    provider, sep, _ = model.partition("/")
+    if sep and provider in _CLI_ROUTES:
+        return None
+    model_lower = model.lower()
+    for pattern, cap in _MODEL_TIMEOUT_CAPS:
+        if pattern in model_lower:
+            return cap
+    return None
+
+
+def timeout_for(model: str, timeout: int) -> int:
+    """The timeout to use for one call: the caller's, tightened by the model's cap."""
+    cap = _timeout_cap(model)
+    return timeout if cap is None else min(timeout, cap)
+
+
+# litellm providers that only cache prompts at explicit cache_control
+# breakpoints. OpenAI, DeepSeek and Gemini cache shared prefixes on their own,
+# so for them the prompt layout (stable system prompt, spec first in the user
+# message) is what matters.
+_EXPLICIT_CACHE_PREFIXES = ("claude-", "anthropic/")
+
+
+def _system_message(model: str, system_prompt: str) -> dict:
+    """Build the system message, marking it cacheable where the provider needs it."""
+    if model.startswith(_EXPLICIT_CACHE_PREFIXES):
+        return {
+            "role": "system",
+            "content": [{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }],
+        }
+    return {"role": "system", "content": system_prompt}
+
+
+def _user_message(model: str, user_message: str, cache_prefix: str) -> dict:
+    """Build the user message, with a cache breakpoint after cache_prefix.
+
+    The system prompt breakpoint alone leaves the spec, which follows it in
+    the user message, uncached on explicit-cache providers; splitting the
+    message at the shared prefix lets every batch after the first read the
+    system prompt and spec from cache.
+    """
+    if (
+        cache_prefix
+        and model.startswith(_EXPLICIT_CACHE_PREFIXES)
+        and len(user_message) > len(cache_prefix)
+        and user_message.startswith(cache_prefix)
+    ):
+        return {
+            "role": "user",
+            "content": [
+                {
+                    "type": "text",
+                    "text": cache_prefix,
+                    "cache_control": {"type": "ephemeral"},
+                },
+                {"type": "text", "text": user_message[len(cache_prefix):]},
+            ],
+        }
+    return {"role": "user", "content": user_message}
+
+
+def _latency_kwargs(model: str) -> dict:
+    """Extra completion kwargs selecting the provider's latency-optimized tier.
+
+    Only Bedrock exposes one (performanceConfig, roughly double the output
+    speed for Claude at a premium); other providers get the default tier.
+    """
+    if model.startswith("bedrock/"):
+        return {"performanceConfig": {"latency": "optimized"}}
+    return {}
+
+
+# CLI-routed models, keyed by the provider part of the name ("codex/gpt-5.5"
+# -> "codex"): (handler, whether it takes codex_reasoning).
+_CLI_ROUTES: dict[str, tuple[Callable[..., tuple[str, int, int]], bool]] = {
+    "codex": (call_codex_model, True),
+    "gemini-cli": (call_gemini_cli_model, False),
+    "claude-cli": (call_claude_cli_model, False),
+}
+
+
+def _dispatch_model_call(
+    model: str,
+    system_prompt: str,
+    user_message: str,
+    timeout: int,
+    codex_reasoning: str,
+    json_mode: bool,
+    stop_after_json: bool = False,
+    latency_optimized: bool = False,
+    cache_prefix: str = "",
+) -> tuple[str, int, int]:
+    """Route a single model call to the CLI handler or litellm."""
+    provider, sep, _ = model.partition("/")
+    cli_route = _CLI_ROUTES.get(provider) if sep else None
+    if cli_route is not None:
+        handler, takes_reasoning = cli_route
+        handler_kwargs = {
+            "system_prompt": system_prompt,
+            "user_message": user_message,
+            "model": model,
+            "timeout": timeout,
+        }
+        if takes_reasoning:
+            handler_kwargs["reasoning_effort"] = codex_reasoning
+        content, input_tokens, output_tokens = handler(**handler_kwargs)
         token_tracking.tracker.record_call(model, input_tokens, output_tokens)
         return content, input_tokens, output_tokens
 
@@ -114,16 +290,29 @@ def call_model(
     kwargs: dict = {
         "model": model,
         "messages": [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_message},
+            _system_message(model, system_prompt),
+            _user_message(model, user_message, cache_prefix),
         ],
         "temperature": 0.7,
         "timeout": timeout,
     }
     if json_mode:
         kwargs["response_format"] = {"type": "json_object"}
+    if latency_optimized:
+        kwargs.update(_latency_kwargs(model))
+
+    if stop_after_json:
+        streamed = _stream_until_json_end(kwargs)
+        if streamed is not None:
+            content, input_tokens, output_tokens = streamed
+            token_tracking.tracker.record_call(model, input_tokens, output_tokens)
+            return content, input_tokens, output_tokens
+        print(
+            f"Warning: {model} stream stopped without decodable JSON, retrying in full",
+            file=sys.stderr,
+        )
 
-    response = completion(**kwargs)
+    response = (completion or get_litellm_completion())(**kwargs)
     content = response.choices[0].message.content
     input_tokens = response.usage.prompt_tokens if response.usage else 0
     output_tokens = response.usage.completion_tokens if response.usage else 0
@@ -132,6 +321,51 @@ def call_model(
     return content, input_tokens, output_tokens
 
 
+def _stream_until_json_end(kwargs: dict) -> Optional[tuple[str, int, int]]:
+    """Stream a litellm completion, stopping once the first JSON object closes.
+
+    Usage arrives in the final chunk, so a stream cut short has none; token
+    counts then come from litellm's local tokenizer.
+
+    Returns None if the stream was cut short but the text read so far holds
+    no decodable object, so the caller can re-request the full reply rather
+    than parse a truncated one.
+    """
+    stream = (completion or get_litellm_completion())(
+        **kwargs, stream=True, stream_options={"include_usage": True}
+    )
+    detector = json_utils.ObjectEndDetector()
+    parts: list[str] = []
+    usage = None
+    stopped = False
+    for chunk in stream:
+        usage = getattr(chunk, "usage", None) or usage
+        text = chunk.choices[0].delta.content if chunk.choices else None
+        if text:
+            parts.append(text)
+            if detector.feed(text):
+                stopped = True
+                break
+    if stopped:
+        close = getattr(stream, "close", None)
+        if close is not None:
+            close()
+    content = "".join(parts)
+    if stopped and json_utils.decode_first_object(content) is None:
+        return None
+
+    if usage:
+        return content, usage.prompt_tokens, usage.completion_tokens
+    import litellm
+
+    model = kwargs["model"]
+    return (
+        content,
+        litellm.token_counter(model=model, messages=kwargs["messages"]),
+        litellm.token_counter(model=model, text=content),
+    )
+
+
 # =============================================================================
 # MODEL SELECTION (FREE-FIRST)
 # =============================================================================
@@ -142,8 +376,6 @@ _FALLBACK_CODEX_EVAL_MODEL = "codex/gpt-5.3-codex"
 
 def running_in_claude_code() -> bool:
     """Detect if we're running inside Claude Code environment."""
-    import os
-
     return bool(
         os.environ.get("CLAUDE_CODE")
         or os.environ.get("CC_WORKSPACE")
@@ -153,8 +385,6 @@ def running_in_claude_code() -> bool:
 
 def _get_unavailable_models() -> set[str]:
     """Return models explicitly marked unavailable for the current environment."""
-    import os
-
     raw = os.environ.get("ADVERSARIAL_SPEC_UNAVAILABLE_MODELS", "")
     return {model.strip() for model in raw.split(",") if model.strip()}
 
@@ -188,8 +418,6 @@ def select_adversary_model() -> str:
     if GEMINI_CLI_AVAILABLE:
         return "gemini-cli/gemini-3-flash-preview"
 
-    import os
-
     if os.environ.get("GROQ_API_KEY"):
         return "groq/llama-3.3-70b-versatile"
     if os.environ.get("DEEPSEEK_API_KEY"):
@@ -215,8 +443,6 @@ def select_eval_model() -> str:
     if GEMINI_CLI_AVAILABLE:
         return "gemini-cli/gemini-3.1-pro-preview"
 
-    import os
-
     if os.environ.get("ANTHROPIC_API_KEY"):
         return "claude-opus-4-7"
     if os.environ.get("GEMINI_API_KEY"):
@@ -247,8 +473,6 @@ def get_available_eval_models() -> list[str]:
     Returns up to 3 models for multi-model consensus evaluation.
     Prefers free CLI tools over paid APIs.
     """
-    import os
-
     models = []
 
     codex_model = _select_codex_eval_model()
@@ -271,6 +495,42 @@ def get_available_eval_models() -> list[str]:
 # =============================================================================
 
 
+# (batch_size, delay_seconds) per provider tier.
+_GEMINI_PAID_LIMIT = (10, 2)
+_GEMINI_FREE_LIMIT = (1, 15)
+_CLAUDE_PAID_LIMIT = (20, 1)
+_CLAUDE_FREE_LIMIT = (5, 5)
+_OPENAI_LIMIT = (10, 2)
+_DEFAULT_LIMIT = (3, 10)
+
+
+# (paid-tier env var or None, paid limit, default limit)
+_RateFamily = tuple[Optional[str], tuple[int, int], tuple[int, int]]
+
+# (name substrings, *_RateFamily), first match wins.
+_RATE_LIMIT_FAMILIES: tuple[tuple, ...] = (
+    (("gemini",), "GEMINI_PAID_TIER", _GEMINI_PAID_LIMIT, _GEMINI_FREE_LIMIT),
+    (("claude", "anthropic"), "CLAUDE_PAID_TIER", _CLAUDE_PAID_LIMIT, _CLAUDE_FREE_LIMIT),
+    (("codex", "gpt", "openai"), None, _OPENAI_LIMIT, _OPENAI_LIMIT),
+)
+
+
+def _env_flag(name: str) -> bool:
+    """True if the env var is set to 'true' (case-insensitive)."""
+    value = os.environ.get(name)
+    return value is not None and value.lower() == "true"
+
+
+@lru_cache(maxsize=256)
+def _rate_limit_family(model_name: str) -> Optional[_RateFamily]:
+    """Classify a model into its rate-limit family; memoized per model name."""
+    model_lower = model_name.lower()
+    for substrings, paid_flag, paid_limit, limit in _RATE_LIMIT_FAMILIES:
+        if any(sub in model_lower for sub in substrings):
+            return paid_flag, paid_limit, limit
+    return None
+
+
 def get_rate_limit_config(model_name: str) -> tuple[int, int]:
     """Return (batch_size, delay_seconds) for the given model.
 
@@ -278,26 +538,324 @@ def get_rate_limit_config(model_name: str) -> tuple[int, int]:
       Gemini: 5-15 RPM (free), 150+ RPM (paid) - set GEMINI_PAID_TIER=true
       Claude: 50 RPM (Tier 1), 2000+ (Tier 3+) - set CLAUDE_PAID_TIER=true
       Codex: message quotas, generally generous
+
+    The model's family is classified once per name; the tier env vars are
+    still read per call (a dict lookup) so they can be toggled at runtime.
     """
-    import os
+    family = _rate_limit_family(model_name)
+    if family is None:
+        return _DEFAULT_LIMIT
+    paid_flag, paid_limit, limit = family
+    return paid_limit if paid_flag and _env_flag(paid_flag) else limit
 
-    model_lower = model_name.lower()
-    if "gemini" in model_lower:
-        paid = os.environ.get("GEMINI_PAID_TIER", "").lower() == "true"
-        return (10, 2) if paid else (1, 15)
-    elif "claude" in model_lower or "anthropic" in model_lower:
-        paid = os.environ.get("CLAUDE_PAID_TIER", "").lower() == "true"
-        return (20, 1) if paid else (5, 5)
-    elif "codex" in model_lower or "gpt" in model_lower or "openai" in model_lower:
-        return (10, 2)
-    else:
-        return (3, 10)
+
+# Additive increase per successful call (requests/minute).
+RATE_ADDITIVE_INCREASE = 2.0
+# Multiplicative decrease applied on 429/503.
+RATE_DECREASE_FACTOR = 0.5
+# The rate may grow to this multiple of the static starting rate.
+RATE_CEILING_FACTOR = 4.0
+RATE_FLOOR_RPM = 1.0
+# Retries of a single call after a 429/503 before the error propagates.
+RATE_LIMIT_MAX_RETRIES = 2
+
+# Rough prompt size for token budgeting; providers count ~4 chars per token.
+_CHARS_PER_TOKEN = 4
+
+
+# Environment prefixes of the per-provider limits (GAUNTLET_RPM_GEMINI, ...).
+_PROVIDER_ENV_PREFIXES = ("GAUNTLET_CONCURRENCY", "GAUNTLET_RPM", "GAUNTLET_TPM")
+
+
+def _provider_env_key(provider: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]", "_", provider).upper()
+
+
+def _provider_env_limit(prefix: str, model: str) -> Optional[float]:
+    """Read a per-provider limit such as GAUNTLET_RPM_GEMINI_CLI, if set."""
+    key = _provider_env_key(_get_model_provider(model))
+    try:
+        value = float(os.environ.get(f"{prefix}_{key}", ""))
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+def check_provider_env_limits() -> None:
+    """Reject per-provider limit variables that name no known provider.
+
+    GAUNTLET_CONCURRENCY_OPENAI would otherwise cap nothing: limits are
+    looked up by PROVIDER_KEYS, and gpt-* models group under "gpt".
+    """
+    known = {_provider_env_key(key) for key in PROVIDER_KEYS}
+    unknown = sorted(
+        name
+        for name in os.environ
+        for prefix in _PROVIDER_ENV_PREFIXES
+        if name.startswith(f"{prefix}_") and name[len(prefix) + 1:] not in known
+    )
+    if unknown:
+        raise ValueError(
+            f"Unknown provider in {', '.join(unknown)}; "
+            f"expected one of: {', '.join(_provider_env_key(k) for k in PROVIDER_KEYS)}"
+        )
+
+
+_RATE_LIMIT_ERROR_NAMES = frozenset({"RateLimitError", "ServiceUnavailableError"})
+_RATE_LIMIT_STATUS_CODES = frozenset({429, 503})
+
+
+class RateController:
+    """AIMD rate control for one provider.
+
+    Starts at the static get_rate_limit_config() rate (batch_size calls per
+    delay window) and converges toward the provider's real cap: each success
+    adds RATE_ADDITIVE_INCREASE RPM up to the ceiling, each 429/503 halves
+    the rate and sleeps for the provider's retry-after. acquire() is a token
+    bucket holding up to batch_size calls, so bursts match the old batching.
+
+    When the account's limits are known they can be set per provider:
+    GAUNTLET_RPM_<PROVIDER> (e.g. GAUNTLET_RPM_GEMINI=60) starts the rate at
+    that RPM and caps it there instead of probing upward, and
+    GAUNTLET_TPM_<PROVIDER> adds a second bucket of prompt tokens per minute.
+    """
+
+    def __init__(self, model: str):
+        self.model = model
+        batch_size, delay = get_rate_limit_config(model)
+        rpm = _provider_env_limit("GAUNTLET_RPM", model)
+        if rpm is not None:
+            self.initial_rate = self.ceiling = rpm
+        else:
+            self.initial_rate = batch_size * 60.0 / max(delay, 1)
+            self.ceiling = self.initial_rate * RATE_CEILING_FACTOR
+        self.current_rate = self.initial_rate
+        self.capacity = float(max(batch_size, 1))
+        self.default_backoff = float(delay)
+        self._tokens = self.capacity
+        # Prompt-token budget (None = unlimited); holds one minute's worth.
+        self.tpm = _provider_env_limit("GAUNTLET_TPM", model)
+        self._prompt_tokens = self.tpm or 0.0
+        self._last_refill = time.monotonic()
+        self._logged_rate = self.current_rate
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.current_rate / 60.0)
+        if self.tpm is not None:
+            self._prompt_tokens = min(self.tpm, self._prompt_tokens + elapsed * self.tpm / 60.0)
+
+    def acquire(self, prompt_tokens: int = 0) -> None:
+        """Block until a call slot (and its prompt tokens) are available, then consume them."""
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                # A prompt larger than the whole budget waits for a full bucket.
+                needed = min(prompt_tokens, self.tpm) if self.tpm is not None else 0.0
+                if self._tokens >= 1.0 and self._prompt_tokens >= needed:
+                    self._tokens -= 1.0
+                    self._prompt_tokens -= needed
+                    return
+                wait = max(
+                    (1.0 - self._tokens) * 60.0 / self.current_rate,
+                    (needed - self._prompt_tokens) * 60.0 / self.tpm if needed else 0.0,
+                )
+            time.sleep(wait)
+
+    def on_success(self) -> None:
+        """Additive increase after a successful call."""
+        with self._lock:
+            self.current_rate = min(self.ceiling, self.current_rate + RATE_ADDITIVE_INCREASE)
+            # Only log meaningful growth; one line per success would flood stderr.
+            if self.current_rate >= self._logged_rate * 1.25 or (
+                self.current_rate == self.ceiling and self._logged_rate < self.ceiling
+            ):
+                self._log_change("raised")
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """Multiplicative decrease after a 429/503, then back off."""
+        with self._lock:
+            self.current_rate = max(RATE_FLOOR_RPM, self.current_rate * RATE_DECREASE_FACTOR)
+            self._tokens = 0.0
+            self._log_change("lowered")
+        wait = retry_after if retry_after is not None else self.default_backoff
+        time.sleep(wait)
+
+    def _log_change(self, direction: str) -> None:
+        self._logged_rate = self.current_rate
+        print(
+            f"  Rate limit: {self.model} {direction} to {self.current_rate:.1f} RPM",
+            file=sys.stderr,
+        )
+
+
+_rate_controllers: dict[str, RateController] = {}
+_rate_controllers_lock = threading.Lock()
+
+
+def get_rate_controller(model: str) -> RateController:
+    """Return the shared RateController for the model's provider."""
+    key = _get_model_provider(model)
+    with _rate_controllers_lock:
+        controller = _rate_controllers.get(key)
+        if controller is None:
+            controller = RateController(model)
+            _rate_controllers[key] = controller
+        return controller
+
+
+# Max in-flight calls per provider across all phases. Override for every
+# provider with GAUNTLET_PROVIDER_CONCURRENCY, for one provider with
+# GAUNTLET_CONCURRENCY_<PROVIDER> (e.g. GAUNTLET_CONCURRENCY_GEMINI_CLI=4), or
+# with --concurrency PROVIDER=N. PROVIDER is one of PROVIDER_KEYS.
+DEFAULT_PROVIDER_CONCURRENCY = 16
+
+
+class Bulkhead:
+    """Per-provider concurrency caps shared by every gauntlet phase.
+
+    Every phase fans out on shared_executor, and all model calls pass
+    through one semaphore per provider, so overlapping phases cannot exceed
+    the provider's concurrency budget. The pool size only bounds threads;
+    a provider's cap is what keeps a burst of adversaries on one backend
+    from tripping its rate limits.
+    """
+
+    def __init__(self, limit: Optional[int] = None):
+        if limit is None:
+            try:
+                limit = int(os.environ.get("GAUNTLET_PROVIDER_CONCURRENCY", ""))
+            except ValueError:
+                limit = DEFAULT_PROVIDER_CONCURRENCY
+        self.limit = max(1, limit)
+        self._overrides: dict[str, int] = {}
+        self._sems: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def set_limit(self, model: str, limit: int) -> None:
+        """Cap the provider of model (or a bare provider key) at limit calls.
+
+        Calls already holding a slot finish on the old semaphore; new calls
+        use the new cap. Raises ValueError unless model resolves to one of
+        PROVIDER_KEYS; any other key would cap nothing.
+        """
+        key = _get_model_provider(model)
+        if key not in PROVIDER_KEYS:
+            raise ValueError(
+                f"Unknown provider {model!r}; expected one of: {', '.join(PROVIDER_KEYS)}"
+            )
+        with self._lock:
+            self._overrides[key] = max(1, limit)
+            self._sems.pop(key, None)
+
+    def limit_for(self, model: str) -> int:
+        """Concurrency cap for the model's provider."""
+        key = _get_model_provider(model)
+        if key in self._overrides:
+            return self._overrides[key]
+        env_limit = _provider_env_limit("GAUNTLET_CONCURRENCY", model)
+        return max(1, int(env_limit)) if env_limit else self.limit
+
+    def acquire(self, model: str) -> threading.BoundedSemaphore:
+        """Return the semaphore guarding the model's provider."""
+        key = _get_model_provider(model)
+        with self._lock:
+            sem = self._sems.get(key)
+            if sem is None:
+                sem = threading.BoundedSemaphore(self.limit_for(model))
+                self._sems[key] = sem
+            return sem
+
+    @contextmanager
+    def slot(self, model: str) -> Iterator[None]:
+        """Hold one of the provider's concurrency slots for the block."""
+        with self.acquire(model):
+            yield
+
+
+bulkhead = Bulkhead()
+
+
+# Worker threads shared by every phase's fan-out, so they are started once per
+# run rather than once per phase or batch. In-flight calls are capped per
+# provider by the bulkhead; the pool size only bounds total threads. Tasks
+# submitted here must never block on other tasks in the same pool. Override
+# with GAUNTLET_POOL_SIZE.
+#
+# Threads rather than an event loop: the CLI providers are blocking
+# subprocess.run calls and call_model is synchronous end to end, so an async
+# layer would still park one thread per call. Idle workers are reused, and
+# the threads spend their time blocked in I/O with the GIL released.
+DEFAULT_POOL_SIZE = 64
+
+
+def _pool_size() -> int:
+    try:
+        return max(1, int(os.environ.get("GAUNTLET_POOL_SIZE", "")))
+    except ValueError:
+        return DEFAULT_POOL_SIZE
+
+
+shared_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=_pool_size(), thread_name_prefix="gauntlet",
+)
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    """True for provider 429 (rate limit) and 503 (overloaded) errors."""
+    if type(error).__name__ in _RATE_LIMIT_ERROR_NAMES:
+        return True
+    return getattr(error, "status_code", None) in _RATE_LIMIT_STATUS_CODES
+
+
+_TIMEOUT_ERROR_NAMES = frozenset({"Timeout", "APITimeoutError"})
+
+
+def _is_timeout_error(error: Exception) -> bool:
+    """True for litellm/OpenAI request timeouts."""
+    return isinstance(error, TimeoutError) or type(error).__name__ in _TIMEOUT_ERROR_NAMES
+
+
+_FATAL_ERROR_NAMES = frozenset({
+    "AuthenticationError",
+    "PermissionDeniedError",
+    "NotFoundError",
+})
+_FATAL_STATUS_CODES = frozenset({401, 403, 404})
+
+
+def is_fatal_provider_error(error: Exception) -> bool:
+    """True for permanent provider errors: 401/403 auth and unknown models."""
+    if type(error).__name__ in _FATAL_ERROR_NAMES:
+        return True
+    return getattr(error, "status_code", None) in _FATAL_STATUS_CODES
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Extract the Retry-After hint from a provider error, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+# Model-name prefixes that group models by provider, in match order.
+_PROVIDER_PREFIXES = ("codex/", "gemini-cli/", "gemini/", "claude-cli/", "claude-",
+                      "xai/", "mistral/", "groq/", "deepseek/", "zhipu/", "gpt-")
+# The provider keys per-provider limits can name; any other model is its own
+# group.
+PROVIDER_KEYS = tuple(prefix.rstrip("/-") for prefix in _PROVIDER_PREFIXES)
 
 
 def _get_model_provider(model: str) -> str:
     """Extract provider key from model name for rate limit grouping."""
-    for prefix in ("codex/", "gemini-cli/", "gemini/", "claude-cli/", "claude-",
-                    "xai/", "mistral/", "groq/", "deepseek/", "zhipu/", "gpt-"):
+    for prefix in _PROVIDER_PREFIXES:
         if model.startswith(prefix):
             return prefix.rstrip("/-")
     return model
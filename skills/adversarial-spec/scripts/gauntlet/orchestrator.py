@@ -15,6 +15,7 @@ from typing import Any, Optional
 
 import token_tracking
 from adversaries import ADVERSARIES, resolve_adversary_name
+from gauntlet import response_cache
 from gauntlet.batch_tiering import (
     pick_eval_batch_arg,
     summarize_tiers,
@@ -22,11 +23,14 @@ from gauntlet.batch_tiering import (
 from gauntlet.clustering import (
     DEFAULT_JACCARD_THRESHOLD,
     cluster_concerns,
+    merge_exact_duplicates,
     render_cluster_report,
     should_auto_cluster,
 )
 from gauntlet.core_types import (
+    BigPictureSynthesis,
     Concern,
+    Evaluation,
     ExplanationMatch,
     FinalBossResult,
     FinalBossVerdict,
@@ -35,24 +39,32 @@ from gauntlet.core_types import (
     GauntletResult,
     PhaseMetrics,
     Rebuttal,
+    bucket_by_verdict,
 )
 from gauntlet.medals import calculate_medals, save_medal_reports
 from gauntlet.model_dispatch import (
     _validate_model_name,
+    check_provider_env_limits,
     get_available_eval_models,
     select_adversary_model,
     select_eval_model,
+    shared_executor,
 )
 from gauntlet.persistence import (
     add_resolved_concern,
+    append_evaluation_journal,
+    clear_evaluation_journal,
     get_config_hash,
     get_spec_hash,
+    load_evaluation_journal,
     load_partial_run,
+    queue_run_bookkeeping,
     save_checkpoint,
     save_gauntlet_run,
     save_spec_as_gauntleted,
     update_adversary_stats,
     update_run_manifest,
+    write_json_atomic,
 )
 from gauntlet.phase_1_attacks import check_phase1_quality, generate_attacks
 from gauntlet.phase_2_synthesis import generate_big_picture_synthesis
@@ -63,7 +75,9 @@ from gauntlet.phase_3_filtering import (
 )
 from gauntlet.phase_4_evaluation import (
     evaluate_concerns,
+    evaluate_concerns_cascade,
     evaluate_concerns_multi_model,
+    is_failed_batch,
 )
 from gauntlet.phase_5_rebuttals import run_rebuttals
 from gauntlet.phase_6_adjudication import final_adjudication
@@ -102,15 +116,28 @@ def _build_phase_metrics(
     status: str = "completed",
     error: Optional[str] = None,
     extra: Optional[dict[str, Any]] = None,
+    usage: Optional[tuple[float, int, int]] = None,
 ) -> dict[str, Any]:
-    """Build a manifest payload with the full PhaseMetrics contract."""
+    """Build a manifest payload with the full PhaseMetrics contract.
+
+    usage, when given, is (duration_seconds, input_tokens, output_tokens)
+    measured by the caller, for a phase that overlapped another one and so
+    cannot be read off the shared tracker totals.
+    """
+    if usage is None:
+        usage = (
+            time.time() - started_at,
+            token_tracking.tracker.total_input_tokens - input_before,
+            token_tracking.tracker.total_output_tokens - output_before,
+        )
+    duration, input_tokens, output_tokens = usage
     metrics = PhaseMetrics(
         phase=phase,
         phase_index=PHASE_INDEXES[phase],
         status=status,
-        duration_seconds=max(0.0, time.time() - started_at),
-        input_tokens=max(0, token_tracking.tracker.total_input_tokens - input_before),
-        output_tokens=max(0, token_tracking.tracker.total_output_tokens - output_before),
+        duration_seconds=max(0.0, duration),
+        input_tokens=max(0, input_tokens),
+        output_tokens=max(0, output_tokens),
         models_used=list(models_used),
         config_snapshot=dict(config.__dict__),
         error=error,
@@ -122,6 +149,56 @@ def _build_phase_metrics(
     return payload
 
 
+def _timed_synthesis(
+    concerns: list[Concern],
+    model: str,
+    config: GauntletConfig,
+) -> tuple[BigPictureSynthesis, float, int, int]:
+    """Run Phase 2 and return (synthesis, duration, input tokens, output tokens).
+
+    Runs on a background thread alongside Phase 3, so its usage comes from
+    the per-thread token counters rather than the shared totals.
+    """
+    started = time.time()
+    input_before, output_before = token_tracking.thread_usage()
+    big_picture = generate_big_picture_synthesis(concerns, model, config)
+    input_after, output_after = token_tracking.thread_usage()
+    return (
+        big_picture,
+        time.time() - started,
+        input_after - input_before,
+        output_after - output_before,
+    )
+
+
+def _explained_dismissals(dismissed: list[Evaluation]) -> list[Evaluation]:
+    """Dismissals with enough reasoning to save for future filtering."""
+    return [
+        e for e in dismissed
+        if len(e.reasoning) > 100 and e.concern.text[:100].strip()
+    ]
+
+
+def _record_run_outcome(
+    result: GauntletResult,
+    explained: list[Evaluation],
+    spec_hash: str,
+) -> None:
+    """Save dismissal explanations and adversary stats (on the run writer)."""
+    # Auto-save dismissed concerns to resolved database (for future filtering)
+    for e in explained:
+        add_resolved_concern(
+            pattern=e.concern.text[:100].strip(),
+            explanation=e.reasoning[:500],
+            adversary=e.concern.adversary,
+            spec_hash=spec_hash,
+            confidence=0.85,
+        )
+
+    # Update adversary statistics for continuous improvement
+    update_adversary_stats(result)
+
+
 def _load_approved_prompts(
     gauntlet_dir: Path,
     spec_hash: str,
@@ -220,6 +297,8 @@ def run_gauntlet(
     eval_tier_strategy: str = "power_law_length",
     eval_flat_batch_size: int = 15,
     eval_tier_min_concerns: int = 30,
+    batch_api: bool = False,
+    eval_cascade_model: Optional[str] = None,
 ) -> GauntletResult:
     """Run the full adversarial gauntlet on a specification.
 
@@ -243,6 +322,11 @@ def run_gauntlet(
             Default "flat" preserves prior behavior.
         eval_flat_batch_size: Batch size used when ``eval_tier_strategy`` is
             "flat". Has no effect under "power_law_length".
+        batch_api: Evaluate with OpenAI models through the provider batch API
+            (multi-model Phase 4 only; other providers stay live)
+        eval_cascade_model: Cheap model that evaluates every concern first;
+            only its low-confidence verdicts go to the eval ensemble
+            (multi-model Phase 4 only)
 
     Returns:
         GauntletResult with all phases' outputs
@@ -261,6 +345,8 @@ def run_gauntlet(
         eval_tier_strategy=eval_tier_strategy,
         eval_flat_batch_size=eval_flat_batch_size,
         eval_tier_min_concerns=eval_tier_min_concerns,
+        batch_api=batch_api,
+        eval_cascade_model=eval_cascade_model,
     )
 
     # ── Step 2: Resolve models ──
@@ -292,6 +378,9 @@ def run_gauntlet(
     # ── Step 3: Early model validation (G-6: fail fast) ──
     for m in attack_models + eval_models:
         _validate_model_name(m)
+    if eval_cascade_model:
+        _validate_model_name(eval_cascade_model)
+    check_provider_env_limits()
 
     # ── Step 4: Unattended enforcement (G-4) ──
     original_input = None
@@ -399,8 +488,7 @@ def run_gauntlet(
         # Persist raw LLM responses so parsing errors are recoverable
         if attack_raw_responses:
             raw_file = gauntlet_dir / f"raw-responses-{spec_hash[:8]}.json"
-            with open(raw_file, 'w') as f:
-                json.dump(attack_raw_responses, f, indent=2)
+            write_json_atomic(raw_file, attack_raw_responses)
 
         # ── Phase 1 Quality Gate ──
         parse_failures = check_phase1_quality(concerns, attack_raw_responses)
@@ -439,11 +527,37 @@ def run_gauntlet(
         )
 
         # ── Phase 2: Big Picture Synthesis ──
-        phase_2_started_at, phase_2_input, phase_2_output = _start_phase_capture()
-        print("Phase 2: Big picture synthesis...", file=sys.stderr)
-        big_picture = generate_big_picture_synthesis(
-            concerns, primary_attack_model, config,
+        # Phase 2 reads only the Phase 1 concerns and nothing consumes its
+        # result before the final GauntletResult, so it runs on a background
+        # thread while Phase 3 filters. It is joined before Phase 3's metrics
+        # are recorded, keeping the manifest in phase order. Phase 3's window
+        # opens first and so contains Phase 2's calls, which are subtracted.
+        phase_3_started_at, phase_3_input, phase_3_output = _start_phase_capture()
+        print("Phase 2: Big picture synthesis (alongside Phase 3)...", file=sys.stderr)
+        synthesis_future = shared_executor.submit(
+            _timed_synthesis, concerns, primary_attack_model, config,
         )
+
+        # ── Phase 3: Self-Filtering ──
+        dropped_concerns: list[Concern] = []
+        noted_concerns: list[tuple[Concern, ExplanationMatch]] = []
+
+        if not skip_filtering:
+            print("Phase 3: Filtering against resolved concerns...", file=sys.stderr)
+            concerns, dropped_concerns, noted_concerns = filter_concerns_with_explanations(
+                concerns,
+                primary_attack_model,
+                spec_hash,
+                config=config,
+            )
+            if dropped_concerns:
+                print(f"  Dropped: {len(dropped_concerns)} (already addressed)", file=sys.stderr)
+            if noted_concerns:
+                print(f"  Noted: {len(noted_concerns)} (has explanation but re-verifying)", file=sys.stderr)
+            print(f"  Proceeding with: {len(concerns)} concerns", file=sys.stderr)
+
+        big_picture, phase_2_duration, phase_2_in, phase_2_out = synthesis_future.result()
+        print("Phase 2: Big picture synthesis done", file=sys.stderr)
         if big_picture.real_issues:
             print(f"  Real issues: {len(big_picture.real_issues)}", file=sys.stderr)
             for issue in big_picture.real_issues[:2]:
@@ -458,9 +572,9 @@ def run_gauntlet(
             manifest_path,
             _build_phase_metrics(
                 "phase_2",
-                phase_2_started_at,
-                phase_2_input,
-                phase_2_output,
+                phase_3_started_at,
+                0,
+                0,
                 [primary_attack_model],
                 config,
                 spec_hash,
@@ -468,35 +582,17 @@ def run_gauntlet(
                     "real_issues": len(big_picture.real_issues) if big_picture.real_issues else 0,
                     "high_signal": len(big_picture.high_signal) if big_picture.high_signal else 0,
                 },
+                usage=(phase_2_duration, phase_2_in, phase_2_out),
             ),
         )
 
-        # ── Phase 3: Self-Filtering ──
-        phase_3_started_at, phase_3_input, phase_3_output = _start_phase_capture()
-        dropped_concerns: list[Concern] = []
-        noted_concerns: list[tuple[Concern, ExplanationMatch]] = []
-
-        if not skip_filtering:
-            print("Phase 3: Filtering against resolved concerns...", file=sys.stderr)
-            concerns, dropped_concerns, noted_concerns = filter_concerns_with_explanations(
-                concerns,
-                primary_attack_model,
-                spec_hash,
-                config=config,
-            )
-            if dropped_concerns:
-                print(f"  Dropped: {len(dropped_concerns)} (already addressed)", file=sys.stderr)
-            if noted_concerns:
-                print(f"  Noted: {len(noted_concerns)} (has explanation but re-verifying)", file=sys.stderr)
-            print(f"  Proceeding with: {len(concerns)} concerns", file=sys.stderr)
-
         manifest_path = update_run_manifest(
             manifest_path,
             _build_phase_metrics(
                 "phase_3",
                 phase_3_started_at,
-                phase_3_input,
-                phase_3_output,
+                phase_3_input + phase_2_in,
+                phase_3_output + phase_2_out,
                 [primary_attack_model] if not skip_filtering else [],
                 config,
                 spec_hash,
@@ -510,6 +606,17 @@ def run_gauntlet(
         # Preserve post-filter concerns for adversary-level stats before clustering.
         post_filter_concerns = concerns
 
+        # Identical concerns (often the same adversary across attack models)
+        # would each cost a Phase 4 evaluation per eval model. Collapsing them
+        # is lossless: expand_clustered_evaluations fans verdicts back out.
+        concerns, duplicate_members = merge_exact_duplicates(concerns)
+        if len(concerns) < len(post_filter_concerns):
+            print(
+                f"Phase 3.5: Merged {len(post_filter_concerns) - len(concerns)} "
+                f"exact duplicate concerns",
+                file=sys.stderr,
+            )
+
         # ── Phase 3.5: Deterministic Jaccard clustering (Layer B) ──
         # Auto-trigger only when post-filter > CLUSTERING_AUTO_THRESHOLD (200 by
         # default). Below that, the original "adversary scope handles overlap"
@@ -554,6 +661,15 @@ def run_gauntlet(
                 # Sidecar is informational; don't break the pipeline if disk
                 # is read-only or the path is unwritable.
                 print(f"  (cluster report write skipped: {e})", file=sys.stderr)
+
+            # Fold the exact duplicates behind each clustered concern back in.
+            cluster_members = {
+                rep_id: [
+                    dup for member in members
+                    for dup in duplicate_members.get(member.id, [member])
+                ]
+                for rep_id, members in cluster_members.items()
+            }
         else:
             print(
                 f"Phase 3.5: Skipped clustering "
@@ -561,7 +677,11 @@ def run_gauntlet(
                 file=sys.stderr,
             )
             clustered_concerns = concerns
-            cluster_members = {}
+            cluster_members = {
+                rep_id: members
+                for rep_id, members in duplicate_members.items()
+                if len(members) > 1
+            }
 
         _track_dedup_stats(
             spec_hash=spec_hash,
@@ -588,10 +708,10 @@ def run_gauntlet(
         # what was decided, and pass through to evaluate_concerns_multi_model.
         # The decision policy lives in batch_tiering.pick_eval_batch_arg so it
         # is directly unit-testable without the orchestrator's plumbing.
-        def _batch_arg_for_eval():
+        def _batch_arg_for_eval(eval_concerns: list[Concern]):
             arg = pick_eval_batch_arg(
                 strategy=config.eval_tier_strategy,
-                concerns=evaluation_concerns,
+                concerns=eval_concerns,
                 flat_batch_size=config.eval_flat_batch_size,
                 tier_min_concerns=config.eval_tier_min_concerns,
             )
@@ -600,7 +720,7 @@ def run_gauntlet(
                 print(summarize_tiers(arg), file=sys.stderr)
             elif config.eval_tier_strategy == "power_law_length":
                 print(
-                    f"Phase 4: power_law_length requested but N={len(evaluation_concerns)} "
+                    f"Phase 4: power_law_length requested but N={len(eval_concerns)} "
                     f"< eval_tier_min_concerns={config.eval_tier_min_concerns}; "
                     f"falling back to flat batch_size={arg}",
                     file=sys.stderr,
@@ -612,7 +732,57 @@ def run_gauntlet(
                 )
             return arg
 
-        if "phase_4" in partial:
+        def _journal_batch(evaluations: list[Evaluation]) -> None:
+            append_evaluation_journal(spec_hash, config_hash, evaluations)
+
+        def _evaluate(eval_concerns: list[Concern]) -> list[Evaluation]:
+            # Finished batches are journaled as they land, so a crash
+            # mid-phase can resume from the batches already evaluated.
+            if use_multi_model and len(eval_models) >= 2:
+                if config.eval_cascade_model:
+                    return evaluate_concerns_cascade(
+                        spec, eval_concerns, config.eval_cascade_model, eval_models, config,
+                        batch_size=_batch_arg_for_eval(eval_concerns),
+                        on_batch=_journal_batch,
+                    )
+                return evaluate_concerns_multi_model(
+                    spec, eval_concerns, eval_models, config,
+                    batch_size=_batch_arg_for_eval(eval_concerns),
+                    on_batch=_journal_batch,
+                )
+            evaluations = evaluate_concerns(spec, eval_concerns, eval_models[0], config)
+            if not is_failed_batch(evaluations):
+                _journal_batch(evaluations)
+            return evaluations
+
+        def _evaluate_with_journal() -> list[Evaluation]:
+            """Evaluate, reusing journaled evaluations when resuming."""
+            if not config.resume:
+                clear_evaluation_journal(spec_hash)
+                return _evaluate(evaluation_concerns)
+            current_ids = {c.id for c in evaluation_concerns}
+            journaled = {
+                e.concern.id: e
+                for e in load_evaluation_journal(spec_hash, config_hash)
+                if e.concern.id in current_ids
+            }
+            if journaled:
+                print(
+                    f"  Resumed {len(journaled)} evaluations from journal, "
+                    f"{len(current_ids) - len(journaled)} remaining",
+                    file=sys.stderr,
+                )
+            remaining = [c for c in evaluation_concerns if c.id not in journaled]
+            if remaining:
+                journaled.update((e.concern.id, e) for e in _evaluate(remaining))
+            return [journaled[c.id] for c in evaluation_concerns if c.id in journaled]
+
+        if not clustered_concerns:
+            # Everything was filtered out (typically a re-run where every
+            # concern is already resolved): no batches, journal or checkpoint.
+            clustered_evaluations = []
+            print("  No concerns left after filtering, skipping evaluation", file=sys.stderr)
+        elif "phase_4" in partial:
             # Validate concern set alignment before reusing
             saved_concern_ids = {e.concern.id for e in partial["phase_4"]["evaluations"]}
             current_concern_ids = {c.id for c in clustered_concerns}
@@ -622,30 +792,15 @@ def run_gauntlet(
                 print(f"  Resumed {len(clustered_evaluations)} evaluations from checkpoint", file=sys.stderr)
             else:
                 print("  Concern set changed since checkpoint, re-evaluating", file=sys.stderr)
-                if use_multi_model and len(eval_models) >= 2:
-                    clustered_evaluations = evaluate_concerns_multi_model(
-                        spec, evaluation_concerns, eval_models, config,
-                        batch_size=_batch_arg_for_eval(),
-                    )
-                else:
-                    clustered_evaluations = evaluate_concerns(
-                        spec, evaluation_concerns, eval_models[0], config,
-                    )
+                clustered_evaluations = _evaluate_with_journal()
         else:
-            if use_multi_model and len(eval_models) >= 2:
-                clustered_evaluations = evaluate_concerns_multi_model(
-                    spec, evaluation_concerns, eval_models, config,
-                    batch_size=_batch_arg_for_eval(),
-                )
-            else:
-                clustered_evaluations = evaluate_concerns(
-                    spec, evaluation_concerns, eval_models[0], config,
-                )
+            clustered_evaluations = _evaluate_with_journal()
 
-        dismissed = [e for e in clustered_evaluations if e.verdict == "dismissed"]
-        accepted = [e for e in clustered_evaluations if e.verdict == "accepted"]
-        acknowledged = [e for e in clustered_evaluations if e.verdict == "acknowledged"]
-        deferred = [e for e in clustered_evaluations if e.verdict == "deferred"]
+        buckets = bucket_by_verdict(clustered_evaluations)
+        dismissed = buckets["dismissed"]
+        accepted = buckets["accepted"]
+        acknowledged = buckets["acknowledged"]
+        deferred = buckets["deferred"]
         print(
             f"  Dismissed: {len(dismissed)}, Accepted: {len(accepted)}, "
             f"Acknowledged: {len(acknowledged)}, Deferred: {len(deferred)}",
@@ -653,10 +808,11 @@ def run_gauntlet(
         )
 
         # Auto-checkpoint evaluations
-        if config.auto_checkpoint:
+        if config.auto_checkpoint and clustered_evaluations:
             save_checkpoint(
                 "evaluations", "phase_4", clustered_evaluations, spec_hash, config_hash,
             )
+            clear_evaluation_journal(spec_hash)
             print("  Evaluations checkpointed", file=sys.stderr)
 
         manifest_path = update_run_manifest(
@@ -680,11 +836,12 @@ def run_gauntlet(
         )
 
         # Print intermediate summary (so results visible even if later phases crash)
-        print("\n=== Phase 4 Summary (accepted concerns) ===", file=sys.stderr)
-        for e in accepted[:10]:
-            print(f"  [{e.concern.adversary}] {e.concern.text[:80]}...", file=sys.stderr)
-        if len(accepted) > 10:
-            print(f"  ... and {len(accepted) - 10} more", file=sys.stderr)
+        if accepted:
+            print("\n=== Phase 4 Summary (accepted concerns) ===", file=sys.stderr)
+            for e in accepted[:10]:
+                print(f"  [{e.concern.adversary}] {e.concern.text[:80]}...", file=sys.stderr)
+            if len(accepted) > 10:
+                print(f"  ... and {len(accepted) - 10} more", file=sys.stderr)
         if acknowledged:
             print("\n=== Acknowledged (valid but out of scope) ===", file=sys.stderr)
             for e in acknowledged[:5]:
@@ -696,9 +853,10 @@ def run_gauntlet(
         # ── Phase 5: Rebuttals ──
         phase_5_started_at, phase_5_input, phase_5_output = _start_phase_capture()
         rebuttals: list[Rebuttal] = []
+        sustained = 0
         if allow_rebuttals and dismissed:
             print("Phase 5: Running rebuttals...", file=sys.stderr)
-            rebuttals = run_rebuttals(clustered_evaluations, primary_attack_model, config)
+            rebuttals = run_rebuttals(dismissed, primary_attack_model, config)
             sustained = sum(1 for r in rebuttals if r.sustained)
             print(f"  Challenges: {sustained} of {len(rebuttals)}", file=sys.stderr)
 
@@ -714,7 +872,7 @@ def run_gauntlet(
                 spec_hash,
                 extra={
                     "rebuttals": len(rebuttals),
-                    "sustained": sum(1 for r in rebuttals if r.sustained),
+                    "sustained": sustained,
                 },
             ),
         )
@@ -787,7 +945,14 @@ def run_gauntlet(
         else:
             # Determine whether to run Final Boss
             do_final_boss = run_final_boss
-            if not do_final_boss:
+            if not do_final_boss and not technical_concerns:
+                # Nothing for the spec to revise: don't hold the run on a
+                # prompt for the most expensive phase. --final-boss still runs it.
+                print(
+                    "  Skipping Final Boss (no technical concerns; use --final-boss to run it)",
+                    file=sys.stderr,
+                )
+            elif not do_final_boss:
                 try:
                     do_final_boss = (
                         input("Run Final Boss UX review? (y/n): ")
@@ -897,6 +1062,9 @@ Technical concerns requiring revision: {len(technical_concerns)}
             print(f"Filtered out: {len(dropped_concerns)} (previously addressed)", file=sys.stderr)
         print(f"Final concerns requiring revision: {len(final_concerns)}", file=sys.stderr)
         print(f"Total cost: ${total_cost:.4f}", file=sys.stderr)
+        cache_hits, cache_lookups = response_cache.cache_stats()
+        if cache_lookups:
+            print(f"Response cache hits: {cache_hits}/{cache_lookups}", file=sys.stderr)
 
         # Expand clustered evaluations back to member concerns for adversary attribution stats.
         evaluations = expand_clustered_evaluations(clustered_evaluations, cluster_members)
@@ -924,31 +1092,21 @@ Technical concerns requiring revision: {len(technical_concerns)}
             concerns_path=concerns_path,
         )
 
-        # Auto-save dismissed concerns to resolved database (for future filtering)
-        saved_count = 0
-        for e in dismissed:
-            if len(e.reasoning) > 100:
-                pattern = e.concern.text[:100].strip()
-                if pattern:
-                    add_resolved_concern(
-                        pattern=pattern,
-                        explanation=e.reasoning[:500],
-                        adversary=e.concern.adversary,
-                        spec_hash=spec_hash,
-                        confidence=0.85,
-                    )
-                    saved_count += 1
-
-        if saved_count > 0:
-            print(f"Saved {saved_count} dismissal explanations for future filtering", file=sys.stderr)
-
-        # Update adversary statistics for continuous improvement
-        update_adversary_stats(result)
+        # Resolved-concern records and adversary stats only feed future runs;
+        # the run writer saves them off the return path (flushed at exit or
+        # on next read).
+        explained = _explained_dismissals(dismissed)
+        queue_run_bookkeeping(_record_run_outcome, result, explained, spec_hash)
+        if explained:
+            print(
+                f"Queued {len(explained)} dismissal explanations for future filtering",
+                file=sys.stderr,
+            )
 
         # Save full run log for analysis and debugging
         run_file = save_gauntlet_run(result, spec)
         run_id = Path(run_file).stem
-        print(f"Run log saved: {run_file}", file=sys.stderr)
+        print(f"Run log queued: {run_file}", file=sys.stderr)
 
         # Calculate and save medal awards (only for 6+ adversary runs)
         medals = calculate_medals(result, spec_hash, run_id)
@@ -6,20 +6,28 @@ concerns database, and checkpoint/resume support.
 
 from __future__ import annotations
 
+import atexit
+import copy
 import hashlib
 import json
 import math
 import os
+import queue
+import re
 import sys
 import tempfile
+import threading
 import uuid
+from collections import Counter
 from dataclasses import fields, is_dataclass
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from filelock import FileLock
+from gauntlet import json_utils
 from gauntlet.core_types import (
     CheckpointMeta,
     Concern,
@@ -76,6 +84,19 @@ def _lock_for(path: Path) -> FileLock:
     return FileLock(f"{path}.lock")
 
 
+# Directories this process has already created; saves a stat/mkdir per write.
+# Writers also take the file's sidecar lock, which recreates a directory that
+# was removed after it was cached here.
+_ready_dirs: set[Path] = set()
+
+
+def _ensure_dir(directory: Path) -> None:
+    """Create directory (and parents) once per process."""
+    if directory not in _ready_dirs:
+        directory.mkdir(parents=True, exist_ok=True)
+        _ready_dirs.add(directory)
+
+
 def _serialize_dataclass(obj: Any) -> Any:
     """Recursively serialize dataclasses, enums, and paths into JSON-safe values."""
     if is_dataclass(obj):
@@ -103,39 +124,68 @@ def _canonical_json(data: Any) -> str:
     )
 
 
+# Checkpoint integrity hashes are internal (never compared outside this module),
+# so they use BLAKE2b, which is faster than SHA-256 on large payloads. Spec
+# hashes stay SHA-256: external gates recompute them.
+_DATA_HASH_DIGEST_SIZE = 16
+# Checkpoints written before the switch carry 64-hex SHA-256 data hashes.
+_LEGACY_DATA_HASH_LENGTH = 64
+
+
 def _data_hash(data: Any) -> str:
     """Hash serialized data for checkpoint integrity validation."""
-    return hashlib.sha256(_canonical_json(data).encode()).hexdigest()
+    return hashlib.blake2b(
+        _canonical_json(data).encode(),
+        digest_size=_DATA_HASH_DIGEST_SIZE,
+        usedforsecurity=False,
+    ).hexdigest()
+
+
+def _data_hash_matches(expected: str, data: Any) -> bool:
+    """Check a stored data hash, accepting legacy SHA-256 checkpoints."""
+    if len(expected) == _LEGACY_DATA_HASH_LENGTH:
+        return expected == hashlib.sha256(_canonical_json(data).encode()).hexdigest()
+    return expected == _data_hash(data)
 
 
 def _load_json_safe(path: Path) -> Optional[Any]:
     """Load JSON if present and valid, otherwise return None."""
+    # Checked before locking: taking the lock would create the sidecar (and
+    # its directory) for a file that does not exist.
     if not path.exists():
         return None
 
     try:
         with _lock_for(path):
-            return json.loads(path.read_text())
+            return json_utils.loads(path.read_bytes())
     except (json.JSONDecodeError, OSError) as exc:
         _warn(f"Warning: ignoring unreadable JSON file {path}: {exc}")
         return None
 
 
-def _write_json_atomic(path: Path, data: Any) -> None:
-    """Write JSON atomically using a same-directory temp file and replace."""
-    path.parent.mkdir(parents=True, exist_ok=True)
+def write_json_atomic(path: Path, data: Any, indent: Optional[int] = 2) -> None:
+    """Write JSON atomically using a same-directory temp file and replace.
+
+    A crash mid-write leaves the previous file intact instead of a truncated
+    one; use this for every JSON artifact the gauntlet persists. Pass
+    indent=None for compact output on large machine-read files; any other
+    indent writes the 2-space form.
+
+    The document is encoded in one json_utils.dumpb call (orjson when
+    installed) and written as a single bytes buffer.
+    """
+    _ensure_dir(path.parent)
+    payload = json_utils.dumpb(_serialize_dataclass(data), indent=indent is not None) + b"\n"
 
     with _lock_for(path):
         tmp = tempfile.NamedTemporaryFile(
             dir=path.parent,
             delete=False,
             suffix=".tmp",
-            mode="w",
-            encoding="utf-8",
+            mode="wb",
         )
         try:
-            json.dump(_serialize_dataclass(data), tmp, indent=2)
-            tmp.write("\n")
+            tmp.write(payload)
             tmp.flush()
             os.fsync(tmp.fileno())
             tmp.close()
@@ -152,6 +202,10 @@ def _write_json_atomic(path: Path, data: Any) -> None:
             raise
 
 
+# Pre-rename spelling, kept for existing callers.
+_write_json_atomic = write_json_atomic
+
+
 def format_path_safe(base_dir: Path, filename: str) -> Path:
     """Resolve a path under base_dir and reject traversal outside it."""
     if ".." in filename or filename.startswith("/"):
@@ -187,11 +241,15 @@ def _resolve_checkpoint_path(path_or_key: str | Path, spec_hash: str) -> tuple[s
 def _normalize_config_payload(config: Any) -> dict[str, Any]:
     """Keep only config fields that actually influence gauntlet outputs."""
     if isinstance(config, GauntletConfig):
-        return {
+        payload = {
             "timeout": config.timeout,
             "attack_codex_reasoning": config.attack_codex_reasoning,
             "eval_codex_reasoning": config.eval_codex_reasoning,
         }
+        # Only when set, so hashes of non-cascade runs are unchanged.
+        if config.eval_cascade_model:
+            payload["eval_cascade_model"] = config.eval_cascade_model
+        return payload
 
     if is_dataclass(config):
         payload = _serialize_dataclass(config)
@@ -245,6 +303,8 @@ def _deserialize_evaluation(data: dict[str, Any]) -> Evaluation:
         verdict=data["verdict"],
         reasoning=data.get("reasoning", ""),
         severity=data.get("severity", ""),
+        votes=data.get("votes", {}),
+        confidence=data.get("confidence"),
     )
 
 
@@ -318,112 +378,310 @@ def _load_checkpoint_envelope(
         return None
 
     expected_hash = meta.get("data_hash")
-    if expected_hash and expected_hash != _data_hash(payload["data"]):
+    if expected_hash and not _data_hash_matches(expected_hash, payload["data"]):
         _warn(f"Warning: checkpoint integrity check failed: {path.name}")
         return None
 
     return payload["data"]
 
 
+# =============================================================================
+# APPEND-ONLY DELTA LOGS
+# =============================================================================
+#
+# The stats and resolved-concerns databases are a JSON snapshot plus an
+# append-only JSONL log of delta records. Hot-path updates append one line
+# instead of rewriting the whole snapshot; loads replay the log tail on top of
+# the snapshot, and compaction folds the log back into the snapshot once it
+# grows past LOG_COMPACT_THRESHOLD records.
+#
+# Every record carries a unique log_id, and the snapshot stores the log_id of
+# the last record folded into it (_LOG_TAIL_KEY). Replay skips everything up
+# to that record, so a crash between writing the snapshot and trimming the
+# log never double-applies a delta.
+#
+# Lock order is always log lock, then snapshot lock.
+
+LOG_COMPACT_THRESHOLD = 500
+_LOG_TAIL_KEY = "_log_tail"
+
+# Replayed state per (snapshot, log) pair, keyed on both files' stat
+# signatures, so repeated loads of an unchanged database skip the parse.
+_log_backed_cache: dict[tuple[Path, Path], tuple[tuple, dict, int]] = {}
+
+
+def _file_signature(path: Path) -> Optional[tuple[int, int, int]]:
+    """Return (inode, mtime_ns, size) for change detection, or None if missing."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _read_log_records(log_path: Path) -> list[dict]:
+    """Read delta records from a JSONL log, skipping torn or invalid lines."""
+    records: list[dict] = []
+    try:
+        with open(log_path, "rb") as fh:
+            for line in fh:
+                if not line.strip():
+                    continue
+                try:
+                    record = json_utils.loads(line)
+                except ValueError:
+                    _warn(f"Warning: skipping unreadable record in {log_path}")
+                    continue
+                if isinstance(record, dict):
+                    records.append(record)
+    except FileNotFoundError:
+        return []
+    except OSError as exc:
+        _warn(f"Warning: ignoring unreadable log file {log_path}: {exc}")
+        return []
+    return records
+
+
+def _pending_log_records(snapshot: dict, records: list[dict]) -> list[dict]:
+    """Return the records not yet folded into the snapshot."""
+    tail = snapshot.get(_LOG_TAIL_KEY)
+    if tail:
+        for i, record in enumerate(records):
+            if record.get("log_id") == tail:
+                return records[i + 1:]
+    return records
+
+
+def _append_log_record(log_path: Path, record: dict) -> dict:
+    """Append one delta record with a single O_APPEND write. Caller holds the log lock."""
+    record = {"log_id": uuid.uuid4().hex, **record}
+    _ensure_dir(log_path.parent)
+    with open(log_path, "a", encoding="utf-8") as fh:
+        fh.write(json_utils.dumps(record) + "\n")
+    return record
+
+
+def _load_log_backed(snapshot_path: Path, log_path: Path, default, replay) -> tuple[dict, int]:
+    """Load a snapshot and replay its pending log records. Caller holds the log lock.
+
+    replay(data, records) folds the pending records into data in log order.
+    Returns the state and how many records were replayed. The result is
+    memoized until either file changes; callers get their own deep copy.
+    """
+    key = (snapshot_path, log_path)
+    signature = (_file_signature(snapshot_path), _file_signature(log_path))
+    cached = _log_backed_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return copy.deepcopy(cached[1]), cached[2]
+
+    data = _load_json_safe(snapshot_path)
+    if not isinstance(data, dict):
+        data = default()
+    pending = _pending_log_records(data, _read_log_records(log_path))
+    replay(data, pending)
+    if pending:
+        data[_LOG_TAIL_KEY] = pending[-1].get("log_id")
+    _log_backed_cache[key] = (signature, copy.deepcopy(data), len(pending))
+    return data, len(pending)
+
+
+def _write_snapshot(snapshot_path: Path, log_path: Path, data: dict) -> None:
+    """Write a full snapshot and drop the log records it covers. Caller holds the log lock.
+
+    Records appended after the state was loaded stay in the log and are
+    replayed on top of the new snapshot.
+    """
+    write_json_atomic(snapshot_path, data, indent=None)
+
+    records = _read_log_records(log_path)
+    if not records:
+        return
+    remaining = _pending_log_records(data, records)
+    if len(remaining) == len(records):
+        return
+    tmp = log_path.with_name(f"{log_path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as fh:
+            for record in remaining:
+                fh.write(json_utils.dumps(record) + "\n")
+        os.replace(tmp, log_path)
+    except OSError as exc:
+        # The snapshot tail marker keeps replay correct even if trimming fails.
+        _warn(f"Warning: could not trim log file {log_path}: {exc}")
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
 # =============================================================================
 # ADVERSARY STATS
 # =============================================================================
 
+STATS_LOG = STATS_DIR / "adversary_stats.log"
+
+
+def _empty_adversary_stats() -> dict:
+    return {
+        "last_updated": None,
+        "total_runs": 0,
+        "adversaries": {},
+        "models": {},
+    }
+
 
 def load_adversary_stats() -> dict:
-    """Load adversary statistics from disk."""
-    stats = _load_json_safe(STATS_FILE)
-    if not isinstance(stats, dict):
-        return {
-            "last_updated": None,
-            "total_runs": 0,
-            "adversaries": {},
-            "models": {},
-        }
+    """Load adversary statistics from disk (snapshot plus pending log records)."""
+    flush_gauntlet_runs()
+    with _lock_for(STATS_LOG):
+        stats, _ = _load_log_backed(
+            STATS_FILE, STATS_LOG, _empty_adversary_stats, _replay_adversary_stats_deltas
+        )
     return stats
 
 
 def save_adversary_stats(stats: dict) -> None:
-    """Save adversary statistics to disk."""
+    """Save adversary statistics to disk as a full snapshot."""
     stats["last_updated"] = datetime.now().isoformat()
-    _write_json_atomic(STATS_FILE, stats)
+    with _lock_for(STATS_LOG):
+        _write_snapshot(STATS_FILE, STATS_LOG, stats)
 
 
-def update_adversary_stats(result: GauntletResult) -> dict:
-    """Update adversary statistics with results from a gauntlet run.
+def compact_adversary_stats() -> None:
+    """Fold the adversary stats log into the snapshot and trim the log."""
+    with _lock_for(STATS_LOG):
+        stats, _ = _load_log_backed(
+            STATS_FILE, STATS_LOG, _empty_adversary_stats, _replay_adversary_stats_deltas
+        )
+        _write_snapshot(STATS_FILE, STATS_LOG, stats)
+
+
+def _adversary_stats_delta(result: GauntletResult) -> dict:
+    """Build the per-run delta record that update_adversary_stats logs."""
+    model_roles: list[tuple[str, str]] = []
+    attack_models = [m.strip() for m in result.adversary_model.split(",") if m.strip()]
+    eval_models = [m.strip() for m in result.eval_model.split(",") if m.strip()]
+    for model in attack_models:
+        model_roles.append((model, "adversary"))
+    for model in eval_models:
+        model_roles.append((model, "evaluation"))
+
+    verdict_counts = Counter(e.verdict for e in result.evaluations)
+    return {
+        "ts": datetime.now().isoformat(),
+        "adversaries": result.get_adversary_stats(),
+        "model_roles": model_roles,
+        "cost_share": result.total_cost / max(1, len(model_roles)),
+        "pairing": {
+            "key": f"{result.adversary_model} + {result.eval_model}",
+            "concerns": len(result.concerns),
+            "accepted": verdict_counts["accepted"] + verdict_counts["acknowledged"],
+            "dismissed": verdict_counts["dismissed"],
+        },
+    }
+
+
+# Per-run counters; an adversary with all of these at zero was idle that run.
+_ADVERSARY_ACTIVITY_KEYS = (
+    "concerns_raised", "accepted", "acknowledged", "dismissed", "deferred",
+    "rebuttals_won", "rebuttals_lost",
+)
+
+
+# Cumulative per-adversary fields. Entries written before a field existed
+# are back-filled once, so the fold below can use plain += throughout.
+_ADVERSARY_ENTRY_DEFAULTS = {
+    "concerns_raised": 0,
+    "accepted": 0,
+    "acknowledged": 0,
+    "dismissed": 0,
+    "deferred": 0,
+    "rebuttals_won": 0,
+    "rebuttals_lost": 0,
+    "dismissal_effort_total": 0,
+    "signal_score_sum": 0.0,
+    "runs_with_concerns": 0,
+}
+
+
+def _replay_adversary_stats_deltas(stats: dict, deltas: list[dict]) -> None:
+    """Fold logged per-run deltas into the cumulative stats, in order.
+
+    Derived averages depend only on the final counters, so they are
+    recomputed once per touched adversary after the whole replay.
+    """
+    touched: set[str] = set()
+    for delta in deltas:
+        touched.update(_fold_adversary_stats_delta(stats, delta))
+    for adv in touched:
+        _derive_adversary_averages(stats["adversaries"][adv])
+
+
+def _apply_adversary_stats_delta(stats: dict, delta: dict) -> None:
+    """Fold one run's delta record into the cumulative stats.
 
     Tracks cost-weighted metrics:
     - dismissal_effort_total: cumulative chars in dismissal reasoning
     - signal_score_sum: sum of signal scores across runs (for averaging)
     """
-    stats = load_adversary_stats()
+    for adv in _fold_adversary_stats_delta(stats, delta):
+        _derive_adversary_averages(stats["adversaries"][adv])
 
-    stats["last_updated"] = datetime.now().isoformat()
+
+def _derive_adversary_averages(entry: dict) -> None:
+    """Recompute an adversary's stored averages (unrounded; the leaderboard formats them)."""
+    total = entry["concerns_raised"]
+    entry["acceptance_rate"] = entry["accepted"] / total if total > 0 else 0.0
+
+    dismissed = entry["dismissed"]
+    entry["avg_dismissal_effort"] = (
+        entry["dismissal_effort_total"] / dismissed if dismissed > 0 else 0
+    )
+
+    runs = entry["runs_with_concerns"]
+    entry["avg_signal_score"] = entry["signal_score_sum"] / runs if runs > 0 else 0.0
+
+
+def _fold_adversary_stats_delta(stats: dict, delta: dict) -> list[str]:
+    """Add one run's counters into the stats; return the adversaries that changed."""
+    stats["last_updated"] = delta.get("ts")
     stats["total_runs"] = stats.get("total_runs", 0) + 1
+    adversaries = stats.setdefault("adversaries", {})
+    stats.setdefault("models", {})
 
     # Update per-adversary stats
-    run_stats = result.get_adversary_stats()
-    for adv, adv_run in run_stats.items():
-        if adv not in stats["adversaries"]:
-            stats["adversaries"][adv] = {
-                "concerns_raised": 0,
-                "accepted": 0,
-                "acknowledged": 0,
-                "dismissed": 0,
-                "deferred": 0,
-                "rebuttals_won": 0,
-                "rebuttals_lost": 0,
-                "dismissal_effort_total": 0,
-                "signal_score_sum": 0.0,
-                "runs_with_concerns": 0,
-                "notable_finds": [],
-            }
-
-        existing = stats["adversaries"][adv]
-        existing["concerns_raised"] += adv_run["concerns_raised"]
+    touched = []
+    for adv, adv_run in delta.get("adversaries", {}).items():
+        existing = adversaries.get(adv)
+        if existing is None:
+            existing = adversaries[adv] = {**_ADVERSARY_ENTRY_DEFAULTS, "notable_finds": []}
+        elif not any(adv_run.get(key) for key in _ADVERSARY_ACTIVITY_KEYS):
+            # Idle this run: every counter increment would be zero, so the
+            # derived averages can't change either.
+            continue
+        elif not existing.keys() >= _ADVERSARY_ENTRY_DEFAULTS.keys():
+            for key, value in _ADVERSARY_ENTRY_DEFAULTS.items():
+                existing.setdefault(key, value)
+        touched.append(adv)
+
+        concerns_raised = adv_run["concerns_raised"]
+        dismissed = adv_run["dismissed"]
+        existing["concerns_raised"] += concerns_raised
         existing["accepted"] += adv_run["accepted"]
-        existing["acknowledged"] = existing.get("acknowledged", 0) + adv_run.get("acknowledged", 0)
-        existing["dismissed"] += adv_run["dismissed"]
+        existing["acknowledged"] += adv_run.get("acknowledged", 0)
+        existing["dismissed"] += dismissed
         existing["deferred"] += adv_run["deferred"]
         existing["rebuttals_won"] += adv_run["rebuttals_won"]
         existing["rebuttals_lost"] += adv_run["rebuttals_lost"]
+        existing["dismissal_effort_total"] += adv_run["dismissal_effort"] * dismissed
 
-        existing["dismissal_effort_total"] = existing.get("dismissal_effort_total", 0) + (
-            adv_run["dismissal_effort"] * adv_run["dismissed"]
-        )
-
-        if adv_run["concerns_raised"] > 0:
-            existing["signal_score_sum"] = existing.get("signal_score_sum", 0) + adv_run["signal_score"]
-            existing["runs_with_concerns"] = existing.get("runs_with_concerns", 0) + 1
-
-        total = existing["concerns_raised"]
-        existing["acceptance_rate"] = round(existing["accepted"] / total, 3) if total > 0 else 0.0
-
-        if existing["dismissed"] > 0:
-            existing["avg_dismissal_effort"] = round(
-                existing["dismissal_effort_total"] / existing["dismissed"], 0
-            )
-        else:
-            existing["avg_dismissal_effort"] = 0
-
-        if existing.get("runs_with_concerns", 0) > 0:
-            existing["avg_signal_score"] = round(
-                existing["signal_score_sum"] / existing["runs_with_concerns"], 3
-            )
-        else:
-            existing["avg_signal_score"] = 0.0
+        if concerns_raised > 0:
+            existing["signal_score_sum"] += adv_run["signal_score"]
+            existing["runs_with_concerns"] += 1
 
     # Update model stats
-    model_roles: list[tuple[str, str]] = []
-    attack_models = [m.strip() for m in result.adversary_model.split(",") if m.strip()]
-    eval_models = [m.strip() for m in result.eval_model.split(",") if m.strip()]
-    for model in attack_models:
-        model_roles.append((model, "adversary"))
-    for model in eval_models:
-        model_roles.append((model, "evaluation"))
-
-    cost_share = result.total_cost / max(1, len(model_roles))
-    for model, role in model_roles:
+    cost_share = delta.get("cost_share", 0.0)
+    for model, role in delta.get("model_roles", []):
         if model not in stats["models"]:
             stats["models"][model] = {
                 "role": role,
@@ -434,7 +692,10 @@ def update_adversary_stats(result: GauntletResult) -> dict:
         stats["models"][model]["total_cost"] += cost_share
 
     # Track model pairing effectiveness
-    pairing_key = f"{result.adversary_model} + {result.eval_model}"
+    run_pairing = delta.get("pairing")
+    if not run_pairing:
+        return touched
+    pairing_key = run_pairing["key"]
     if "model_pairings" not in stats:
         stats["model_pairings"] = {}
     if pairing_key not in stats["model_pairings"]:
@@ -448,16 +709,31 @@ def update_adversary_stats(result: GauntletResult) -> dict:
 
     pairing = stats["model_pairings"][pairing_key]
     pairing["runs"] += 1
-    total_concerns = len(result.concerns)
-    accepted = len([e for e in result.evaluations if e.verdict in ("accepted", "acknowledged")])
-    dismissed = len([e for e in result.evaluations if e.verdict == "dismissed"])
-    pairing["total_concerns"] += total_concerns
-    pairing["accepted"] += accepted
-    pairing["dismissed"] += dismissed
+    pairing["total_concerns"] += run_pairing["concerns"]
+    pairing["accepted"] += run_pairing["accepted"]
+    pairing["dismissed"] += run_pairing["dismissed"]
     if pairing["total_concerns"] > 0:
-        pairing["avg_acceptance_rate"] = round(pairing["accepted"] / pairing["total_concerns"], 3)
+        pairing["avg_acceptance_rate"] = pairing["accepted"] / pairing["total_concerns"]
+    return touched
+
 
-    save_adversary_stats(stats)
+def update_adversary_stats(result: GauntletResult) -> dict:
+    """Update adversary statistics with results from a gauntlet run.
+
+    Appends one delta record to the stats log rather than rewriting the
+    snapshot; the log is compacted once it passes LOG_COMPACT_THRESHOLD.
+    Returns the updated cumulative stats.
+    """
+    delta = _adversary_stats_delta(result)
+    with _lock_for(STATS_LOG):
+        stats, replayed = _load_log_backed(
+            STATS_FILE, STATS_LOG, _empty_adversary_stats, _replay_adversary_stats_deltas
+        )
+        record = _append_log_record(STATS_LOG, delta)
+        _apply_adversary_stats_delta(stats, record)
+        stats[_LOG_TAIL_KEY] = record["log_id"]
+        if replayed + 1 >= LOG_COMPACT_THRESHOLD:
+            _write_snapshot(STATS_FILE, STATS_LOG, stats)
     return stats
 
 
@@ -465,11 +741,178 @@ def update_adversary_stats(result: GauntletResult) -> dict:
 # GAUNTLET RUN STORAGE
 # =============================================================================
 
+# Run summaries are appended one JSON line per run; the file is cut back to
+# the newest RUNS_INDEX_LIMIT entries once it passes RUNS_INDEX_MAX_BYTES.
+RUNS_INDEX_FILE = STATS_DIR / "runs_index.jsonl"
+_LEGACY_RUNS_INDEX_FILE = STATS_DIR / "runs_index.json"
+RUNS_INDEX_LIMIT = 100
+RUNS_INDEX_MAX_BYTES = 1 << 20
+_RUNS_INDEX_TAIL_BYTES = 64 * 1024
+
+
+def _parse_index_lines(chunk: bytes) -> list[dict]:
+    """Parse JSONL index lines, skipping blank, torn or invalid ones."""
+    entries = []
+    for line in chunk.split(b"\n"):
+        if not line.strip():
+            continue
+        try:
+            entry = json_utils.loads(line)
+        except ValueError:
+            continue
+        if isinstance(entry, dict):
+            entries.append(entry)
+    return entries
+
+
+def _read_runs_index_tail(limit: int) -> Optional[list[dict]]:
+    """Return up to the last `limit` run summaries, oldest first.
+
+    Reads only the last _RUNS_INDEX_TAIL_BYTES unless that holds fewer than
+    `limit` entries. Falls back to the legacy runs_index.json array; returns
+    None when no index exists.
+    """
+    try:
+        fh = open(RUNS_INDEX_FILE, "rb")
+    except FileNotFoundError:
+        legacy = _load_json_safe(_LEGACY_RUNS_INDEX_FILE)
+        if legacy is None:
+            return None
+        if not isinstance(legacy, dict):
+            raise ValueError("legacy runs index is not an object")
+        return list(legacy.get("runs", []))[-limit:]
+
+    with fh:
+        size = os.fstat(fh.fileno()).st_size
+        offset = max(0, size - _RUNS_INDEX_TAIL_BYTES)
+        chunk = os.pread(fh.fileno(), size - offset, offset)
+        if offset:
+            # Drop the partial line the window starts in.
+            chunk = chunk[chunk.find(b"\n") + 1:]
+        entries = _parse_index_lines(chunk)
+        if offset and len(entries) < limit:
+            entries = _parse_index_lines(os.pread(fh.fileno(), size, 0))
+    return entries[-limit:]
+
+
+def _append_runs_index(*entries: dict) -> None:
+    """Append run summaries, migrating the legacy index and trimming as needed."""
+    _ensure_dir(RUNS_INDEX_FILE.parent)
+    with _lock_for(RUNS_INDEX_FILE):
+        if not RUNS_INDEX_FILE.exists():
+            legacy = _load_json_safe(_LEGACY_RUNS_INDEX_FILE)
+            seed = legacy.get("runs", []) if isinstance(legacy, dict) else []
+            if seed:
+                RUNS_INDEX_FILE.write_bytes(
+                    b"".join(json_utils.dumpb(e) + b"\n" for e in seed[-RUNS_INDEX_LIMIT:])
+                )
+
+        with open(RUNS_INDEX_FILE, "ab") as fh:
+            fh.write(b"".join(json_utils.dumpb(e) + b"\n" for e in entries))
+            size = fh.tell()
+
+        if size > RUNS_INDEX_MAX_BYTES:
+            kept = _parse_index_lines(RUNS_INDEX_FILE.read_bytes())[-RUNS_INDEX_LIMIT:]
+            tmp = RUNS_INDEX_FILE.with_name(f"{RUNS_INDEX_FILE.name}.{uuid.uuid4().hex}.tmp")
+            tmp.write_bytes(b"".join(json_utils.dumpb(e) + b"\n" for e in kept))
+            os.replace(tmp, RUNS_INDEX_FILE)
+
+
+# Run files are written by a background thread so the orchestrator doesn't
+# wait on serialization and fsync. Queued runs are drained in batches of up to
+# _RUN_WRITER_BATCH with one runs-index append per batch, and are flushed at
+# interpreter exit and before any in-process read of the run store, adversary
+# stats or resolved concerns. End-of-run bookkeeping (queue_run_bookkeeping)
+# rides the same queue.
+_RUN_WRITER_BATCH = 16
+_run_writer_queue: Optional[queue.Queue] = None
+_run_writer_thread: Optional[threading.Thread] = None
+_run_writer_lock = threading.Lock()
+
+
+def _run_writer_loop(pending: queue.Queue) -> None:
+    """Write queued (filepath, run_data, index_entry) items and run queued
+    bookkeeping calls until the process exits."""
+    while True:
+        batch = [pending.get()]
+        while len(batch) < _RUN_WRITER_BATCH:
+            try:
+                batch.append(pending.get_nowait())
+            except queue.Empty:
+                break
+        written = []
+        for item in batch:
+            if callable(item):
+                try:
+                    item()
+                except Exception as exc:
+                    # Same as a failed run file: report and keep the writer alive.
+                    _warn(f"Warning: run bookkeeping {getattr(item.func, '__name__', item.func)} failed: {exc}")
+                continue
+            filepath, run_data, entry = item
+            try:
+                # Run files are large and machine-read (--show-run pretty-prints them).
+                write_json_atomic(filepath, run_data, indent=None)
+                written.append(entry)
+            except Exception as exc:
+                # Nothing up the stack can handle this; report and keep the writer alive.
+                _warn(f"Warning: could not save gauntlet run {filepath}: {exc}")
+        try:
+            if written:
+                _append_runs_index(*written)
+        except Exception as exc:
+            _warn(f"Warning: could not update runs index: {exc}")
+        finally:
+            for _ in batch:
+                pending.task_done()
+
+
+def _run_writer_put(item: Any) -> None:
+    global _run_writer_queue, _run_writer_thread
+    with _run_writer_lock:
+        if _run_writer_queue is None:
+            _run_writer_queue = queue.Queue()
+            _run_writer_thread = threading.Thread(
+                target=_run_writer_loop,
+                args=(_run_writer_queue,),
+                name="gauntlet-run-writer",
+                daemon=True,
+            )
+            _run_writer_thread.start()
+            atexit.register(flush_gauntlet_runs)
+        pending = _run_writer_queue
+    pending.put(item)
+
+
+def _queue_run_write(filepath: Path, run_data: dict, entry: dict) -> None:
+    """Hand a run file and its index entry to the background writer."""
+    _run_writer_put((filepath, run_data, entry))
+
+
+def queue_run_bookkeeping(fn: Callable[..., Any], *args: Any) -> None:
+    """Run fn(*args) on the run writer, after the writes queued before it.
+
+    For records that only feed future runs (stats, resolved concerns);
+    failures only warn.
+    """
+    _run_writer_put(partial(fn, *args))
+
+
+def flush_gauntlet_runs() -> None:
+    """Block until every queued run file, index entry and bookkeeping call is done.
+
+    A no-op on the writer itself: bookkeeping there reads the stores it
+    updates, and its own earlier work is already done.
+    """
+    if _run_writer_queue is not None and threading.current_thread() is not _run_writer_thread:
+        _run_writer_queue.join()
+
 
 def save_gauntlet_run(result: GauntletResult, spec: str) -> str:
     """Save a full gauntlet run to disk for analysis and debugging.
 
-    Returns path to saved file.
+    The run is snapshotted here and written in the background; call
+    flush_gauntlet_runs() to wait for it. Returns path to the run file.
     """
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     spec_hash = (result.spec_hash or get_spec_hash(spec))[:8]
@@ -484,16 +927,8 @@ def save_gauntlet_run(result: GauntletResult, spec: str) -> str:
         "result": result.to_dict(),
     }
 
-    _write_json_atomic(filepath, run_data)
-
-    # Update index
-    index_file = STATS_DIR / "runs_index.json"
-    index = _load_json_safe(index_file)
-    if not isinstance(index, dict):
-        index = {"runs": []}
-
     raw_count = len(result.raw_concerns) if result.raw_concerns else len(result.concerns)
-    index["runs"].append({
+    _queue_run_write(filepath, run_data, {
         "file": filename,
         "timestamp": run_data["timestamp"],
         "spec_hash": spec_hash,
@@ -505,26 +940,21 @@ def save_gauntlet_run(result: GauntletResult, spec: str) -> str:
         "total_time": result.total_time,
     })
 
-    index["runs"] = index["runs"][-100:]
-    _write_json_atomic(index_file, index)
-
     return str(filepath)
 
 
 def list_gauntlet_runs(limit: int = 10) -> str:
     """List recent gauntlet runs with summary stats."""
-    index_file = STATS_DIR / "runs_index.json"
-
-    index = _load_json_safe(index_file)
-    if index is None:
-        return "No gauntlet runs recorded yet."
-    if not isinstance(index, dict):
+    flush_gauntlet_runs()
+    try:
+        tail = _read_runs_index_tail(limit)
+    except (OSError, ValueError):
         return "Error reading runs index."
 
-    if not index.get("runs"):
+    if not tail:
         return "No gauntlet runs recorded yet."
 
-    runs = index["runs"][-limit:][::-1]
+    runs = tail[::-1]
 
     lines = [f"=== Recent Gauntlet Runs (last {len(runs)}) ===", ""]
 
@@ -543,15 +973,91 @@ def list_gauntlet_runs(limit: int = 10) -> str:
     return "\n".join(lines)
 
 
+@lru_cache(maxsize=128)
+def _load_run_file(path: str, mtime_ns: int, size: int) -> Optional[Any]:
+    """Parse a run file; cached per (path, mtime, size) so edits invalidate it."""
+    return _load_json_safe(Path(path))
+
+
 def load_gauntlet_run(filename: str) -> Optional[dict]:
-    """Load a specific gauntlet run by filename."""
+    """Load a specific gauntlet run by filename.
+
+    Run files are write-once, so parsed runs are memoized; callers must not
+    mutate the returned dict.
+    """
+    flush_gauntlet_runs()
     filepath = RUNS_DIR / filename
-    run_data = _load_json_safe(filepath)
+    try:
+        stat = filepath.stat()
+    except OSError:
+        return None
+    run_data = _load_run_file(str(filepath), stat.st_mtime_ns, stat.st_size)
     if not isinstance(run_data, dict):
         return None
     return run_data
 
 
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WS_RE = re.compile(r"[ \t\n\r]*")
+
+
+def _iter_top_level_items(text: str):
+    """Yield the (key, value) pairs of a top-level JSON object one at a time.
+
+    Each value is decoded only when the generator reaches it, so a caller
+    that stops early never parses the rest of the document.
+    """
+    idx = _JSON_WS_RE.match(text, 0).end()
+    if text[idx:idx + 1] != "{":
+        raise ValueError("expected a JSON object")
+    idx = _JSON_WS_RE.match(text, idx + 1).end()
+    if text[idx:idx + 1] == "}":
+        return
+    while True:
+        key, idx = _JSON_DECODER.raw_decode(text, idx)
+        idx = _JSON_WS_RE.match(text, idx).end()
+        if text[idx:idx + 1] != ":":
+            raise ValueError(f"expected ':' at offset {idx}")
+        idx = _JSON_WS_RE.match(text, idx + 1).end()
+        value, idx = _JSON_DECODER.raw_decode(text, idx)
+        yield key, value
+        idx = _JSON_WS_RE.match(text, idx).end()
+        if text[idx:idx + 1] == "}":
+            return
+        if text[idx:idx + 1] != ",":
+            raise ValueError(f"expected ',' or '}}' at offset {idx}")
+        idx = _JSON_WS_RE.match(text, idx + 1).end()
+
+
+def load_gauntlet_run_fields(filename: str, keys: set[str]) -> Optional[dict]:
+    """Load only the requested top-level fields of a gauntlet run.
+
+    Run files put the small metadata (timestamp, spec_hash, spec_length, ...)
+    before the large "result" payload, and decoding stops as soon as every
+    requested key has been seen. Use load_gauntlet_run for the full run.
+    """
+    flush_gauntlet_runs()
+    filepath = RUNS_DIR / filename
+    try:
+        text = filepath.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+    fields_found: dict[str, Any] = {}
+    remaining = set(keys)
+    try:
+        for key, value in _iter_top_level_items(text):
+            if key in remaining:
+                fields_found[key] = value
+                remaining.discard(key)
+                if not remaining:
+                    break
+    except ValueError as exc:
+        _warn(f"Warning: ignoring unreadable JSON file {filepath}: {exc}")
+        return None
+    return fields_found
+
+
 # =============================================================================
 # CHECKPOINTS AND MANIFESTS
 # =============================================================================
@@ -580,10 +1086,81 @@ def save_checkpoint(
         "_meta": _serialize_dataclass(meta),
         "data": serialized,
     }
-    _write_json_atomic(path, envelope)
+    # Checkpoints are machine-read and can hold every concern and evaluation.
+    write_json_atomic(path, envelope, indent=None)
     return str(path)
 
 
+def _evaluation_journal_path(spec_hash: str) -> Path:
+    return format_path_safe(GAUNTLET_DIR, f"evaluations-{spec_hash[:8]}.jsonl")
+
+
+def append_evaluation_journal(
+    spec_hash: str,
+    config_hash: str,
+    evaluations: list[Evaluation],
+) -> None:
+    """Append one finished Phase 4 batch to the crash-recovery journal.
+
+    The evaluations checkpoint is only written once Phase 4 finishes; the
+    journal gets one JSON line per evaluation as each batch lands, fsynced
+    before returning, so a crash mid-phase loses at most the batches still
+    in flight. Write failures warn and never interrupt the run.
+    """
+    if not evaluations:
+        return
+    payload = b"".join(
+        json_utils.dumpb({
+            "config_hash": config_hash,
+            "evaluation": _serialize_dataclass(evaluation),
+        }) + b"\n"
+        for evaluation in evaluations
+    )
+    try:
+        path = _evaluation_journal_path(spec_hash)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "ab") as fh:
+            fh.write(payload)
+            fh.flush()
+            os.fsync(fh.fileno())
+    except OSError as exc:
+        _warn(f"Warning: could not append evaluation journal: {exc}")
+
+
+def load_evaluation_journal(spec_hash: str, config_hash: str) -> list[Evaluation]:
+    """Replay journaled evaluations written under the same config.
+
+    A torn final line (crash mid-write) and entries from another config are
+    skipped.
+    """
+    try:
+        data = _evaluation_journal_path(spec_hash).read_bytes()
+    except FileNotFoundError:
+        return []
+    except OSError as exc:
+        _warn(f"Warning: could not read evaluation journal: {exc}")
+        return []
+
+    evaluations: list[Evaluation] = []
+    for line in data.splitlines():
+        try:
+            record = json_utils.loads(line)
+            if record.get("config_hash") != config_hash:
+                continue
+            evaluations.append(_deserialize_evaluation(record["evaluation"]))
+        except (ValueError, KeyError, TypeError, AttributeError):
+            continue
+    return evaluations
+
+
+def clear_evaluation_journal(spec_hash: str) -> None:
+    """Remove the journal once the full evaluations checkpoint supersedes it."""
+    try:
+        _evaluation_journal_path(spec_hash).unlink(missing_ok=True)
+    except OSError as exc:
+        _warn(f"Warning: could not remove evaluation journal: {exc}")
+
+
 def save_partial_clustering(spec_hash: str, concerns: Any, config_hash: str) -> str:
     """Persist the Phase 3.5 clustering output for crash recovery."""
     return save_checkpoint(
@@ -622,7 +1199,7 @@ def save_run_manifest(
     for extra_key, value in manifest.items():
         if extra_key not in manifest_data:
             manifest_data[extra_key] = value
-    _write_json_atomic(path, manifest_data)
+    write_json_atomic(path, manifest_data)
     return str(path)
 
 
@@ -658,7 +1235,7 @@ def update_run_manifest(
         manifest.update(phase_payload)
 
     manifest["updated_at"] = _utc_now_iso()
-    _write_json_atomic(path, manifest)
+    write_json_atomic(path, manifest)
     return str(path)
 
 
@@ -789,8 +1366,13 @@ def load_partial_run(
 # =============================================================================
 
 
+@lru_cache(maxsize=8)
 def get_spec_hash(spec: str) -> str:
-    """Get the full spec hash used for checkpointing and manifests."""
+    """Get the full spec hash used for checkpointing and manifests.
+
+    Memoized: a run hashes the same (often 100KB+) spec object at start-up
+    and again when its run log is saved without a recorded hash.
+    """
     return hashlib.sha256(spec.encode()).hexdigest()
 
 
@@ -834,18 +1416,67 @@ USAGE_BOOST_PER_MATCH = 0.05
 USAGE_BOOST_CAP = 0.3
 
 
+RESOLVED_CONCERNS_LOG = STATS_DIR / "resolved_concerns.log"
+
+
+def _empty_resolved_concerns() -> dict:
+    return {"concerns": [], "last_updated": None}
+
+
+def _replay_resolved_concerns_records(data: dict, records: list[dict]) -> None:
+    """Fold logged add/match/verify records into the resolved concerns database.
+
+    Concerns are indexed by id once, so replaying a long log of matches is
+    linear in the log rather than log length x database size.
+    """
+    concerns = data.setdefault("concerns", [])
+    by_id: dict = {}
+    for concern in concerns:
+        by_id.setdefault(concern.get("id"), concern)
+    for record in records:
+        op = record.get("op")
+        ts = record.get("ts")
+        if op == "add":
+            concerns.append(record["concern"])
+            by_id.setdefault(record["concern"].get("id"), record["concern"])
+        elif op in ("match", "verify"):
+            concern = by_id.get(record.get("id"))
+            if concern is not None:
+                if op == "match":
+                    concern["times_matched"] = concern.get("times_matched", 0) + 1
+                    concern["last_matched"] = ts
+                else:
+                    concern["verified_at"] = ts
+        data["last_updated"] = ts
+
+
+def _log_resolved_concerns_record(record: dict) -> None:
+    """Append one record to the resolved concerns log (compacted on load)."""
+    record = {"ts": datetime.now().isoformat(), **record}
+    with _lock_for(RESOLVED_CONCERNS_LOG):
+        _append_log_record(RESOLVED_CONCERNS_LOG, record)
+
+
 def load_resolved_concerns() -> dict:
-    """Load resolved concerns database."""
-    data = _load_json_safe(RESOLVED_CONCERNS_FILE)
-    if not isinstance(data, dict):
-        return {"concerns": [], "last_updated": None}
+    """Load resolved concerns database (snapshot plus pending log records)."""
+    flush_gauntlet_runs()
+    with _lock_for(RESOLVED_CONCERNS_LOG):
+        data, replayed = _load_log_backed(
+            RESOLVED_CONCERNS_FILE,
+            RESOLVED_CONCERNS_LOG,
+            _empty_resolved_concerns,
+            _replay_resolved_concerns_records,
+        )
+        if replayed >= LOG_COMPACT_THRESHOLD:
+            _write_snapshot(RESOLVED_CONCERNS_FILE, RESOLVED_CONCERNS_LOG, data)
     return data
 
 
 def save_resolved_concerns(data: dict) -> None:
-    """Save resolved concerns database."""
+    """Save resolved concerns database as a full snapshot."""
     data["last_updated"] = datetime.now().isoformat()
-    _write_json_atomic(RESOLVED_CONCERNS_FILE, data)
+    with _lock_for(RESOLVED_CONCERNS_LOG):
+        _write_snapshot(RESOLVED_CONCERNS_FILE, RESOLVED_CONCERNS_LOG, data)
 
 
 def add_resolved_concern(
@@ -856,8 +1487,7 @@ def add_resolved_concern(
     confidence: float = 0.9,
 ) -> None:
     """Add a resolved concern to the database."""
-    data = load_resolved_concerns()
-    data["concerns"].append({
+    concern = {
         "id": str(uuid.uuid4()),
         "pattern": pattern,
         "explanation": explanation,
@@ -868,35 +1498,40 @@ def add_resolved_concern(
         "times_matched": 0,
         "last_matched": None,
         "verified_at": None,
-    })
-    save_resolved_concerns(data)
+    }
+    _log_resolved_concerns_record({"op": "add", "concern": concern})
 
 
-def calculate_explanation_confidence(
-    explanation: dict,
-    current_spec_hash: Optional[str] = None,
-) -> tuple[float, str]:
-    """Calculate current confidence in an explanation.
+@lru_cache(maxsize=2048)
+def _parse_reference_date(value: str) -> datetime:
+    """Parse an explanation timestamp to a naive datetime.
 
-    Factors: age decay, spec change, usage boost, manual verification.
+    Explanations are re-scored for every concern in a run, so the same few
+    timestamps are parsed over and over; they never change once written.
+    Raises ValueError on malformed input, like datetime.fromisoformat.
     """
-    base_confidence = explanation.get("confidence", 0.9)
-    added_at = explanation.get("added_at", "")
-    verified_at = explanation.get("verified_at")
-    spec_hash = explanation.get("spec_hash")
-    times_matched = explanation.get("times_matched", 0)
-
+    ref = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if ref.tzinfo is not None:
+        ref = ref.replace(tzinfo=None)
+    return ref
+
+
+@lru_cache(maxsize=2048)
+def _explanation_confidence(
+    base_confidence: float,
+    age_days: Optional[int],
+    verified: bool,
+    spec_changed: bool,
+    times_matched: int,
+) -> tuple[float, str]:
+    """Score an explanation from its already-extracted inputs (age None = bad date)."""
     factors = []
     final_confidence = base_confidence
 
-    reference_date = verified_at or added_at
-    try:
-        ref = datetime.fromisoformat(reference_date.replace("Z", "+00:00"))
-        now = datetime.now()
-        if ref.tzinfo is not None:
-            ref = ref.replace(tzinfo=None)
-        age_days = (now - ref).days
-
+    if age_days is None:
+        factors.append("invalid date")
+        final_confidence *= 0.5
+    else:
         age_factor = math.pow(0.5, age_days / AGE_DECAY_HALFLIFE_DAYS)
         final_confidence *= age_factor
 
@@ -904,13 +1539,10 @@ def calculate_explanation_confidence(
             factors.append(f"old ({age_days}d)")
         elif age_days > 14:
             factors.append(f"aging ({age_days}d)")
-        elif verified_at:
+        elif verified:
             factors.append(f"verified {age_days}d ago")
-    except (ValueError, TypeError):
-        factors.append("invalid date")
-        final_confidence *= 0.5
 
-    if current_spec_hash and spec_hash and current_spec_hash != spec_hash:
+    if spec_changed:
         final_confidence *= SPEC_CHANGE_PENALTY
         factors.append("spec changed")
 
@@ -924,22 +1556,37 @@ def calculate_explanation_confidence(
     return round(min(final_confidence, 0.99), 3), reason
 
 
+def calculate_explanation_confidence(
+    explanation: dict,
+    current_spec_hash: Optional[str] = None,
+) -> tuple[float, str]:
+    """Calculate current confidence in an explanation.
+
+    Factors: age decay, spec change, usage boost, manual verification.
+    """
+    verified_at = explanation.get("verified_at")
+    spec_hash = explanation.get("spec_hash")
+
+    reference_date = verified_at or explanation.get("added_at", "")
+    try:
+        age_days: Optional[int] = (datetime.now() - _parse_reference_date(reference_date)).days
+    except (ValueError, TypeError):
+        age_days = None
+
+    return _explanation_confidence(
+        explanation.get("confidence", 0.9),
+        age_days,
+        bool(verified_at),
+        bool(current_spec_hash and spec_hash and current_spec_hash != spec_hash),
+        explanation.get("times_matched", 0),
+    )
+
+
 def record_explanation_match(explanation_id: str) -> None:
     """Record that an explanation was matched (for confidence boosting)."""
-    data = load_resolved_concerns()
-    for concern in data["concerns"]:
-        if concern.get("id") == explanation_id:
-            concern["times_matched"] = concern.get("times_matched", 0) + 1
-            concern["last_matched"] = datetime.now().isoformat()
-            break
-    save_resolved_concerns(data)
+    _log_resolved_concerns_record({"op": "match", "id": explanation_id})
 
 
 def verify_explanation(explanation_id: str) -> None:
     """Manually mark an explanation as re-verified (resets age decay)."""
-    data = load_resolved_concerns()
-    for concern in data["concerns"]:
-        if concern.get("id") == explanation_id:
-            concern["verified_at"] = datetime.now().isoformat()
-            break
-    save_resolved_concerns(data)
+    _log_resolved_concerns_record({"op": "verify", "id": explanation_id})
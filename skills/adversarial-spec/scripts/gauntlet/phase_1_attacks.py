@@ -7,6 +7,7 @@ with rate-limited batching per provider.
 from __future__ import annotations
 
 import concurrent.futures
+import itertools
 import json
 import re
 import sys
@@ -19,6 +20,7 @@ from gauntlet.model_dispatch import (
     _get_model_provider,
     call_model,
     get_rate_limit_config,
+    shared_executor,
 )
 from gauntlet.prompts import (
     ATTACK_SYSTEM_PROMPT,
@@ -103,6 +105,15 @@ _SEVERITY_INLINE_PATTERN = re.compile(
 )
 
 
+# One list item per (already stripped) response line: a numbered item such as
+# "1. ", "12) " or a markdown header "### 3. ", or a "-", "*" or "•" bullet.
+# Leading markers are consumed so the groups hold only the item text.
+_LIST_ITEM_RE = re.compile(
+    r"(?:#[# ]*)?\d+(?:\.\s|\))[\s.)-]*(?P<numbered>.*)"
+    r"|[-•*][-•* ]*(?P<bullet>.*)"
+)
+
+
 def _extract_severity_from_text(text: str) -> tuple[str, str]:
     """Pull a severity marker off the front (or from inline) of a concern.
 
@@ -174,27 +185,16 @@ def parse_numbered_list(
         if not line:
             continue
 
-        is_numbered = False
-        if line[0].isdigit() and (". " in line[:8] or ")" in line[:8]):
-            is_numbered = True
-        elif line.startswith("#"):
-            stripped_hashes = line.lstrip("# ")
-            if stripped_hashes and stripped_hashes[0].isdigit() and (
-                ". " in stripped_hashes[:8] or ")" in stripped_hashes[:8]
-            ):
-                is_numbered = True
-
-        if is_numbered:
+        m = _LIST_ITEM_RE.match(line)
+        if m is None:
+            if current_concern_lines:
+                current_concern_lines.append(line)
+        elif m.group("numbered") is not None:
             flush_concern()
-            text = line.lstrip("#").lstrip(" ").lstrip("0123456789.-) ").strip()
-            if text:
-                current_concern_lines.append(text)
-        elif line.startswith(("-", "•", "*")):
-            text = line.lstrip("-•* ").strip()
-            if text and current_concern_lines:
-                current_concern_lines.append(text)
-        elif current_concern_lines:
-            current_concern_lines.append(line)
+            if m.group("numbered"):
+                current_concern_lines.append(m.group("numbered"))
+        elif m.group("bullet") and current_concern_lines:
+            current_concern_lines.append(m.group("bullet"))
 
     flush_concern()
     return local_concerns
@@ -228,7 +228,6 @@ def generate_attacks(
     if not models:
         raise ValueError("At least one attack model is required")
 
-    concerns: list[Concern] = []
     timing: dict[str, float] = {}
     raw_responses: dict[str, str] = {}
 
@@ -318,51 +317,86 @@ def generate_attacks(
     for adv, model in pairs:
         by_provider[_get_model_provider(model)].append((adv, model))
 
+    # Each pair's concern list is kept as returned and flattened once at the
+    # end, in pair order, so the output no longer depends on completion order.
+    concerns_by_pair: dict[tuple[str, str], list[Concern]] = {}
+
     def collect_result(future, adv_key, model):
         adv_concerns, elapsed, raw_response = future.result()
-        concerns.extend(adv_concerns)
+        concerns_by_pair.setdefault((adv_key, model), []).extend(adv_concerns)
         timing[f"{adv_key}@{model}"] = elapsed
         if raw_response:
             raw_responses[f"{adv_key}@{model}"] = raw_response
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, len(pairs) or 1)) as executor:
-        all_futures: dict[concurrent.futures.Future, tuple[str, str]] = {}
-
-        for provider, provider_pairs in by_provider.items():
-            batch_size, batch_delay = get_rate_limit_config(provider_pairs[0][1])
-
-            for batch_idx in range(0, len(provider_pairs), batch_size):
-                batch = provider_pairs[batch_idx:batch_idx + batch_size]
-                if batch_idx > 0:
-                    print(
-                        f"  Rate limit pause: {batch_delay}s before {provider} batch "
-                        f"{batch_idx // batch_size + 1}/{(len(provider_pairs) + batch_size - 1) // batch_size}...",
-                        file=sys.stderr,
-                    )
-                    time.sleep(batch_delay)
-
-                for adv, model in batch:
-                    future = executor.submit(run_adversary_with_model, adv, model)
-                    all_futures[future] = (adv, model)
-
-        for future in concurrent.futures.as_completed(all_futures):
-            adv_key, model = all_futures[future]
+    # Each provider's batches are staggered by its own delay, but providers
+    # ramp up side by side: one schedule sorted by launch offset, so a slow
+    # free-tier provider's pauses never hold back another provider's launches.
+    schedule: list[tuple[float, str, int, int, list[tuple[str, str]]]] = []
+    for provider, provider_pairs in by_provider.items():
+        batch_size, batch_delay = get_rate_limit_config(provider_pairs[0][1])
+        n_batches = (len(provider_pairs) + batch_size - 1) // batch_size
+        for batch_num in range(n_batches):
+            batch = provider_pairs[batch_num * batch_size:(batch_num + 1) * batch_size]
+            schedule.append((batch_num * batch_delay, provider, batch_num, n_batches, batch))
+    schedule.sort(key=lambda entry: entry[0])
+
+    # Calls run on the shared gauntlet pool; each one holds a provider
+    # bulkhead slot, which is what caps in-flight calls per provider.
+    pending: dict[concurrent.futures.Future, tuple[str, str]] = {}
+    launch_start = time.monotonic()
+
+    def drain(timeout: float | None) -> None:
+        """Collect whatever finishes within timeout (None: wait for one)."""
+        done, _ = concurrent.futures.wait(
+            pending, timeout=timeout,
+            return_when=concurrent.futures.FIRST_COMPLETED,
+        )
+        for future in done:
+            adv_key, model = pending.pop(future)
             collect_result(future, adv_key, model)
 
+    for launch_at, provider, batch_num, n_batches, batch in schedule:
+        wait = launch_at - (time.monotonic() - launch_start)
+        if wait > 0:
+            print(
+                f"  Rate limit pause: {wait:.0f}s before {provider} batch "
+                f"{batch_num + 1}/{n_batches}...",
+                file=sys.stderr,
+            )
+            # Spend the pause collecting finished pairs rather than
+            # letting them wait for the whole schedule to launch.
+            deadline = time.monotonic() + wait
+            while pending and (remaining := deadline - time.monotonic()) > 0:
+                drain(remaining)
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+
+        for adv, model in batch:
+            future = shared_executor.submit(run_adversary_with_model, adv, model)
+            pending[future] = (adv, model)
+
+    while pending:
+        drain(None)
+
+    concerns: list[Concern] = list(itertools.chain.from_iterable(
+        concerns_by_pair.get(pair, ()) for pair in dict.fromkeys(pairs)
+    ))
+
     if timing:
         sorted_timing = sorted(timing.items(), key=lambda x: x[1], reverse=True)
         print("  Adversary timing (adversary@model):", file=sys.stderr)
+        # Counts come from the per-pair lists, not a rescan of every concern
+        # per timing entry.
         for adv_model, elapsed in sorted_timing:
             if "@" in adv_model:
                 adv, model = adv_model.split("@", 1)
+                count = len(concerns_by_pair.get((adv, model), ()))
             else:
-                adv, model = adv_model, ""
-            count = len(
-                [
-                    c for c in concerns
-                    if c.adversary == adv and (not model or c.source_model == model)
-                ]
-            )
+                count = sum(
+                    len(pair_concerns) for (adv, _), pair_concerns in concerns_by_pair.items()
+                    if adv == adv_model
+                )
             print(f"    {adv_model}: {elapsed:.1f}s ({count} concerns)", file=sys.stderr)
 
     return concerns, timing, raw_responses
@@ -6,12 +6,17 @@ in orchestrator.py (CR-8) and removed in CON-004.
 
 from __future__ import annotations
 
-import concurrent.futures
+import heapq
 import json
 import re
 import sys
+from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
 from typing import Optional
 
+from gauntlet import json_utils
+from gauntlet.clustering import _jaccard, _tokenize
 from gauntlet.core_types import (
     PROGRAMMING_BUGS,
     Concern,
@@ -19,46 +24,70 @@ from gauntlet.core_types import (
     ExplanationMatch,
     GauntletConfig,
 )
-from gauntlet.model_dispatch import call_model
+from gauntlet.model_dispatch import call_model, shared_executor
 from gauntlet.persistence import (
     CONFIDENCE_ACCEPT_THRESHOLD,
     CONFIDENCE_NOTE_THRESHOLD,
     calculate_explanation_confidence,
     load_resolved_concerns,
     record_explanation_match,
+    write_json_atomic,
 )
-from gauntlet.prompts import EXPLANATION_MATCHING_PROMPT
+from gauntlet.prompts import (
+    EXPLANATION_BATCH_MATCHING_PROMPT,
+    EXPLANATION_MATCHING_PROMPT,
+)
+
+_MATCH_RE = re.compile(r"MATCH:\s*\[?(\d+)\]?", re.IGNORECASE)
+
+# Concerns per batched matching call; keeps the prompt bounded on huge runs.
+EXPLANATION_MATCH_BATCH_SIZE = 50
+
+# Minimum token overlap (|a & b| / min(|a|, |b|)) between a concern and an
+# explanation's pattern + text before the pair is shown to the matching model.
+# Overlap rather than Jaccard because concerns are much longer than patterns;
+# the bar is low so paraphrases still reach the model.
+EXPLANATION_PREFILTER_MIN_OVERLAP = 0.15
+
+# Token Jaccard between a concern and an explanation's pattern at or above
+# which the concern is taken to be a re-raise of that resolved concern and
+# matched locally, without asking the model.
+EXPLANATION_NEAR_DUPLICATE_JACCARD = 0.85
+
+# _tokenize drops these as stopwords, but one of them flips a sentence's
+# meaning, so local matches keep them and require both sides to agree.
+_NEGATIONS = frozenset({"not", "no", "nor", "never", "without"})
+_NEGATION_WORD_RE = re.compile(r"[a-z]+")
 
 # =============================================================================
 # EXPLANATION MATCHING (Phase 3.5 pre-filter)
 # =============================================================================
 
 
-def find_matching_explanation(
-    concern_text: str,
+def _bucket_by_adversary(resolved_concerns: list[dict]) -> dict[str, list[tuple[int, dict]]]:
+    """Group explanations by adversary, keeping each one's database position."""
+    buckets: dict[str, list[tuple[int, dict]]] = defaultdict(list)
+    for pos, c in enumerate(resolved_concerns):
+        buckets[c.get("adversary")].append((pos, c))
+    return buckets
+
+
+def _relevant_explanations(
+    buckets: dict[str, list[tuple[int, dict]]],
     adversary: str,
-    model: str,
     current_spec_hash: Optional[str],
-    config: GauntletConfig,
-) -> Optional[ExplanationMatch]:
-    """Check if a concern matches any resolved explanation.
+) -> tuple[list[tuple[int, dict]], dict[int, tuple[float, str]]]:
+    """Select the explanations that apply to an adversary and score them.
 
-    Uses a cheap model to compare concern text against resolved patterns.
+    buckets comes from _bucket_by_adversary; the adversary's own and the
+    "general" explanations are merged back into database order.
 
-    Returns:
-        ExplanationMatch with action: "accept", "note", "ignore", or None
+    Returns (relevant_with_conf, confidence_info): the [index, explanation]
+    pairs worth showing the matching model, and (confidence, reason) per index.
     """
-    resolved = load_resolved_concerns()
-    if not resolved["concerns"]:
-        return None
-
-    relevant = [
-        c for c in resolved["concerns"]
-        if c.get("adversary") == adversary or c.get("adversary") == "general"
-    ]
-
-    if not relevant:
-        return None
+    own = buckets.get(adversary, [])
+    general = buckets.get("general", []) if adversary != "general" else []
+    relevant = [c for _, c in heapq.merge(own, general, key=itemgetter(0))]
 
     confidence_info = {}
     for i, c in enumerate(relevant):
@@ -69,7 +98,107 @@ def find_matching_explanation(
         (i, c) for i, c in enumerate(relevant)
         if confidence_info[i][0] >= CONFIDENCE_NOTE_THRESHOLD * 0.5
     ]
+    return relevant_with_conf, confidence_info
 
+
+@lru_cache(maxsize=4096)
+def _explanation_tokens(pattern: str, explanation: str) -> frozenset[str]:
+    """Token set for an explanation, cached since the DB rarely changes."""
+    return frozenset(_tokenize(f"{pattern} {explanation}"))
+
+
+def _token_overlap(a: set[str], b: frozenset[str]) -> float:
+    """Return |a ∩ b| / min(|a|, |b|). Either empty → 0.0."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / min(len(a), len(b))
+
+
+def _similar_explanations(
+    concern_text: str,
+    relevant_with_conf: list[tuple[int, dict]],
+) -> list[tuple[int, dict]]:
+    """Drop explanations sharing too few tokens with the concern to match it."""
+    concern_tokens = _tokenize(concern_text)
+    return [
+        (i, c) for i, c in relevant_with_conf
+        if _token_overlap(
+            concern_tokens,
+            _explanation_tokens(c.get("pattern", ""), c.get("explanation", "")),
+        ) >= EXPLANATION_PREFILTER_MIN_OVERLAP
+    ]
+
+
+def _negations(text: str) -> frozenset[str]:
+    """Negation words in text, with "n't" contractions read as "not"."""
+    words = _NEGATION_WORD_RE.findall(text.lower().replace("n't", " not"))
+    return _NEGATIONS.intersection(words)
+
+
+@lru_cache(maxsize=4096)
+def _pattern_tokens(pattern: str) -> tuple[frozenset[str], frozenset[str]]:
+    """(tokens, negations) of a resolved pattern."""
+    return frozenset(_tokenize(pattern)), _negations(pattern)
+
+
+def _near_duplicate_match(
+    concern_text: str,
+    relevant_with_conf: list[tuple[int, dict]],
+    confidence_info: dict[int, tuple[float, str]],
+) -> Optional[ExplanationMatch]:
+    """Match a concern that restates a resolved pattern almost word for word.
+
+    Adversaries re-raise the same concern run after run; those need no model
+    call. The closest pattern at or above EXPLANATION_NEAR_DUPLICATE_JACCARD
+    wins. A pattern whose negations differ from the concern's never matches
+    locally ("tokens are not validated" vs "tokens are validated"); anything
+    weaker than a near restatement goes to the model.
+    """
+    concern_tokens = _tokenize(concern_text)
+    concern_negations = _negations(concern_text)
+    best_score = EXPLANATION_NEAR_DUPLICATE_JACCARD
+    best: Optional[tuple[int, dict]] = None
+    for i, expl in relevant_with_conf:
+        pattern_tokens, pattern_negations = _pattern_tokens(expl.get("pattern", ""))
+        if pattern_negations != concern_negations:
+            continue
+        score = _jaccard(concern_tokens, pattern_tokens)
+        if score >= best_score:
+            best_score, best = score, (i, expl)
+    if best is None:
+        return None
+    i, expl = best
+    confidence, reason = confidence_info[i]
+    return ExplanationMatch(
+        explanation=expl,
+        confidence=confidence,
+        reason=reason,
+        action=_action_for_confidence(confidence),
+    )
+
+
+def _action_for_confidence(confidence: float) -> str:
+    """Map an explanation's current confidence to accept/note/ignore."""
+    if confidence >= CONFIDENCE_ACCEPT_THRESHOLD:
+        return "accept"
+    if confidence >= CONFIDENCE_NOTE_THRESHOLD:
+        return "note"
+    return "ignore"
+
+
+def _match_explanation(
+    concern_text: str,
+    relevant_with_conf: list[tuple[int, dict]],
+    confidence_info: dict[int, tuple[float, str]],
+    model: str,
+    config: GauntletConfig,
+) -> Optional[ExplanationMatch]:
+    """Ask the matching model whether any pre-scored explanation covers a concern.
+
+    Explanations with no meaningful token overlap are dropped first; if none
+    remain, the model is not called.
+    """
+    relevant_with_conf = _similar_explanations(concern_text, relevant_with_conf)
     if not relevant_with_conf:
         return None
 
@@ -98,27 +227,18 @@ Does any existing explanation FULLY address this concern?"""
             timeout=config.timeout,
         )
 
-        if "MATCH:" in response.upper():
-            match = re.search(r"MATCH:\s*\[?(\d+)\]?", response.upper())
-            if match:
-                idx = int(match.group(1))
-                for orig_idx, expl in relevant_with_conf:
-                    if orig_idx == idx:
-                        confidence, reason = confidence_info[idx]
-
-                        if confidence >= CONFIDENCE_ACCEPT_THRESHOLD:
-                            action = "accept"
-                        elif confidence >= CONFIDENCE_NOTE_THRESHOLD:
-                            action = "note"
-                        else:
-                            action = "ignore"
-
-                        return ExplanationMatch(
-                            explanation=expl,
-                            confidence=confidence,
-                            reason=reason,
-                            action=action,
-                        )
+        match = _MATCH_RE.search(response)
+        if match:
+            idx = int(match.group(1))
+            for orig_idx, expl in relevant_with_conf:
+                if orig_idx == idx:
+                    confidence, reason = confidence_info[idx]
+                    return ExplanationMatch(
+                        explanation=expl,
+                        confidence=confidence,
+                        reason=reason,
+                        action=_action_for_confidence(confidence),
+                    )
 
     except Exception as e:
         if isinstance(e, PROGRAMMING_BUGS):
@@ -127,6 +247,126 @@ Does any existing explanation FULLY address this concern?"""
     return None
 
 
+def find_matching_explanation(
+    concern_text: str,
+    adversary: str,
+    model: str,
+    current_spec_hash: Optional[str],
+    config: GauntletConfig,
+) -> Optional[ExplanationMatch]:
+    """Check if a concern matches any resolved explanation.
+
+    Uses a cheap model to compare concern text against resolved patterns.
+
+    Returns:
+        ExplanationMatch with action: "accept", "note", "ignore", or None
+    """
+    resolved = load_resolved_concerns()
+    if not resolved["concerns"]:
+        return None
+
+    relevant_with_conf, confidence_info = _relevant_explanations(
+        _bucket_by_adversary(resolved["concerns"]), adversary, current_spec_hash
+    )
+    return _match_explanation(concern_text, relevant_with_conf, confidence_info, model, config)
+
+
+def _match_explanations_batch(
+    concerns: list[Concern],
+    candidates: dict[str, tuple[list[tuple[int, dict]], dict[int, tuple[float, str]]]],
+    model: str,
+    config: GauntletConfig,
+) -> Optional[dict[int, ExplanationMatch]]:
+    """Match a batch of concerns against their explanations in one model call.
+
+    Explanations are numbered once across the batch; a match only counts if
+    the explanation was a candidate for that concern's adversary and passed
+    the token-overlap prefilter.
+
+    Returns:
+        {position in concerns: ExplanationMatch} for matched concerns, or
+        None if the response could not be parsed (caller falls back to
+        per-concern matching).
+    """
+    shown: list[tuple[dict, float, str]] = []
+    index_of: dict[int, int] = {}
+    allowed: list[set[int]] = []
+    for concern in concerns:
+        relevant_with_conf, confidence_info = candidates[concern.adversary]
+        concern_allowed = set()
+        for i, expl in _similar_explanations(concern.text, relevant_with_conf):
+            idx = index_of.get(id(expl))
+            if idx is None:
+                idx = index_of[id(expl)] = len(shown)
+                shown.append((expl, *confidence_info[i]))
+            concern_allowed.add(idx)
+        allowed.append(concern_allowed)
+
+    if not shown:
+        return {}
+
+    concerns_text = "\n".join(
+        f"[{pos}] ({concern.adversary}) {concern.text}"
+        for pos, concern in enumerate(concerns)
+        if allowed[pos]
+    )
+    explanations_text = "\n".join(
+        f"[{idx}] ({expl.get('adversary')}) Pattern: {expl['pattern']}\n"
+        f"    Explanation: {expl['explanation']}\n"
+        f"    Confidence: {confidence:.0%} ({reason})"
+        for idx, (expl, confidence, reason) in enumerate(shown)
+    )
+    user_prompt = f"""NEW CONCERNS:
+{concerns_text}
+
+EXISTING EXPLANATIONS:
+{explanations_text}
+
+Which existing explanation, if any, FULLY addresses each concern?"""
+
+    try:
+        response, _, _ = call_model(
+            model=model,
+            system_prompt=EXPLANATION_BATCH_MATCHING_PROMPT,
+            user_message=user_prompt,
+            timeout=config.timeout,
+            json_mode=True,
+        )
+    except Exception as e:
+        if isinstance(e, PROGRAMMING_BUGS):
+            raise
+        return {}
+
+    json_str = json_utils.extract_first_json(response)
+    if json_str is None:
+        return None
+    try:
+        data = json_utils.loads(json_str)
+    except ValueError:
+        return None
+    entries = data.get("matches") if isinstance(data, dict) else None
+    if not isinstance(entries, list):
+        return None
+
+    matches: dict[int, ExplanationMatch] = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        pos, idx = entry.get("c"), entry.get("e")
+        if not isinstance(pos, int) or not isinstance(idx, int):
+            continue
+        if not 0 <= pos < len(concerns) or idx not in allowed[pos]:
+            continue
+        expl, confidence, reason = shown[idx]
+        matches[pos] = ExplanationMatch(
+            explanation=expl,
+            confidence=confidence,
+            reason=reason,
+            action=_action_for_confidence(confidence),
+        )
+    return matches
+
+
 def filter_concerns_with_explanations(
     concerns: list[Concern],
     model: str,
@@ -135,6 +375,12 @@ def filter_concerns_with_explanations(
 ) -> tuple[list[Concern], list[Concern], list[tuple[Concern, ExplanationMatch]]]:
     """Filter concerns against resolved explanations database.
 
+    The database is loaded and scored once per adversary up front. Concerns
+    that restate a resolved pattern nearly verbatim are matched locally; the
+    rest are matched in batches of EXPLANATION_MATCH_BATCH_SIZE per model
+    call. Batches whose response can't be parsed fall back to one call per
+    concern.
+
     Returns:
         (filtered_concerns, dropped_concerns, noted_concerns)
     """
@@ -142,31 +388,77 @@ def filter_concerns_with_explanations(
     dropped = []
     noted = []
 
+    resolved = load_resolved_concerns()
+    if not resolved["concerns"]:
+        return list(concerns), dropped, noted
+
+    buckets = _bucket_by_adversary(resolved["concerns"])
+    candidates = {
+        adversary: _relevant_explanations(buckets, adversary, spec_hash)
+        for adversary in {c.adversary for c in concerns}
+    }
+
+    results: list[tuple[Concern, Optional[ExplanationMatch]]] = []
+    pending: list[Concern] = []
+    for concern in concerns:
+        match = _near_duplicate_match(concern.text, *candidates[concern.adversary])
+        if match is None:
+            pending.append(concern)
+        else:
+            results.append((concern, match))
+    if results:
+        print(
+            f"  Matched {len(results)} re-raised concerns locally",
+            file=sys.stderr,
+        )
+
+    unbatched: list[Concern] = []
+    for start in range(0, len(pending), EXPLANATION_MATCH_BATCH_SIZE):
+        batch = pending[start:start + EXPLANATION_MATCH_BATCH_SIZE]
+        matches = _match_explanations_batch(batch, candidates, model, config)
+        if matches is None:
+            unbatched.extend(batch)
+            continue
+        results.extend((concern, matches.get(pos)) for pos, concern in enumerate(batch))
+
+    if unbatched:
+        print(
+            f"  Warning: batched explanation matching unparseable; "
+            f"matching {len(unbatched)} concerns individually",
+            file=sys.stderr,
+        )
+
     def check_concern(concern: Concern) -> tuple[Concern, Optional[ExplanationMatch]]:
-        match = find_matching_explanation(
+        relevant_with_conf, confidence_info = candidates[concern.adversary]
+        match = _match_explanation(
             concern.text,
-            concern.adversary,
+            relevant_with_conf,
+            confidence_info,
             model,
-            spec_hash,
             config,
         )
         return concern, match
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        futures = [executor.submit(check_concern, c) for c in concerns]
-        for future in concurrent.futures.as_completed(futures):
-            concern, match = future.result()
-
-            if match is None:
-                filtered.append(concern)
-            elif match.action == "accept":
-                dropped.append(concern)
-                record_explanation_match(match.explanation.get("id", ""))
-            elif match.action == "note":
-                noted.append((concern, match))
-                filtered.append(concern)
-            else:
-                filtered.append(concern)
+    if unbatched:
+        # call_model holds a provider bulkhead slot per call, which caps
+        # in-flight calls; the shared pool just supplies the threads.
+        results.extend(shared_executor.map(check_concern, unbatched))
+
+    # Local matches were collected first; report in the caller's order.
+    position = {id(concern): pos for pos, concern in enumerate(concerns)}
+    results.sort(key=lambda result: position[id(result[0])])
+
+    for concern, match in results:
+        if match is None:
+            filtered.append(concern)
+        elif match.action == "accept":
+            dropped.append(concern)
+            record_explanation_match(match.explanation.get("id", ""))
+        elif match.action == "note":
+            noted.append((concern, match))
+            filtered.append(concern)
+        else:
+            filtered.append(concern)
 
     return filtered, dropped, noted
 
@@ -214,7 +506,7 @@ def _track_dedup_stats(
     existing: list = []
     if stats_file.exists():
         try:
-            existing = json.loads(stats_file.read_text())
+            existing = json_utils.loads(stats_file.read_bytes())
         except (json.JSONDecodeError, OSError):
             existing = []
 
@@ -230,7 +522,7 @@ def _track_dedup_stats(
         "clustering_model": clustering_model,
     }
     existing.append(entry)
-    stats_file.write_text(json.dumps(existing, indent=2) + "\n")
+    write_json_atomic(stats_file, existing, indent=None)
 
     if len(existing) >= 2:
         avg_reduction = sum(e["reduction_pct"] for e in existing) / len(existing)
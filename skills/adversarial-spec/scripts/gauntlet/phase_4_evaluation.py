@@ -7,18 +7,151 @@ concern evaluation with consensus algorithm.
 from __future__ import annotations
 
 import concurrent.futures
-import json
+import dataclasses
 import sys
 import time
+from collections import Counter
+from functools import lru_cache
+from typing import Callable, Optional
 
 from adversaries import ADVERSARIES
+from gauntlet.batch_api import run_chat_batch, supports_batch_api
 from gauntlet.batch_tiering import BatchTier
 from gauntlet.core_types import PROGRAMMING_BUGS, Concern, Evaluation, GauntletConfig
+from gauntlet.json_utils import decode_first_object
 from gauntlet.model_dispatch import (
     call_model,
     get_rate_limit_config,
+    shared_executor,
 )
-from gauntlet.prompts import EVALUATION_SYSTEM_PROMPT
+from gauntlet.prompts import EVALUATION_CONFIDENCE_PROMPT, EVALUATION_SYSTEM_PROMPT
+
+# Cascade evaluation: first-pass verdicts at or above this self-reported
+# confidence are final; the rest go to the multi-model ensemble.
+CASCADE_CONFIDENCE_THRESHOLD = 0.8
+
+# Reasoning on the deferred placeholders evaluate_concerns returns when a
+# call fails or its reply has no JSON.
+EVALUATION_FAILED_REASONING = "Evaluation failed"
+
+
+def _format_protocol_block(
+    adv_key: str, valid_dismissal: str, invalid_dismissal: str, rule: str
+) -> str:
+    return (
+        f"\n### When evaluating {adv_key}:\n"
+        f"Valid dismissal: {valid_dismissal}\n"
+        f"Invalid dismissal: {invalid_dismissal}\n"
+        f"Rule: {rule}\n"
+    )
+
+
+# Response-protocol section for each known adversary, formatted once at import
+# instead of on every evaluation call.
+_PROTOCOL_BLOCKS: dict[str, str] = {
+    key: _format_protocol_block(
+        key, adversary.valid_dismissal, adversary.invalid_dismissal, adversary.rule
+    )
+    for key, adversary in ADVERSARIES.items()
+}
+
+
+def _protocol_block(adv_key: str) -> str:
+    """Return the response-protocol section for an adversary key."""
+    block = _PROTOCOL_BLOCKS.get(adv_key)
+    if block is None:
+        block = _format_protocol_block(
+            adv_key,
+            "Use your judgment",
+            "Be careful of handwaving",
+            "Be rigorous",
+        )
+    return block
+
+
+@lru_cache(maxsize=64)
+def _evaluation_system_prompt(
+    adversary_keys: tuple[str, ...], with_confidence: bool = False
+) -> str:
+    """System prompt for a batch with these (sorted) adversaries.
+
+    Batches over the same adversary mix reuse one formatted prompt.
+    with_confidence also asks for a per-verdict confidence (cascade first
+    pass only).
+    """
+    protocols_text = "".join(_protocol_block(adv_key) for adv_key in adversary_keys)
+    prompt = EVALUATION_SYSTEM_PROMPT.format(protocols_text=protocols_text)
+    if with_confidence:
+        prompt += EVALUATION_CONFIDENCE_PROMPT
+    return prompt
+
+
+def _spec_prefix(spec: str) -> str:
+    """The spec section every evaluation user message starts with."""
+    return f"## SPECIFICATION\n{spec}\n\n"
+
+
+def _build_evaluation_prompts(
+    spec: str, concerns: list[Concern], with_confidence: bool = False
+) -> tuple[str, str]:
+    """Return (system_prompt, user_message) for evaluating one batch."""
+    concerns_text = "\n\n".join([
+        f"### Concern {i+1} (from {c.adversary})\n{c.text}"
+        for i, c in enumerate(concerns)
+    ])
+
+    # Sorted so batches with the same adversaries get a byte-identical system
+    # prompt, and with it a shared (provider-cacheable) system + spec prefix.
+    system_prompt = _evaluation_system_prompt(
+        tuple(sorted({c.adversary for c in concerns})), with_confidence
+    )
+
+    # Spec first and concerns after, so the spec is part of the prefix that
+    # every batch for a model shares (see call_model's cache_prefix).
+    user_message = _spec_prefix(spec) + f"""## CONCERNS TO EVALUATE
+{concerns_text}
+
+Evaluate each concern according to the response protocols. Output valid JSON."""
+    return system_prompt, user_message
+
+
+def _parse_evaluations(response: str, concerns: list[Concern]) -> Optional[list[Evaluation]]:
+    """Map an evaluation reply onto the batch, or None if it has no JSON.
+
+    Verdicts are keyed by concern_index, not reply order: models reorder,
+    repeat or skip items in long batches, and _batch_consensus lines models
+    up by position. The first verdict for an index wins; concerns the model
+    skipped come back deferred.
+    """
+    data = decode_first_object(response)
+    if data is None:
+        return None
+    by_index: dict[int, Evaluation] = {}
+    for eval_data in data.get("evaluations", []):
+        idx = eval_data.get("concern_index")
+        if not isinstance(idx, int) or not 0 <= idx < len(concerns) or idx in by_index:
+            continue
+        severity = eval_data.get("severity", "")
+        if severity not in ("high", "medium", "low"):
+            severity = ""
+        confidence = eval_data.get("confidence")
+        if isinstance(confidence, bool) or not isinstance(confidence, (int, float)):
+            confidence = None
+        elif not 0.0 <= confidence <= 1.0:
+            confidence = None
+        by_index[idx] = Evaluation(
+            concern=concerns[idx],
+            verdict=eval_data.get("verdict", "deferred"),
+            reasoning=eval_data.get("reasoning", ""),
+            severity=severity,
+            confidence=confidence,
+        )
+    return [
+        by_index.get(i) or Evaluation(
+            concern=c, verdict="deferred", reasoning="Not evaluated by model"
+        )
+        for i, c in enumerate(concerns)
+    ]
 
 
 def evaluate_concerns(
@@ -26,6 +159,7 @@ def evaluate_concerns(
     concerns: list[Concern],
     model: str,
     config: GauntletConfig,
+    prompts: Optional[tuple[str, str]] = None,
 ) -> list[Evaluation]:
     """Phase 4: Evaluate each concern using the frontier model.
 
@@ -34,6 +168,8 @@ def evaluate_concerns(
         concerns: List of concerns to evaluate
         model: Frontier model for evaluation
         config: Gauntlet configuration (timeout)
+        prompts: (system_prompt, user_message) already built for this batch by
+            _build_evaluation_prompts, so several models can share one copy
 
     Returns:
         List of Evaluation objects
@@ -41,34 +177,7 @@ def evaluate_concerns(
     if not concerns:
         return []
 
-    concerns_text = "\n\n".join(
-        f"### Concern {i+1} (from {c.adversary})\n{c.text}"
-        for i, c in enumerate(concerns)
-    )
-
-    protocols_text = ""
-    for adv_key in set(c.adversary for c in concerns):
-        adversary = ADVERSARIES.get(adv_key)
-        if adversary:
-            protocols_text += f"\n### When evaluating {adv_key}:\n"
-            protocols_text += f"Valid dismissal: {adversary.valid_dismissal}\n"
-            protocols_text += f"Invalid dismissal: {adversary.invalid_dismissal}\n"
-            protocols_text += f"Rule: {adversary.rule}\n"
-        else:
-            protocols_text += f"\n### When evaluating {adv_key}:\n"
-            protocols_text += "Valid dismissal: Use your judgment\n"
-            protocols_text += "Invalid dismissal: Be careful of handwaving\n"
-            protocols_text += "Rule: Be rigorous\n"
-
-    system_prompt = EVALUATION_SYSTEM_PROMPT.format(protocols_text=protocols_text)
-
-    user_message = f"""## SPECIFICATION
-{spec}
-
-## CONCERNS TO EVALUATE
-{concerns_text}
-
-Evaluate each concern according to the response protocols. Output valid JSON."""
+    system_prompt, user_message = prompts or _build_evaluation_prompts(spec, concerns)
 
     try:
         response, in_tokens, out_tokens = call_model(
@@ -77,32 +186,14 @@ Evaluate each concern according to the response protocols. Output valid JSON."""
             user_message=user_message,
             timeout=config.timeout,
             codex_reasoning=config.eval_codex_reasoning,
+            stop_after_json=True,
+            cache_prefix=_spec_prefix(spec),
         )
-        json_start = response.find("{")
-        json_end = response.rfind("}") + 1
-        if json_start >= 0 and json_end > json_start:
-            json_str = response[json_start:json_end]
-            data = json.loads(json_str)
-
-            evaluations = []
-            for eval_data in data.get("evaluations", []):
-                idx = eval_data.get("concern_index", 0)
-                if idx < len(concerns):
-                    severity = eval_data.get("severity", "")
-                    if severity not in ("high", "medium", "low"):
-                        severity = ""
-                    evaluations.append(
-                        Evaluation(
-                            concern=concerns[idx],
-                            verdict=eval_data.get("verdict", "deferred"),
-                            reasoning=eval_data.get("reasoning", ""),
-                            severity=severity,
-                        )
-                    )
+        evaluations = _parse_evaluations(response, concerns)
+        if evaluations is not None:
             return evaluations
+        print("Warning: No evaluation JSON in model response", file=sys.stderr)
 
-    except json.JSONDecodeError as e:
-        print(f"Warning: Failed to parse evaluation JSON: {e}", file=sys.stderr)
     except Exception as e:
         if isinstance(e, PROGRAMMING_BUGS):
             raise
@@ -110,17 +201,168 @@ Evaluate each concern according to the response protocols. Output valid JSON."""
 
     # Fallback: defer all concerns
     return [
-        Evaluation(concern=c, verdict="deferred", reasoning="Evaluation failed")
+        Evaluation(concern=c, verdict="deferred", reasoning=EVALUATION_FAILED_REASONING)
         for c in concerns
     ]
 
 
+def is_failed_batch(evaluations: list[Evaluation]) -> bool:
+    """True for a batch evaluate_concerns could not evaluate (placeholders only).
+
+    Such batches must not be journaled: --resume would replay the
+    placeholders instead of retrying the batch.
+    """
+    return all(e.reasoning == EVALUATION_FAILED_REASONING for e in evaluations)
+
+
+def _evaluate_via_batch_api(
+    spec: str,
+    batches: list[list[Concern]],
+    batch_prompts: list[tuple[str, str]],
+    model: str,
+    config: GauntletConfig,
+) -> list[list[Evaluation]]:
+    """Evaluate every batch for one model as a single provider batch job.
+
+    Batches the job did not answer (failed requests, unparseable replies, or
+    the whole job failing) are evaluated live, one after another: this runs
+    on the shared pool and must not wait on other tasks there.
+    """
+    requests = [
+        (str(batch_idx), system_prompt, user_message)
+        for batch_idx, (system_prompt, user_message) in enumerate(batch_prompts)
+    ]
+    try:
+        replies = run_chat_batch(model, requests)
+    except Exception as e:
+        if isinstance(e, PROGRAMMING_BUGS):
+            raise
+        print(f"  Warning: {model} batch job failed, evaluating live: {e}", file=sys.stderr)
+        replies = {}
+
+    results: list[list[Evaluation]] = []
+    for batch_idx, batch in enumerate(batches):
+        reply = replies.get(str(batch_idx))
+        evals = _parse_evaluations(reply[0], batch) if reply else None
+        if evals is None:
+            evals = evaluate_concerns(spec, batch, model, config, batch_prompts[batch_idx])
+        results.append(evals)
+    return results
+
+
+# Severity consensus picks the most conservative (highest) rating.
+_SEVERITY_RANK = {"high": 3, "medium": 2, "low": 1}
+
+
+def _batch_consensus(
+    batch: list[Concern],
+    results_by_model: dict[str, list[Evaluation]],
+    eval_models: list[str],
+) -> tuple[list[Evaluation], int]:
+    """Build consensus evaluations for one batch.
+
+    Returns (evaluations, number of concerns the models disagreed on).
+    """
+    evaluations: list[Evaluation] = []
+    disagreements = 0
+
+    # Look each model's results up once (a repeated model votes once); per
+    # concern, its column is then one index into each list instead of
+    # rebuilding per-model dicts.
+    model_results = [results_by_model.get(model, []) for model in dict.fromkeys(eval_models)]
+    lead_results = model_results[0] if model_results else []
+
+    for i, concern in enumerate(batch):
+        column = [results[i] for results in model_results if i < len(results)]
+        if not column:
+            continue
+
+        consensus_verdict = column[0].verdict
+        if all(eval_item.verdict == consensus_verdict for eval_item in column):
+            # Unanimous (the common case): nothing to tally or tie-break.
+            votes = {consensus_verdict: len(column)}
+        else:
+            disagreements += 1
+            verdict_counts = Counter(eval_item.verdict for eval_item in column)
+            max_count = verdict_counts.most_common(1)[0][1]
+            winners = [v for v, c in verdict_counts.items() if c == max_count]
+
+            if len(winners) == 1:
+                consensus_verdict = winners[0]
+            elif "accepted" in winners:
+                consensus_verdict = "accepted"
+            elif "deferred" in winners:
+                consensus_verdict = "deferred"
+            else:
+                consensus_verdict = "dismissed"
+            votes = dict(verdict_counts)
+
+        # Severity consensus: take the highest (most conservative)
+        consensus_severity = max(
+            (e.severity for e in column if e.severity in _SEVERITY_RANK),
+            key=_SEVERITY_RANK.__getitem__,
+            default="",
+        )
+
+        combined_reasoning = f"[Consensus: {votes}] "
+        if i < len(lead_results):
+            combined_reasoning += lead_results[i].reasoning
+
+        evaluations.append(Evaluation(
+            concern=concern,
+            verdict=consensus_verdict,
+            reasoning=combined_reasoning,
+            severity=consensus_severity,
+            votes=votes,
+        ))
+
+    return evaluations, disagreements
+
+
+def _evaluation_batches(
+    concerns: list[Concern], batch_size: int | list[BatchTier]
+) -> tuple[list[list[Concern]], list[list[Concern]]]:
+    """Cut concerns into evaluation batches.
+
+    Returns (groups, batches): groups are the tiers' concern lists (or just
+    concerns for a flat batch size), batches every group cut by its batch
+    size, in order.
+    """
+    if not isinstance(batch_size, list):
+        return [concerns], [
+            concerns[i:i + batch_size] for i in range(0, len(concerns), batch_size)
+        ]
+
+    tier_count = len(batch_size)
+    groups: list[list[Concern]] = []
+    batches: list[list[Concern]] = []
+    for tier_idx, tier in enumerate(batch_size, 1):
+        if not tier.concerns:
+            print(
+                f"  Tier {tier_idx}/{tier_count} '{tier.name}': empty, skipping",
+                file=sys.stderr,
+            )
+            continue
+        print(
+            f"  Tier {tier_idx}/{tier_count} '{tier.name}': "
+            f"{len(tier.concerns)} concerns @ batch={tier.batch_size}",
+            file=sys.stderr,
+        )
+        groups.append(tier.concerns)
+        batches.extend(
+            tier.concerns[i:i + tier.batch_size]
+            for i in range(0, len(tier.concerns), tier.batch_size)
+        )
+    return groups, batches
+
+
 def evaluate_concerns_multi_model(
     spec: str,
     concerns: list[Concern],
     models: list[str],
     config: GauntletConfig,
     batch_size: int | list[BatchTier] = 15,
+    on_batch: Optional[Callable[[list[Evaluation]], None]] = None,
 ) -> list[Evaluation]:
     """Phase 4: Evaluate concerns using MULTIPLE models in parallel.
 
@@ -130,195 +372,242 @@ def evaluate_concerns_multi_model(
     Args:
         spec: The specification
         concerns: List of concerns to evaluate
-        models: List of models to use (will use up to 3)
+        models: List of models to use (up to 3, duplicates dropped)
         config: Gauntlet configuration (timeout)
         batch_size: Either an int (flat batch size, default 15) OR a
             list[BatchTier] from gauntlet.batch_tiering. When a tier list is
             given, each tier's concerns are evaluated with that tier's
-            per-tier batch size, and the resulting evaluations are concatenated.
+            per-tier batch size; all tiers run concurrently and the resulting
+            evaluations are returned in tier order.
             The ``concerns`` argument is ignored in that case (the tiers
             already carry their own concern subsets).
+        on_batch: Called with each batch's consensus evaluations as soon as
+            the batch is complete (the orchestrator journals them for resume).
+            Batches a model failed on are not passed.
 
     Returns:
         List of Evaluation objects with consensus verdicts
     """
-    # Tier dispatch: run each tier independently and concat evaluations.
-    # We deliberately call the same function recursively with int batch_size
-    # rather than weaving tiers through the per-model logic — keeps the
-    # consensus / rate-limit code paths unchanged and trivially revertable.
+    # Tier dispatch: each tier is cut into batches of its own size, and the
+    # batches of every tier share one schedule below, so a slow batch in one
+    # tier no longer holds back the next tier's launch. Output stays in tier
+    # order because consensus is assembled by batch index.
+    groups, batches = _evaluation_batches(concerns, batch_size)
     if isinstance(batch_size, list):
-        if not batch_size:
-            return []
-        tier_count = len(batch_size)
-        all_evals: list[Evaluation] = []
-        for tier_idx, tier in enumerate(batch_size, 1):
-            if not tier.concerns:
-                print(
-                    f"  Tier {tier_idx}/{tier_count} '{tier.name}': empty, skipping",
-                    file=sys.stderr,
-                )
-                continue
-            print(
-                f"  Tier {tier_idx}/{tier_count} '{tier.name}': "
-                f"{len(tier.concerns)} concerns @ batch={tier.batch_size}",
-                file=sys.stderr,
-            )
-            tier_evals = evaluate_concerns_multi_model(
-                spec=spec,
-                concerns=tier.concerns,
-                models=models,
-                config=config,
-                batch_size=tier.batch_size,
-            )
-            all_evals.extend(tier_evals)
-        return all_evals
+        concerns = [c for group in groups for c in group]
 
     if not concerns:
         return []
 
-    eval_models = models[:3] if len(models) >= 3 else models
+    # A model listed twice would count as one result per batch and leave the
+    # batch waiting for a second; it also votes only once in consensus.
+    eval_models = list(dict.fromkeys(models))[:3]
 
     if len(eval_models) < 2:
         print(f"  Warning: Only {len(eval_models)} model(s) available, using single-model eval", file=sys.stderr)
-        return evaluate_concerns(spec, concerns, eval_models[0], config)
+        single_evaluations: list[Evaluation] = []
+        for group in groups:
+            group_evaluations = evaluate_concerns(spec, group, eval_models[0], config)
+            if on_batch is not None and not is_failed_batch(group_evaluations):
+                on_batch(group_evaluations)
+            single_evaluations.extend(group_evaluations)
+        return single_evaluations
 
     print(f"  Using {len(eval_models)} models: {', '.join(eval_models)}", file=sys.stderr)
-
-    batches = [concerns[i:i + batch_size] for i in range(0, len(concerns), batch_size)]
     print(f"  Processing {len(concerns)} concerns in {len(batches)} batches", file=sys.stderr)
 
-    def run_all_batches_for_model(model: str) -> dict[int, list[Evaluation]]:
-        """Run all batches for a single model, respecting its rate limit.
+    # With --batch-api, OpenAI models take their whole workload as one batch
+    # job; every other model stays on the live schedule below.
+    batch_api_models = (
+        [m for m in eval_models if supports_batch_api(m)]
+        if config.batch_api else []
+    )
 
-        Launches waves with staggered delays but does NOT wait for a wave
-        to finish before launching the next. All batches run concurrently
-        within a single executor — the delay is only between submission
-        moments, not between completions.
-        """
+    # Every (model, batch) call runs on the shared gauntlet pool. Each
+    # model's batches are staggered by its own rate-limit delay, but models
+    # ramp up side by side from one schedule sorted by launch offset, and a
+    # batch's consensus is built as soon as its last model answers.
+    schedule: list[tuple[float, str, int, list[int]]] = []
+    for model in eval_models:
+        if model in batch_api_models:
+            continue
         rate_batch_size, rate_delay = get_rate_limit_config(model)
-        results: dict[int, list[Evaluation]] = {}
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=len(batches)) as executor:
-            future_to_idx = {}
-
-            for wave_start in range(0, len(batches), rate_batch_size):
-                wave_end = min(wave_start + rate_batch_size, len(batches))
-                wave_batches = list(range(wave_start, wave_end))
-
-                if wave_start > 0:
-                    print(
-                        f"  {model}: rate limit pause {rate_delay}s before wave "
-                        f"{wave_start // rate_batch_size + 1}...",
-                        file=sys.stderr,
-                    )
-                    time.sleep(rate_delay)
-
-                for batch_idx in wave_batches:
-                    future = executor.submit(
-                        evaluate_concerns, spec, batches[batch_idx], model, config
-                    )
-                    future_to_idx[future] = batch_idx
-
-            # Collect all results after all waves launched
-            for future in concurrent.futures.as_completed(future_to_idx):
-                batch_idx = future_to_idx[future]
-                try:
-                    evals = future.result()
-                    results[batch_idx] = evals
-                    print(
-                        f"  {model}: batch {batch_idx + 1}/{len(batches)} done "
-                        f"({len(evals)} evals)",
-                        file=sys.stderr,
-                    )
-                except Exception as e:
-                    if isinstance(e, PROGRAMMING_BUGS):
-                        raise
-                    print(
-                        f"  Warning: {model} batch {batch_idx + 1} failed: {e}",
-                        file=sys.stderr,
-                    )
-                    results[batch_idx] = []
-
-        return results
-
-    model_all_results: dict[str, dict[int, list[Evaluation]]] = {}
-    with concurrent.futures.ThreadPoolExecutor(max_workers=len(eval_models)) as model_executor:
-        model_futures = {
-            model_executor.submit(run_all_batches_for_model, m): m
-            for m in eval_models
-        }
-        for future in concurrent.futures.as_completed(model_futures):
-            model = model_futures[future]
-            try:
-                model_all_results[model] = future.result()
-                total_evals = sum(len(v) for v in model_all_results[model].values())
-                print(f"  {model}: all batches complete ({total_evals} evals)", file=sys.stderr)
-            except Exception as e:
-                if isinstance(e, PROGRAMMING_BUGS):
-                    raise
-                print(f"  Warning: {model} failed entirely: {e}", file=sys.stderr)
-                model_all_results[model] = {}
-
-    # Build consensus across models for each concern
-    all_evaluations: list[Evaluation] = []
+        for wave_num, wave_start in enumerate(range(0, len(batches), rate_batch_size)):
+            wave = list(range(wave_start, min(wave_start + rate_batch_size, len(batches))))
+            schedule.append((wave_num * rate_delay, model, wave_num, wave))
+    schedule.sort(key=lambda entry: entry[0])
+
+    # Every model gets the same prompts for a batch; build each pair once
+    # instead of re-interpolating the spec per model.
+    batch_prompts = [_build_evaluation_prompts(spec, batch) for batch in batches]
+
+    batch_results: dict[int, dict[str, list[Evaluation]]] = {
+        i: {} for i in range(len(batches))
+    }
+    batch_evaluations: dict[int, list[Evaluation]] = {}
+    model_pending = {m: len(batches) for m in eval_models}
+    model_evals = dict.fromkeys(eval_models, 0)
     disagreements = 0
 
-    for batch_idx, batch in enumerate(batches):
-        for i, concern in enumerate(batch):
-            verdicts = {}
-            reasonings = {}
-            severities = {}
-
-            for model in eval_models:
-                batch_results = model_all_results.get(model, {}).get(batch_idx, [])
-                if i < len(batch_results):
-                    eval_item = batch_results[i]
-                    verdicts[model] = eval_item.verdict
-                    reasonings[model] = eval_item.reasoning
-                    if eval_item.severity in ("high", "medium", "low"):
-                        severities[model] = eval_item.severity
-
-            verdict_counts = {}
-            for v in verdicts.values():
-                verdict_counts[v] = verdict_counts.get(v, 0) + 1
-
-            if verdict_counts:
-                max_count = max(verdict_counts.values())
-                winners = [v for v, c in verdict_counts.items() if c == max_count]
-
-                if len(winners) == 1:
-                    consensus_verdict = winners[0]
-                else:
-                    if "accepted" in winners:
-                        consensus_verdict = "accepted"
-                    elif "deferred" in winners:
-                        consensus_verdict = "deferred"
-                    else:
-                        consensus_verdict = "dismissed"
-
-                if len(set(verdicts.values())) > 1:
-                    disagreements += 1
-
-                # Severity consensus: take the highest (most conservative)
-                severity_order = {"high": 3, "medium": 2, "low": 1}
-                consensus_severity = ""
-                if severities:
-                    consensus_severity = max(
-                        severities.values(),
-                        key=lambda s: severity_order.get(s, 0),
-                    )
-
-                combined_reasoning = f"[Consensus: {dict(verdict_counts)}] "
-                combined_reasoning += reasonings.get(eval_models[0], "")
-
-                all_evaluations.append(Evaluation(
-                    concern=concern,
-                    verdict=consensus_verdict,
-                    reasoning=combined_reasoning,
-                    severity=consensus_severity,
-                ))
+    # batch_idx None marks a batch-API job returning every batch's results.
+    future_to_task: dict[concurrent.futures.Future, tuple[str, Optional[int]]] = {}
+    for model in batch_api_models:
+        future = shared_executor.submit(
+            _evaluate_via_batch_api, spec, batches, batch_prompts, model, config,
+        )
+        future_to_task[future] = (model, None)
+
+    launch_start = time.monotonic()
+
+    for launch_at, model, wave_num, wave in schedule:
+        wait = launch_at - (time.monotonic() - launch_start)
+        if wait > 0:
+            print(
+                f"  {model}: rate limit pause {wait:.0f}s before wave {wave_num + 1}...",
+                file=sys.stderr,
+            )
+            time.sleep(wait)
+        for batch_idx in wave:
+            future = shared_executor.submit(
+                evaluate_concerns, spec, batches[batch_idx], model, config,
+                batch_prompts[batch_idx],
+            )
+            future_to_task[future] = (model, batch_idx)
+
+    def record(model: str, batch_idx: int, evals: list[Evaluation]) -> None:
+        nonlocal disagreements
+        batch_results[batch_idx][model] = evals
+        model_evals[model] += len(evals)
+        model_pending[model] -= 1
+        if not model_pending[model]:
+            print(
+                f"  {model}: all batches complete ({model_evals[model]} evals)",
+                file=sys.stderr,
+            )
+        if len(batch_results[batch_idx]) == len(eval_models):
+            results_by_model = batch_results.pop(batch_idx)
+            evaluations, batch_disagreements = _batch_consensus(
+                batches[batch_idx], results_by_model, eval_models
+            )
+            batch_evaluations[batch_idx] = evaluations
+            disagreements += batch_disagreements
+            # A batch any model failed on is left out of the journal, so a
+            # resumed run evaluates it again instead of replaying a partial
+            # or placeholder consensus.
+            if on_batch is not None and not any(
+                is_failed_batch(model_evals) for model_evals in results_by_model.values()
+            ):
+                on_batch(evaluations)
+
+    for future in concurrent.futures.as_completed(future_to_task):
+        model, batch_idx = future_to_task[future]
+        if batch_idx is None:
+            for job_batch_idx, evals in enumerate(future.result()):
+                record(model, job_batch_idx, evals)
+            continue
+        try:
+            evals = future.result()
+            print(
+                f"  {model}: batch {batch_idx + 1}/{len(batches)} done "
+                f"({len(evals)} evals)",
+                file=sys.stderr,
+            )
+        except Exception as e:
+            if isinstance(e, PROGRAMMING_BUGS):
+                raise
+            print(
+                f"  Warning: {model} batch {batch_idx + 1} failed: {e}",
+                file=sys.stderr,
+            )
+            evals = []
+        record(model, batch_idx, evals)
+
+    all_evaluations: list[Evaluation] = []
+    for batch_idx in range(len(batches)):
+        all_evaluations.extend(batch_evaluations.get(batch_idx, []))
 
     if disagreements > 0:
         print(f"  Model disagreements: {disagreements}/{len(concerns)}", file=sys.stderr)
 
     return all_evaluations
+
+
+def evaluate_concerns_cascade(
+    spec: str,
+    concerns: list[Concern],
+    cheap_model: str,
+    models: list[str],
+    config: GauntletConfig,
+    batch_size: int | list[BatchTier] = 15,
+    on_batch: Optional[Callable[[list[Evaluation]], None]] = None,
+    conf_threshold: float = CASCADE_CONFIDENCE_THRESHOLD,
+) -> list[Evaluation]:
+    """Phase 4 as a cascade: one cheap pass, the ensemble only where it is unsure.
+
+    cheap_model evaluates every concern over the same batches the ensemble
+    would use, asked for a per-verdict confidence that the ensemble's prompt
+    does not carry. Verdicts it reports with confidence >= conf_threshold are
+    final; deferred, failed, unscored and low-confidence concerns are
+    re-evaluated by evaluate_concerns_multi_model and take its consensus.
+
+    Args:
+        batch_size: As for evaluate_concerns_multi_model; a tier list is
+            narrowed to the escalated concerns for the ensemble pass.
+        on_batch: Receives the confident first-pass verdicts in one call,
+            then each ensemble batch as it completes.
+
+    Returns:
+        One Evaluation per concern, in input (tier) order.
+    """
+    groups, batches = _evaluation_batches(concerns, batch_size)
+    concerns = [c for group in groups for c in group]
+    if not concerns:
+        return []
+
+    print(
+        f"  Cascade: first pass on {cheap_model} ({len(batches)} batches)",
+        file=sys.stderr,
+    )
+    futures = [
+        shared_executor.submit(
+            evaluate_concerns, spec, batch, cheap_model, config,
+            _build_evaluation_prompts(spec, batch, with_confidence=True),
+        )
+        for batch in batches
+    ]
+    final: dict[int, Evaluation] = {}
+    uncertain: list[Concern] = []
+    for evaluation in (e for future in futures for e in future.result()):
+        confidence = evaluation.confidence
+        if (
+            evaluation.verdict != "deferred"
+            and confidence is not None
+            and confidence >= conf_threshold
+        ):
+            final[id(evaluation.concern)] = evaluation
+        else:
+            uncertain.append(evaluation.concern)
+    if on_batch is not None and final:
+        on_batch(list(final.values()))
+
+    print(
+        f"  Cascade: {len(final)} settled by {cheap_model}, "
+        f"{len(uncertain)} escalated to the ensemble",
+        file=sys.stderr,
+    )
+    if uncertain:
+        escalate: int | list[BatchTier] = batch_size
+        if isinstance(batch_size, list):
+            uncertain_ids = {id(c) for c in uncertain}
+            escalate = [
+                dataclasses.replace(
+                    tier, concerns=[c for c in tier.concerns if id(c) in uncertain_ids]
+                )
+                for tier in batch_size
+            ]
+        for evaluation in evaluate_concerns_multi_model(
+            spec, uncertain, models, config, batch_size=escalate, on_batch=on_batch,
+        ):
+            final[id(evaluation.concern)] = evaluation
+
+    return [final[id(c)] for c in concerns if id(c) in final]
@@ -1,19 +1,156 @@
 """Phase 5: Adversary Rebuttals.
 
 Extracted from gauntlet_monolith.py — dismissed concern rebuttals
-with rate-limited batching.
+with rate-paced dispatch.
 """
 
 from __future__ import annotations
 
 import concurrent.futures
+import dataclasses
+import re
 import sys
+import threading
+from collections import defaultdict
 from typing import Optional
 
 from adversaries import ADVERSARIES
-from gauntlet.core_types import PROGRAMMING_BUGS, Evaluation, GauntletConfig, Rebuttal
-from gauntlet.model_dispatch import call_model, get_rate_limit_config
-from gauntlet.prompts import REBUTTAL_SYSTEM_TEMPLATE, REBUTTAL_USER_TEMPLATE
+from gauntlet.clustering import _jaccard, _tokenize
+from gauntlet.core_types import (
+    PROGRAMMING_BUGS,
+    Evaluation,
+    FatalProviderError,
+    GauntletConfig,
+    Rebuttal,
+)
+from gauntlet.json_utils import decode_first_object
+from gauntlet.model_dispatch import (
+    call_model,
+    get_rate_limit_config,
+    is_fatal_provider_error,
+    shared_executor,
+)
+from gauntlet.prompts import (
+    REBUTTAL_BATCH_ITEM_TEMPLATE,
+    REBUTTAL_BATCH_USER_TEMPLATE,
+    REBUTTAL_SYSTEM_TEMPLATE,
+    REBUTTAL_USER_TEMPLATE,
+)
+
+# Jaccard threshold for treating two dismissals as the same rebuttal. Much
+# stricter than concern clustering: only near-verbatim concern + reasoning
+# pairs share a rebuttal.
+REBUTTAL_DEDUP_THRESHOLD = 0.85
+
+# Case-insensitive verdict marker; searched in place instead of upper()-copying
+# the whole response.
+_CHALLENGED_RE = re.compile(r"CHALLENGED\s*:", re.IGNORECASE)
+
+# Dismissals that point at an existing resolution ("already addressed in
+# section 4") are nearly always ACCEPTED on rebuttal; skip the model call.
+_RESOLVED_RE = re.compile(
+    r"already addressed|resolved in|covered by|see section \d",
+    re.IGNORECASE,
+)
+AUTO_ACCEPTED_RESPONSE = "AUTO-ACCEPTED (heuristic): dismissal cites an existing resolution"
+
+# Dismissals every eval model agreed on (at least two of them), with a
+# reasoning at least this long, almost never survive a rebuttal; skip the
+# call. Short or split dismissals are still challenged.
+UNANIMOUS_DISMISSAL_MIN_REASONING = 200
+UNANIMOUS_ACCEPTED_RESPONSE = (
+    "AUTO-ACCEPTED (heuristic): unanimous multi-model dismissal with a full justification"
+)
+_CONSENSUS_PREFIX_RE = re.compile(r"\[Consensus: [^\]]*\] ")
+
+
+def _is_confident_dismissal(evaluation: Evaluation) -> bool:
+    """True for a unanimous multi-model dismissal with a substantial reasoning."""
+    votes = evaluation.votes
+    if votes.get("dismissed", 0) < 2 or len(votes) != 1:
+        return False
+    reasoning = _CONSENSUS_PREFIX_RE.sub("", evaluation.reasoning, count=1)
+    return len(reasoning.strip()) >= UNANIMOUS_DISMISSAL_MIN_REASONING
+
+# Max dismissals one adversary rebuts per call. Larger batches amortize the
+# persona prompt further but make one malformed reply cost more retries.
+REBUTTAL_BATCH_SIZE = 10
+
+
+def _group_duplicate_dismissals(
+    dismissed: list[Evaluation],
+    threshold: float = REBUTTAL_DEDUP_THRESHOLD,
+) -> list[list[Evaluation]]:
+    """Group near-duplicate dismissals so each group needs one rebuttal.
+
+    Only dismissals from the same adversary are grouped — the rebuttal prompt
+    carries the adversary persona. Single-link over Jaccard similarity of
+    concern text + dismissal reasoning; the medoid (highest total similarity
+    to its siblings) is moved to the front of each group.
+    """
+    tokens = [_tokenize(f"{e.concern.text} {e.reasoning}") for e in dismissed]
+    groups_by_adv: dict[str, list[list[int]]] = defaultdict(list)
+    groups: list[list[int]] = []
+
+    for i, evaluation in enumerate(dismissed):
+        target: list[int] | None = None
+        for group in groups_by_adv[evaluation.concern.adversary]:
+            if any(_jaccard(tokens[i], tokens[j]) >= threshold for j in group):
+                target = group
+                break
+        if target is not None:
+            target.append(i)
+        else:
+            target = [i]
+            groups.append(target)
+            groups_by_adv[evaluation.concern.adversary].append(target)
+
+    result: list[list[Evaluation]] = []
+    for group in groups:
+        if len(group) > 1:
+            medoid = max(
+                group,
+                key=lambda i: sum(_jaccard(tokens[i], tokens[j]) for j in group if j != i),
+            )
+            group = [medoid] + [i for i in group if i != medoid]
+        result.append([dismissed[i] for i in group])
+    return result
+
+
+def _parse_batch_rebuttals(
+    response: str,
+    batch: list[Evaluation],
+) -> list[Optional[Rebuttal]]:
+    """Map a batched rebuttal reply onto its dismissals by 1-based index.
+
+    Entries with an unknown index or verdict are ignored, leaving None in that
+    slot. Responses keep the single-call "ACCEPTED: ..." / "CHALLENGED: ..."
+    shape so adjudication prompts read the same either way.
+    """
+    results: list[Optional[Rebuttal]] = [None] * len(batch)
+    data = decode_first_object(response)
+    entries = data.get("rebuttals") if isinstance(data, dict) else None
+    if not isinstance(entries, list):
+        return results
+
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        index = entry.get("index")
+        verdict = str(entry.get("verdict", "")).strip().lower()
+        if (
+            not isinstance(index, int)
+            or not 1 <= index <= len(batch)
+            or verdict not in ("accepted", "challenged")
+        ):
+            continue
+        text = str(entry.get("response", "")).strip()
+        results[index - 1] = Rebuttal(
+            evaluation=batch[index - 1],
+            response=f"{verdict.upper()}: {text}",
+            sustained=verdict == "challenged",
+        )
+    return results
 
 
 def run_rebuttals(
@@ -37,12 +174,43 @@ def run_rebuttals(
 
     rebuttals: list[Rebuttal] = []
 
-    def run_rebuttal(evaluation: Evaluation) -> Optional[Rebuttal]:
-        adversary_key = evaluation.concern.adversary
+    needs_rebuttal: list[Evaluation] = []
+    unanimous = 0
+    for evaluation in dismissed:
+        if _RESOLVED_RE.search(evaluation.reasoning):
+            response = AUTO_ACCEPTED_RESPONSE
+        elif _is_confident_dismissal(evaluation):
+            response = UNANIMOUS_ACCEPTED_RESPONSE
+            unanimous += 1
+        else:
+            needs_rebuttal.append(evaluation)
+            continue
+        rebuttals.append(Rebuttal(evaluation=evaluation, response=response, sustained=False))
+    if len(rebuttals) > unanimous:
+        print(
+            f"    Auto-accepted {len(rebuttals) - unanimous} dismissals citing existing resolutions",
+            file=sys.stderr,
+        )
+    if unanimous:
+        print(
+            f"    Skipped {unanimous} rebuttals of unanimous, well-justified dismissals",
+            file=sys.stderr,
+        )
+    dismissed = needs_rebuttal
+    if not dismissed:
+        return rebuttals
+
+    # One system prompt per adversary, built once. Identical prefixes across
+    # an adversary's rebuttals also let provider prompt caching kick in.
+    prompt_by_adversary: dict[str, str] = {}
+    for adversary_key in {e.concern.adversary for e in dismissed}:
         adversary = ADVERSARIES.get(adversary_key)
         persona = adversary.persona if adversary else ""
+        prompt_by_adversary[adversary_key] = REBUTTAL_SYSTEM_TEMPLATE.format(persona=persona)
 
-        system_prompt = REBUTTAL_SYSTEM_TEMPLATE.format(persona=persona)
+    def run_rebuttal(evaluation: Evaluation) -> Optional[Rebuttal]:
+        adversary_key = evaluation.concern.adversary
+        system_prompt = prompt_by_adversary[adversary_key]
         user_message = REBUTTAL_USER_TEMPLATE.format(
             concern_text=evaluation.concern.text,
             dismissal_reasoning=evaluation.reasoning,
@@ -56,8 +224,7 @@ def run_rebuttals(
                 timeout=config.timeout,
                 codex_reasoning=config.attack_codex_reasoning,
             )
-            response_upper = response.upper()
-            sustained = "CHALLENGED:" in response_upper
+            sustained = _CHALLENGED_RE.search(response) is not None
 
             return Rebuttal(
                 evaluation=evaluation,
@@ -68,23 +235,133 @@ def run_rebuttals(
         except Exception as e:
             if isinstance(e, PROGRAMMING_BUGS):
                 raise
+            if is_fatal_provider_error(e):
+                raise FatalProviderError(f"{model}: {e}") from e
             print(f"Warning: Rebuttal failed for {adversary_key}: {e}", file=sys.stderr)
             return None
 
-    # Run rebuttals in batches to avoid rate limits
-    batch_size, batch_delay = get_rate_limit_config(model)
-
-    for i in range(0, len(dismissed), batch_size):
-        batch = dismissed[i:i + batch_size]
-        if i > 0:
-            print(f"    Batch {i // batch_size + 1}/{(len(dismissed) + batch_size - 1) // batch_size}...", file=sys.stderr)
-            import time
-            time.sleep(batch_delay)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=len(batch)) as executor:
-            futures = [executor.submit(run_rebuttal, e) for e in batch]
-            for future in concurrent.futures.as_completed(futures):
-                result = future.result()
-                if result:
-                    rebuttals.append(result)
+    def run_rebuttal_batch(batch: list[Evaluation]) -> list[Optional[Rebuttal]]:
+        """Rebut several of one adversary's dismissals in a single call.
+
+        Dismissals the reply does not cover (or an unparseable reply) fall
+        back to one plain rebuttal call each.
+        """
+        if len(batch) == 1:
+            return [run_rebuttal(batch[0])]
 
+        adversary_key = batch[0].concern.adversary
+        dismissals = "\n\n".join(
+            REBUTTAL_BATCH_ITEM_TEMPLATE.format(
+                index=i,
+                concern_text=evaluation.concern.text,
+                dismissal_reasoning=evaluation.reasoning,
+            )
+            for i, evaluation in enumerate(batch, 1)
+        )
+
+        try:
+            response, in_tokens, out_tokens = call_model(
+                model=model,
+                system_prompt=prompt_by_adversary[adversary_key],
+                user_message=REBUTTAL_BATCH_USER_TEMPLATE.format(dismissals=dismissals),
+                timeout=config.timeout,
+                codex_reasoning=config.attack_codex_reasoning,
+                json_mode=True,
+                stop_after_json=True,
+            )
+        except Exception as e:
+            if isinstance(e, PROGRAMMING_BUGS):
+                raise
+            if is_fatal_provider_error(e):
+                raise FatalProviderError(f"{model}: {e}") from e
+            print(f"Warning: Rebuttal failed for {adversary_key}: {e}", file=sys.stderr)
+            return [None] * len(batch)
+
+        results = _parse_batch_rebuttals(response, batch)
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            print(
+                f"Warning: Batched rebuttal from {adversary_key} covered "
+                f"{len(batch) - len(missing)}/{len(batch)} dismissals; "
+                f"rebutting the rest individually",
+                file=sys.stderr,
+            )
+            for i in missing:
+                results[i] = run_rebuttal(batch[i])
+        return results
+
+    # Near-duplicate dismissals share one rebuttal; the result is cloned onto
+    # the siblings so every dismissal still gets its own Rebuttal.
+    groups = _group_duplicate_dismissals(dismissed)
+    siblings = {id(group[0]): group[1:] for group in groups}
+    to_rebut = [group[0] for group in groups]
+    if len(to_rebut) < len(dismissed):
+        print(
+            f"    Deduplicated {len(dismissed)} dismissals into {len(to_rebut)} rebuttals",
+            file=sys.stderr,
+        )
+
+    # Each adversary rebuts its dismissals in batches of REBUTTAL_BATCH_SIZE,
+    # so the persona prompt is sent once per batch instead of per dismissal.
+    positions_by_adversary: dict[str, list[int]] = defaultdict(list)
+    for pos, evaluation in enumerate(to_rebut):
+        positions_by_adversary[evaluation.concern.adversary].append(pos)
+    work = [
+        positions[i:i + REBUTTAL_BATCH_SIZE]
+        for positions in positions_by_adversary.values()
+        for i in range(0, len(positions), REBUTTAL_BATCH_SIZE)
+    ]
+
+    # Batches run on the shared gauntlet pool. call_model already paces each
+    # request through the provider's shared RateController token bucket
+    # (refilled at batch_size / delay), so there is no need to idle between
+    # whole batches; a semaphore caps in-flight batches at batch_size. Results
+    # are slotted by position so the output order is stable regardless of
+    # completion order.
+    batch_size, _ = get_rate_limit_config(model)
+    results: list[Optional[Rebuttal]] = [None] * len(to_rebut)
+    fatal: Optional[FatalProviderError] = None
+    in_flight = threading.BoundedSemaphore(batch_size)
+    aborted = threading.Event()
+
+    def run_capped(batch: list[Evaluation]) -> list[Optional[Rebuttal]]:
+        with in_flight:
+            if aborted.is_set():
+                return [None] * len(batch)
+            return run_rebuttal_batch(batch)
+
+    futures = {
+        shared_executor.submit(run_capped, [to_rebut[pos] for pos in positions]): positions
+        for positions in work
+    }
+    try:
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                batch_results = future.result()
+            except FatalProviderError as e:
+                # A rejected key or unknown model fails every remaining call
+                # the same way; drop the queued rebuttals.
+                fatal = e
+                break
+            for pos, result in zip(futures[future], batch_results):
+                results[pos] = result
+    finally:
+        if fatal is not None:
+            aborted.set()
+            for future in futures:
+                future.cancel()
+        concurrent.futures.wait(futures)
+
+    if fatal is not None:
+        print(
+            f"Warning: Rebuttals aborted after permanent provider error: {fatal}",
+            file=sys.stderr,
+        )
+
+    for result in filter(None, results):
+        rebuttals.append(result)
+        rebuttals.extend(
+            dataclasses.replace(result, evaluation=sibling)
+            for sibling in siblings[id(result.evaluation)]
+        )
     return rebuttals
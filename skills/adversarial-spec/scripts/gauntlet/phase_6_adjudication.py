@@ -6,14 +6,50 @@ dismissals.
 
 from __future__ import annotations
 
-import json
+import os
 import sys
 
 from gauntlet.core_types import PROGRAMMING_BUGS, Concern, GauntletConfig, Rebuttal
+from gauntlet.json_utils import decode_first_object
 from gauntlet.model_dispatch import call_model
 from gauntlet.prompts import ADJUDICATION_SYSTEM_PROMPT
 
 
+def _min_adjudication_challenges() -> int:
+    """FINAL_ADJUDICATION_MIN_CHALLENGES: fewest challenges worth an LLM call."""
+    try:
+        return max(1, int(os.environ.get("FINAL_ADJUDICATION_MIN_CHALLENGES", "1")))
+    except ValueError:
+        return 1
+
+
+def _resolve_without_model(challenged: list[Rebuttal]) -> tuple[list[Concern], list[Rebuttal]]:
+    """Overturn the challenges that need no adjudication call.
+
+    A dismissal is overturned outright when the multi-model evaluation was
+    split and fewer than half of the eval models voted to dismiss, or when
+    it is the only challenge and the concern is low severity (cheaper to
+    revise than to adjudicate).
+
+    Returns:
+        (overturned concerns, challenges still needing adjudication)
+    """
+    overturned: list[Concern] = []
+    remaining: list[Rebuttal] = []
+    for r in challenged:
+        votes = r.evaluation.votes
+        total = sum(votes.values())
+        if total and votes.get("dismissed", 0) * 2 < total:
+            overturned.append(r.evaluation.concern)
+        else:
+            remaining.append(r)
+
+    if len(remaining) == 1 and remaining[0].evaluation.severity == "low":
+        overturned.append(remaining[0].evaluation.concern)
+        remaining = []
+    return overturned, remaining
+
+
 def final_adjudication(
     spec: str,
     rebuttals: list[Rebuttal],
@@ -35,13 +71,23 @@ def final_adjudication(
     if not challenged:
         return []
 
-    challenges_text = "\n\n".join(
+    auto_overturned, challenged = _resolve_without_model(challenged)
+    if auto_overturned:
+        print(
+            f"  Overturned {len(auto_overturned)} challenge(s) without adjudication call",
+            file=sys.stderr,
+        )
+    if len(challenged) < _min_adjudication_challenges():
+        # Too few to adjudicate: same conservative outcome as a failed call.
+        return auto_overturned + [r.evaluation.concern for r in challenged]
+
+    challenges_text = "\n\n".join([
         f"### Challenge {i+1} (from {r.evaluation.concern.adversary})\n"
         f"Original concern: {r.evaluation.concern.text}\n"
         f"Dismissal reasoning: {r.evaluation.reasoning}\n"
         f"Rebuttal: {r.response}"
         for i, r in enumerate(challenged)
-    )
+    ])
 
     system_prompt = ADJUDICATION_SYSTEM_PROMPT
 
@@ -60,14 +106,11 @@ Make your final decisions. Output valid JSON."""
             user_message=user_message,
             timeout=config.timeout,
             codex_reasoning=config.eval_codex_reasoning,
+            stop_after_json=True,
         )
-        json_start = response.find("{")
-        json_end = response.rfind("}") + 1
-        if json_start >= 0 and json_end > json_start:
-            json_str = response[json_start:json_end]
-            data = json.loads(json_str)
-
-            surviving = []
+        data = decode_first_object(response)
+        if data is not None:
+            surviving = list(auto_overturned)
             for decision in data.get("decisions", []):
                 idx = decision.get("challenge_index", 0)
                 if idx < len(challenged) and decision.get("verdict") == "overturned":
@@ -80,4 +123,4 @@ Make your final decisions. Output valid JSON."""
         print(f"Warning: Final adjudication failed: {e}", file=sys.stderr)
 
     # Conservative fallback: all challenged concerns survive
-    return [r.evaluation.concern for r in challenged]
+    return auto_overturned + [r.evaluation.concern for r in challenged]
@@ -6,8 +6,10 @@ on whether the spec actually serves users.
 
 from __future__ import annotations
 
+import os
 import re
 import sys
+from typing import Optional
 
 from adversaries import FINAL_BOSS
 from gauntlet.core_types import (
@@ -25,6 +27,16 @@ from gauntlet.prompts import (
     FINAL_BOSS_USER_TEMPLATE,
 )
 
+_DISMISSAL_REF_RE = re.compile(r"D(\d+)", re.IGNORECASE)
+# Numbered, dash or bullet list item; group 1 is the text after the marker run.
+_LIST_ITEM_RE = re.compile(r"[0-9\-•][0-9.\-•) ]*(.*)")
+
+
+def _list_item_text(line: str) -> Optional[str]:
+    """Return the text of a stripped list-item line, or None if it isn't one."""
+    match = _LIST_ITEM_RE.match(line)
+    return match.group(1).strip() if match else None
+
 
 def run_final_boss_review(
     spec: str,
@@ -45,8 +57,6 @@ def run_final_boss_review(
 
     Timeout: max(config.timeout, 1800) — Opus 4.7 with large context needs a floor.
     """
-    import os
-
     timeout = max(config.timeout, 1800)
 
     # Final boss uses Opus 4.7 - expensive but thorough
@@ -128,8 +138,14 @@ def run_final_boss_review(
             system_prompt=system_prompt,
             user_message=user_prompt,
             timeout=timeout,
+            # Last blocking call of the run: worth the faster tier's premium.
+            latency_optimized=True,
         )
         response_upper = response.upper()
+        # Split and strip once; every section scan below works on these.
+        # Header checks use the upper-cased twin, index-aligned with the lines.
+        response_lines = [line.strip() for line in response.split("\n")]
+        upper_lines = [line.upper() for line in response_lines]
 
         if "VERDICT: RECONSIDER" in response_upper:
             verdict = FinalBossVerdict.RECONSIDER
@@ -147,15 +163,14 @@ def run_final_boss_review(
         concerns = []
         if verdict == FinalBossVerdict.REFINE:
             in_concerns_section = False
-            for line in response.split("\n"):
-                line = line.strip()
-                if "CONCERNS TO ADDRESS" in line.upper():
+            for line, upper in zip(response_lines, upper_lines):
+                if "CONCERNS TO ADDRESS" in upper:
                     in_concerns_section = True
                     continue
                 if in_concerns_section and line:
-                    if line[0].isdigit() or line.startswith("-") or line.startswith("•"):
-                        text = line.lstrip("0123456789.-•) ").strip()
-                        if text and len(text) > 10:
+                    text = _list_item_text(line)
+                    if text is not None:
+                        if len(text) > 10:
                             concerns.append(text)
                     elif line.startswith("VERDICT") or line.startswith("```"):
                         break
@@ -165,52 +180,50 @@ def run_final_boss_review(
         reconsider_reason = ""
         if verdict == FinalBossVerdict.RECONSIDER:
             in_alts_section = False
-            for line in response.split("\n"):
-                line = line.strip()
-                if "FUNDAMENTAL ISSUE" in line.upper():
+            for line, upper in zip(response_lines, upper_lines):
+                if "FUNDAMENTAL ISSUE" in upper:
                     parts = line.split(":", 1)
                     if len(parts) > 1:
                         reconsider_reason = parts[1].strip()
                     continue
-                if "ALTERNATE APPROACHES" in line.upper():
+                if "ALTERNATE APPROACHES" in upper:
                     in_alts_section = True
                     continue
                 if in_alts_section and line:
-                    if line[0].isdigit() or line.startswith("-") or line.startswith("•"):
-                        text = line.lstrip("0123456789.-•) ").strip()
-                        if text and len(text) > 10:
+                    text = _list_item_text(line)
+                    if text is not None:
+                        if len(text) > 10:
                             alts.append(text)
                     elif line.startswith("```"):
                         break
 
         # Extract invalid dismissals for telemetry
         flagged_dismissals = []
-        for line in response.split("\n"):
-            if "INVALID DISMISSALS" in line.upper():
-                matches = re.findall(r'D(\d+)', line, re.IGNORECASE)
+        for line, upper in zip(response_lines, upper_lines):
+            if "INVALID DISMISSALS" in upper:
+                matches = _DISMISSAL_REF_RE.findall(line)
                 flagged_dismissals = [f"D{m}" for m in matches]
                 break
 
         # Extract meta-reports
         process_meta = ""
         self_meta = ""
-        response_lines = response.split("\n")
-        for i, line in enumerate(response_lines):
-            if "PROCESS META-REPORT" in line.upper():
+        for i, upper in enumerate(upper_lines):
+            if "PROCESS META-REPORT" in upper:
                 meta_lines = []
                 for j in range(i + 1, min(i + 10, len(response_lines))):
-                    next_line = response_lines[j].strip()
+                    next_line = response_lines[j]
                     if next_line and not next_line.startswith("```"):
-                        if "SELF META-REPORT" in next_line.upper():
+                        if "SELF META-REPORT" in upper_lines[j]:
                             break
                         meta_lines.append(next_line)
                     elif next_line.startswith("```"):
                         break
                 process_meta = " ".join(meta_lines)
-            elif "SELF META-REPORT" in line.upper():
+            elif "SELF META-REPORT" in upper:
                 meta_lines = []
                 for j in range(i + 1, min(i + 10, len(response_lines))):
-                    next_line = response_lines[j].strip()
+                    next_line = response_lines[j]
                     if next_line and not next_line.startswith("```"):
                         meta_lines.append(next_line)
                     elif next_line.startswith("```"):
@@ -109,6 +109,23 @@ Output ONLY ONE of:
 - "MATCH: [index]" - The explanation at [index] FULLY addresses this exact concern
 - "NO_MATCH" - No explanation fully covers this concern"""
 
+EXPLANATION_BATCH_MATCHING_PROMPT = """You are checking which concerns have already been addressed.
+
+Compare each NEW CONCERN against the EXISTING EXPLANATIONS.
+
+STRICT MATCHING RULES:
+1. Only match if the explanation DIRECTLY and COMPLETELY addresses the concern
+2. Partial matches = no match (the concern has aspects not covered)
+3. Vague explanations = no match (can't verify they apply)
+4. Consider the confidence level shown - low confidence means be MORE skeptical
+5. A concern may only match an explanation for its own adversary or for "general"
+
+Output ONLY a JSON object with one entry per concern:
+{"matches": [{"c": 0, "e": 2}, {"c": 1, "e": null}]}
+
+"c" is the concern index; "e" is the index of the explanation that FULLY
+addresses it, or null if none does."""
+
 # =============================================================================
 # Phase 4: Evaluation
 # =============================================================================
@@ -147,6 +164,13 @@ Output your evaluation as JSON with this structure:
   ]
 }}"""
 
+# Appended to the formatted EVALUATION_SYSTEM_PROMPT for the cascade's first
+# pass only (--eval-cascade), which needs a verdict confidence to decide what
+# to escalate.
+EVALUATION_CONFIDENCE_PROMPT = """
+
+CONFIDENCE: Also give every evaluation a "confidence" field, 0.0-1.0, for how certain you are of the verdict. Use high values only when the spec text settles the question; a borderline call should score below 0.8."""
+
 # =============================================================================
 # Phase 5: Rebuttals
 # =============================================================================
@@ -185,6 +209,25 @@ Evaluate this dismissal. Output either:
 ACCEPTED: [brief acknowledgment] if the reasoning is valid
 CHALLENGED: [counter-evidence or logical flaw] if the reasoning is flawed"""
 
+REBUTTAL_BATCH_ITEM_TEMPLATE = """### Dismissal {index}
+Your original concern:
+{concern_text}
+
+The dismissal reasoning:
+{dismissal_reasoning}"""
+
+REBUTTAL_BATCH_USER_TEMPLATE = """Several of your concerns were dismissed. Evaluate each dismissal on its own merits.
+
+{dismissals}
+
+Output as JSON, one entry per dismissal:
+{{
+  "rebuttals": [
+    {{"index": 1, "verdict": "accepted|challenged", "response": "[brief acknowledgment, or counter-evidence / logical flaw]"}},
+    ...
+  ]
+}}"""
+
 # =============================================================================
 # Phase 6: Adjudication
 # =============================================================================
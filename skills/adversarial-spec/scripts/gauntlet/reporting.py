@@ -6,7 +6,8 @@ analysis, and the final gauntlet report. No phase logic lives here.
 
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import Counter, defaultdict
+from operator import itemgetter
 from typing import Any
 
 from gauntlet.core_types import (
@@ -115,28 +116,22 @@ def get_adversary_leaderboard() -> str:
         dismissed = data.get("dismissed", 0)
         lines.append(f"  {adv}: {effort:.0f} chars avg ({dismissed} dismissed)")
 
-    # Rebuttal performance
-    sorted_rebuttals = [
-        (a, d) for a, d in stats["adversaries"].items()
-        if d.get("rebuttals_won", 0) + d.get("rebuttals_lost", 0) > 0
-    ]
+    # Rebuttal performance: (adv, won, total, win rate), each computed once
+    rebuttal_rows = []
+    for adv, data in stats["adversaries"].items():
+        won = data.get("rebuttals_won", 0)
+        total = won + data.get("rebuttals_lost", 0)
+        if total > 0:
+            rebuttal_rows.append((adv, won, total, won / total))
 
-    if sorted_rebuttals:
+    if rebuttal_rows:
         lines.append("")
         lines.append("By Rebuttal Success (challenges won when dismissed):")
 
-        sorted_rebuttals = sorted(
-            sorted_rebuttals,
-            key=lambda x: x[1].get("rebuttals_won", 0) / max(1, x[1].get("rebuttals_won", 0) + x[1].get("rebuttals_lost", 0)),
-            reverse=True,
-        )
+        rebuttal_rows.sort(key=itemgetter(3), reverse=True)
 
-        for adv, data in sorted_rebuttals:
-            won = data.get("rebuttals_won", 0)
-            lost = data.get("rebuttals_lost", 0)
-            total = won + lost
-            rate = won / total * 100 if total > 0 else 0
-            lines.append(f"  {adv}: {rate:.0f}% ({won}/{total} won)")
+        for adv, won, total, rate in rebuttal_rows:
+            lines.append(f"  {adv}: {rate * 100:.0f}% ({won}/{total} won)")
 
     # Interpretation guide
     lines.append("")
@@ -294,6 +289,14 @@ def format_run_manifest(manifest: dict[str, Any]) -> str:
 # GAUNTLET REPORT
 # =============================================================================
 
+_CONCERN_LINE = "    - [{}] {}"
+_BULLET_LINE = "    - {}"
+
+
+def _truncate(text: str, limit: int) -> str:
+    """text cut to limit characters, with "..." marking a cut."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
 
 def format_gauntlet_report(result: GauntletResult) -> str:
     """Format a human-readable gauntlet report."""
@@ -309,9 +312,7 @@ def format_gauntlet_report(result: GauntletResult) -> str:
 
     # Phase 1 summary
     phase1_concerns = result.raw_concerns if result.raw_concerns is not None else result.concerns
-    by_adversary: dict[str, int] = {}
-    for c in phase1_concerns:
-        by_adversary[c.adversary] = by_adversary.get(c.adversary, 0) + 1
+    by_adversary = Counter(c.adversary for c in phase1_concerns)
 
     lines.append("Phase 1 - Attack Generation:")
     for adv, count in sorted(by_adversary.items()):
@@ -324,11 +325,11 @@ def format_gauntlet_report(result: GauntletResult) -> str:
     lines.append("")
 
     # Phase 4 summary
-    phase4_evals = result.clustered_evaluations if result.clustered_evaluations is not None else result.evaluations
-    dismissed = [e for e in phase4_evals if e.verdict == "dismissed"]
-    accepted = [e for e in phase4_evals if e.verdict == "accepted"]
-    acknowledged = [e for e in phase4_evals if e.verdict == "acknowledged"]
-    deferred = [e for e in phase4_evals if e.verdict == "deferred"]
+    buckets = result.verdict_buckets
+    dismissed = buckets["dismissed"]
+    accepted = buckets["accepted"]
+    acknowledged = buckets["acknowledged"]
+    deferred = buckets["deferred"]
 
     lines.append(f"Phase 4 - Evaluation ({result.eval_model}):")
     lines.append(f"  Dismissed: {len(dismissed)} (with justification)")
@@ -356,16 +357,18 @@ def format_gauntlet_report(result: GauntletResult) -> str:
             lines.append(f"  {first_line}")
         elif verdict == FinalBossVerdict.REFINE:
             lines.append(f"  VERDICT: REFINE - {len(result.final_boss_result.concerns)} concerns to address")
-            for concern in result.final_boss_result.concerns[:3]:
-                text = concern[:70] + "..." if len(concern) > 70 else concern
-                lines.append(f"    - {text}")
+            lines.extend(
+                _BULLET_LINE.format(_truncate(concern, 70))
+                for concern in result.final_boss_result.concerns[:3]
+            )
         elif verdict == FinalBossVerdict.RECONSIDER:
             lines.append("  VERDICT: RECONSIDER - Fundamental issues detected")
             lines.append(f"  Reason: {result.final_boss_result.reconsider_reason[:80]}")
             lines.append("  Alternate approaches to evaluate:")
-            for alt in result.final_boss_result.alternate_approaches[:3]:
-                text = alt[:70] + "..." if len(alt) > 70 else alt
-                lines.append(f"    - {text}")
+            lines.extend(
+                _BULLET_LINE.format(_truncate(alt, 70))
+                for alt in result.final_boss_result.alternate_approaches[:3]
+            )
 
         # Dismissal review telemetry
         stats = result.final_boss_result.dismissal_review_stats
@@ -389,22 +392,19 @@ def format_gauntlet_report(result: GauntletResult) -> str:
             lines.append(f"  {result.final_boss_result.self_meta_report[:200]}")
         lines.append("")
 
-    # Final verdict
-    ux_concerns = [c for c in result.final_concerns if c.adversary == "ux_architect"]
-    technical_concerns = [c for c in result.final_concerns if c.adversary != "ux_architect"]
+    # Final verdict (one pass to split UX from technical concerns)
+    ux_concerns: list[Concern] = []
+    technical_concerns: list[Concern] = []
+    for c in result.final_concerns:
+        (ux_concerns if c.adversary == "ux_architect" else technical_concerns).append(c)
 
     lines.append("Final Verdict:")
-    if technical_concerns:
-        lines.append(f"  Technical concerns: {len(technical_concerns)}")
-        for c in technical_concerns:
-            text = c.text[:80] + "..." if len(c.text) > 80 else c.text
-            lines.append(f"    - [{c.adversary}] {text}")
-
-    if ux_concerns:
-        lines.append(f"  UX concerns: {len(ux_concerns)}")
-        for c in ux_concerns:
-            text = c.text[:80] + "..." if len(c.text) > 80 else c.text
-            lines.append(f"    - [{c.adversary}] {text}")
+    for label, section in (("Technical", technical_concerns), ("UX", ux_concerns)):
+        if section:
+            lines.append(f"  {label} concerns: {len(section)}")
+            lines.extend(
+                _CONCERN_LINE.format(c.adversary, _truncate(c.text, 80)) for c in section
+            )
 
     if not result.final_concerns:
         lines.append("  No concerns - spec is ready for implementation!")
@@ -0,0 +1,156 @@
+"""Opt-in on-disk cache of model replies.
+
+Re-running the gauntlet on an unchanged spec (e.g. while iterating on one
+adversary) re-sends byte-identical prompts. With ASPEC_CACHE=1 set, call_model
+looks each request up here first and stores every successful reply, so repeat
+calls are served from disk without touching the provider or its rate limits.
+
+Uses diskcache when it is installed and falls back to one JSON file per entry
+otherwise. Cache I/O failures are never fatal: a broken entry is a miss and a
+failed store only warns.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+from gauntlet import json_utils
+from gauntlet.core_types import PROGRAMMING_BUGS
+from gauntlet.persistence import STATS_DIR
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+RESPONSE_CACHE_DIR = STATS_DIR / "response-cache"
+
+# Set by the CLI's --no-cache flag; overrides ASPEC_CACHE for the process.
+_disabled = False
+_store = None
+
+# Lookups and hits this process, for the end-of-run summary.
+_stats_lock = threading.Lock()
+_lookups = 0
+_hits = 0
+
+
+def disable_response_cache() -> None:
+    """Turn the cache off for this process regardless of ASPEC_CACHE."""
+    global _disabled
+    _disabled = True
+
+
+def response_cache_enabled() -> bool:
+    """True when ASPEC_CACHE is set and the cache was not disabled."""
+    if _disabled:
+        return False
+    return os.environ.get("ASPEC_CACHE", "").strip().lower() in ("1", "true", "yes")
+
+
+def cache_stats() -> tuple[int, int]:
+    """Return (hits, lookups) since the process started."""
+    with _stats_lock:
+        return _hits, _lookups
+
+
+def _count_lookup(hit: bool) -> None:
+    global _lookups, _hits
+    with _stats_lock:
+        _lookups += 1
+        _hits += hit
+
+
+def response_cache_key(
+    model: str,
+    system_prompt: str,
+    user_message: str,
+    codex_reasoning: str,
+    json_mode: bool,
+    stop_after_json: bool,
+) -> str:
+    """Hash everything that shapes the reply (timeouts do not)."""
+    digest = hashlib.sha256()
+    for part in (
+        model, codex_reasoning, str(json_mode), str(stop_after_json),
+        system_prompt, user_message,
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class _JsonFileStore:
+    """diskcache stand-in: one small JSON file per key, sharded by prefix."""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[list]:
+        try:
+            return json_utils.loads(self._path(key).read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value: list) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Entries are immutable for a key, so a temp file + replace is enough;
+        # concurrent writers of the same key write identical bytes.
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(json_utils.dumpb(value))
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+
+def _get_store():
+    global _store
+    if _store is None:
+        if diskcache is not None:
+            _store = diskcache.Cache(str(RESPONSE_CACHE_DIR))
+        else:
+            _store = _JsonFileStore(RESPONSE_CACHE_DIR)
+    return _store
+
+
+def get_cached_response(key: str) -> Optional[tuple[str, int, int]]:
+    """Return the stored (response, input_tokens, output_tokens), or None."""
+    try:
+        entry = _get_store().get(key)
+    except Exception as e:
+        if isinstance(e, PROGRAMMING_BUGS):
+            raise
+        print(f"Warning: Response cache read failed: {e}", file=sys.stderr)
+        entry = None
+    if not entry or len(entry) != 3:
+        _count_lookup(False)
+        return None
+    _count_lookup(True)
+    response, input_tokens, output_tokens = entry
+    return response, input_tokens, output_tokens
+
+
+def store_response(key: str, result: tuple[str, int, int]) -> None:
+    """Persist a reply; failures warn and leave the call result untouched."""
+    try:
+        _get_store().set(key, list(result))
+    except Exception as e:
+        if isinstance(e, PROGRAMMING_BUGS):
+            raise
+        print(f"Warning: Response cache write failed: {e}", file=sys.stderr)
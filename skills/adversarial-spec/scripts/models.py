@@ -15,18 +15,6 @@ from typing import Optional
 
 os.environ["LITELLM_LOG"] = "ERROR"
 
-try:
-    import litellm
-    from litellm import completion
-
-    litellm.suppress_debug_info = True
-except ImportError:
-    print(
-        "Error: litellm package not installed. Run: pip install litellm",
-        file=sys.stderr,
-    )
-    sys.exit(1)
-
 import token_tracking
 from prompts import (
     FOCUS_AREAS,
@@ -43,6 +31,43 @@ from providers import (
     GEMINI_CLI_AVAILABLE,
 )
 
+# litellm takes seconds to import; load it on the first API call so CLI-only
+# runs and fast-exit commands never pay for it.
+completion = None
+
+# Keep-alive pool shared by litellm's OpenAI-compatible providers, sized for
+# the parallel gauntlet phases so concurrent calls reuse TLS connections
+# instead of handshaking per request.
+LITELLM_HTTP_POOL_SIZE = 32
+
+
+def get_litellm_completion():
+    """Return litellm.completion, importing litellm on first use."""
+    global completion
+    if completion is None:
+        try:
+            import httpx
+            import litellm
+            from litellm import completion as litellm_completion
+        except ImportError:
+            print(
+                "Error: litellm package not installed. Run: pip install litellm",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        litellm.suppress_debug_info = True
+        if litellm.client_session is None:
+            litellm.client_session = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=LITELLM_HTTP_POOL_SIZE,
+                    max_keepalive_connections=LITELLM_HTTP_POOL_SIZE,
+                ),
+                timeout=None,  # per-call timeouts are passed to completion()
+            )
+        completion = litellm_completion
+    return completion
+
+
 MAX_RETRIES = 3
 RETRY_BASE_DELAY = 1.0  # seconds
 
@@ -811,7 +836,7 @@ def call_single_model(
             if not is_o_series_model(actual_model):
                 completion_kwargs["temperature"] = 0.7
 
-            response = completion(**completion_kwargs)
+            response = get_litellm_completion()(**completion_kwargs)
             content = response.choices[0].message.content
             agreed = "[AGREE]" in content
             extracted = extract_spec(content)
@@ -908,7 +933,7 @@ def _preflight_single(
                 cwd=cwd,
             )
         else:
-            completion(
+            get_litellm_completion()(
                 model=model,
                 messages=[{"role": "user", "content": PREFLIGHT_PROMPT}],
                 max_tokens=8,
@@ -931,18 +956,14 @@ def preflight_models(
     seconds instead of discovering them after the longest model finishes
     its full critique. Returns {model: error_or_None}.
     """
-    results: dict[str, Optional[str]] = {}
+    # Results are keyed by model, so completion order is irrelevant: collect
+    # in submission order (which also keeps the dict in the caller's order).
     with concurrent.futures.ThreadPoolExecutor(max_workers=len(models)) as executor:
-        future_to_model = {
-            executor.submit(
-                _preflight_single, model, codex_reasoning, timeout, cwd
-            ): model
+        futures = {
+            model: executor.submit(_preflight_single, model, codex_reasoning, timeout, cwd)
             for model in models
         }
-        for future in concurrent.futures.as_completed(future_to_model):
-            model = future_to_model[future]
-            results[model] = future.result()
-    return results
+        return {model: future.result() for model, future in futures.items()}
 
 
 def call_models_parallel(
@@ -6,6 +6,21 @@ import time
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def _flush_gauntlet_runs(monkeypatch):
+    """Finish queued run writes and bookkeeping while the test's patches still apply."""
+    yield
+    from gauntlet.persistence import flush_gauntlet_runs
+
+    flush_gauntlet_runs()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_checkpoints(monkeypatch, tmp_path):
+    """Write debate checkpoints under tmp_path, not the working directory."""
+    monkeypatch.setattr("session.CHECKPOINTS_DIR", tmp_path / ".adversarial-spec-checkpoints")
+
+
 @pytest.fixture
 def fresh_tracker(monkeypatch):
     """Provide isolated token accounting state for tests."""
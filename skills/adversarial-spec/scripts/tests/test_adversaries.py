@@ -6,6 +6,7 @@ import pytest
 from adversaries import (
     ADVERSARIES,
     ADVERSARY_PREFIXES,
+    ADVERSARY_SUMMARIES,
     ADVERSARY_TEMPLATES,
     GUARDRAILS,
     AdversaryTemplate,
@@ -80,6 +81,11 @@ def test_adversary_prefixes_keep_historical_aliases_and_new_prefixes():
     assert ADVERSARY_PREFIXES["prior_art_scout"] == "PREV"
 
 
+def test_adversary_summaries_hold_first_persona_line():
+    for name, adv in ADVERSARIES.items():
+        assert ADVERSARY_SUMMARIES[name] == adv.persona.strip().split("\n")[0]
+
+
 # =============================================================================
 # T11: scope_guidelines key validation
 # =============================================================================
@@ -0,0 +1,63 @@
+"""Tests for the Phase 4 provider batch-API path."""
+
+import json
+from types import SimpleNamespace
+
+import litellm
+from gauntlet import batch_api
+from gauntlet.batch_api import run_chat_batch, supports_batch_api
+
+
+def test_supports_batch_api_only_for_openai_models():
+    assert supports_batch_api("gpt-4o")
+    assert supports_batch_api("openai/gpt-4o-mini")
+    assert not supports_batch_api("codex/gpt-5.5")
+    assert not supports_batch_api("claude-opus-4-7")
+    assert not supports_batch_api("gemini/gemini-3-pro")
+
+
+def test_run_chat_batch_uploads_polls_and_maps_by_custom_id(monkeypatch):
+    uploaded = {}
+    statuses = iter(["in_progress", "completed"])
+
+    def create_file(file, purpose, custom_llm_provider):  # noqa: ANN001
+        uploaded["lines"] = [json.loads(line) for line in file[1].splitlines()]
+        return SimpleNamespace(id="file-in")
+
+    def retrieve_batch(batch_id, custom_llm_provider):  # noqa: ANN001
+        return SimpleNamespace(id=batch_id, status=next(statuses), output_file_id="file-out")
+
+    def ok(custom_id, text):  # noqa: ANN001
+        return {"custom_id": custom_id, "response": {"status_code": 200, "body": {
+            "choices": [{"message": {"content": text}}],
+            "usage": {"prompt_tokens": 7, "completion_tokens": 3},
+        }}}
+
+    output = "\n".join(json.dumps(r) for r in [
+        ok("1", "second"),
+        {"custom_id": "0", "response": {"status_code": 500, "body": {}}},
+    ])
+    recorded = []
+
+    monkeypatch.setattr(litellm, "create_file", create_file)
+    monkeypatch.setattr(litellm, "create_batch", lambda **kwargs: SimpleNamespace(
+        id="batch-1", status="validating", output_file_id=None,
+    ))
+    monkeypatch.setattr(litellm, "retrieve_batch", retrieve_batch)
+    monkeypatch.setattr(litellm, "file_content", lambda **kwargs: SimpleNamespace(
+        content=output.encode("utf-8"),
+    ))
+    monkeypatch.setattr(batch_api.token_tracking, "tracker", SimpleNamespace(
+        record_call=lambda model, i, o, rate_scale: recorded.append((model, i, o, rate_scale)),
+    ))
+    monkeypatch.setattr(batch_api.time, "sleep", lambda seconds: None)
+
+    replies = run_chat_batch(
+        "openai/gpt-4o", [("0", "sys", "first user"), ("1", "sys", "second user")],
+    )
+
+    assert [line["custom_id"] for line in uploaded["lines"]] == ["0", "1"]
+    assert uploaded["lines"][1]["body"]["model"] == "gpt-4o"
+    assert uploaded["lines"][1]["body"]["messages"][1]["content"] == "second user"
+    assert replies == {"1": ("second", 7, 3)}
+    assert recorded == [("openai/gpt-4o", 7, 3, batch_api.BATCH_API_DISCOUNT)]
@@ -1,6 +1,7 @@
 """Regression tests for the standalone gauntlet CLI surface."""
 
-from io import StringIO
+import json
+from io import BytesIO, StringIO, TextIOWrapper
 from unittest.mock import patch
 
 import pytest
@@ -17,3 +18,55 @@ def test_standalone_cli_rejects_show_manifest_flag():
 
     assert exc_info.value.code == 2
     assert "unrecognized arguments" in mock_stderr.getvalue()
+
+
+def test_list_adversaries_fast_path_skips_argparse(capsys):
+    """Exact fast-exit invocations must not build the argparse parser."""
+    from gauntlet.cli import main
+
+    with patch("sys.argv", ["gauntlet", "--list-adversaries"]):
+        with patch("argparse.ArgumentParser", side_effect=AssertionError("argparse used")):
+            main()
+
+    assert "Available adversaries:" in capsys.readouterr().out
+
+
+def test_show_run_writes_json_to_binary_stdout():
+    """JSON output goes to stdout.buffer as bytes, after any pending text."""
+    from gauntlet.cli import main
+
+    raw = BytesIO()
+    stdout = TextIOWrapper(raw, encoding="utf-8")
+    stdout.write("header\n")
+
+    with patch("sys.argv", ["gauntlet", "--show-run", "run.json"]):
+        with patch("gauntlet.persistence.load_gauntlet_run", return_value={"text": "ü"}):
+            with patch("sys.stdout", stdout):
+                main()
+
+    header, body = raw.getvalue().decode("utf-8").split("\n", 1)
+    assert header == "header"
+    assert json.loads(body) == {"text": "ü"}
+
+
+def test_read_spec_stdin_translates_newlines():
+    """Bytes read from stdin get the same newline translation as text mode."""
+    from gauntlet.cli import _read_spec_stdin
+
+    stdin = TextIOWrapper(BytesIO("# Spec\r\nline\rend\n".encode("utf-8")), encoding="utf-8")
+    with patch("sys.stdin", stdin):
+        assert _read_spec_stdin() == "# Spec\nline\nend"
+
+
+def test_read_spec_stdin_rejects_invalid_utf8():
+    """Undecodable stdin must fail loudly instead of feeding U+FFFD to models."""
+    from gauntlet.cli import _read_spec_stdin
+
+    stdin = TextIOWrapper(BytesIO(b"# Spec\n\xff\xfe"), encoding="utf-8")
+    with patch("sys.stdin", stdin):
+        with patch("sys.stderr", new_callable=StringIO) as mock_stderr:
+            with pytest.raises(SystemExit) as exc_info:
+                _read_spec_stdin()
+
+    assert exc_info.value.code == 1
+    assert "not valid UTF-8" in mock_stderr.getvalue()
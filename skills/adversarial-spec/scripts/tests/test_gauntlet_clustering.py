@@ -8,6 +8,7 @@ from gauntlet.clustering import (
     _jaccard,
     _tokenize,
     cluster_concerns,
+    merge_exact_duplicates,
     render_cluster_report,
     should_auto_cluster,
 )
@@ -171,6 +172,19 @@ class TestClusterConcerns:
         assert member_ids == {concerns[0].id, concerns[1].id}
 
 
+class TestMergeExactDuplicates:
+    def test_merges_identical_text_across_adversaries(self):
+        concerns = [
+            _c("architect", "Retries are **unbounded**."),
+            _c("paranoid_security", "Token expiry is unchecked"),
+            _c("burned_oncall", "retries are  unbounded", model="gemini-cli/gemini-3-flash-preview"),
+        ]
+        reps, members = merge_exact_duplicates(concerns)
+        assert reps == [concerns[0], concerns[1]]
+        assert members[concerns[0].id] == [concerns[0], concerns[2]]
+        assert members[concerns[1].id] == [concerns[1]]
+
+
 # -----------------------------------------------------------------------------
 # Auto-trigger threshold
 # -----------------------------------------------------------------------------
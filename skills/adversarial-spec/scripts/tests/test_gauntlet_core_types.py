@@ -2,10 +2,14 @@
 
 from gauntlet.core_types import (
     SYNTHESIS_CATEGORIES,
+    Concern,
+    Evaluation,
     GauntletClusteringError,
     GauntletConfig,
     GauntletExecutionError,
     GauntletResult,
+    Rebuttal,
+    bucket_by_verdict,
     normalize_verdict,
 )
 
@@ -36,3 +40,95 @@ def test_synthesis_categories_match_spec_order():
         "Design Debt",
         "Underspecification",
     ]
+
+
+def test_bucket_by_verdict_partitions_in_one_pass():
+    """Every verdict key is present; evaluations land in their own bucket."""
+    concern = Concern(adversary="minimalist", text="x", id="MIN-1")
+    evals = [
+        Evaluation(concern=concern, verdict="accept", reasoning=""),
+        Evaluation(concern=concern, verdict="dismissed", reasoning=""),
+        Evaluation(concern=concern, verdict="accepted", reasoning=""),
+    ]
+
+    buckets = bucket_by_verdict(evals)
+
+    assert [len(buckets[v]) for v in ("dismissed", "accepted", "acknowledged", "deferred")] == [1, 2, 0, 0]
+
+
+def test_verdict_buckets_prefer_clustered_evaluations():
+    concern = Concern(adversary="minimalist", text="x", id="MIN-1")
+    result = GauntletResult(
+        concerns=[concern],
+        evaluations=[Evaluation(concern=concern, verdict="dismissed", reasoning="")] * 3,
+        rebuttals=[],
+        final_concerns=[],
+        adversary_model="a",
+        eval_model="e",
+        total_time=0.0,
+        total_cost=0.0,
+        clustered_evaluations=[Evaluation(concern=concern, verdict="accepted", reasoning="")],
+    )
+
+    assert len(result.verdict_buckets["accepted"]) == 1
+    assert result.verdict_buckets["dismissed"] == []
+
+
+def test_cached_views_reset_when_inputs_are_reassigned():
+    concern = Concern(adversary="minimalist", text="x", id="MIN-1")
+    result = GauntletResult(
+        concerns=[concern],
+        evaluations=[Evaluation(concern=concern, verdict="dismissed", reasoning="")],
+        rebuttals=[],
+        final_concerns=[],
+        adversary_model="a",
+        eval_model="e",
+        total_time=0.0,
+        total_cost=0.0,
+    )
+
+    assert result.get_adversary_stats() is result.get_adversary_stats()
+    assert result.get_adversary_stats()["minimalist"]["dismissed"] == 1
+    assert len(result.verdict_buckets["dismissed"]) == 1
+
+    result.evaluations = [Evaluation(concern=concern, verdict="accepted", reasoning="")]
+
+    assert result.get_adversary_stats()["minimalist"]["accepted"] == 1
+    assert result.verdict_buckets["dismissed"] == []
+
+
+def test_rebuttal_by_severity_tallies_outcomes_per_adversary():
+    high = Concern(adversary="minimalist", text="x", severity="high", id="MIN-1")
+    unset = Concern(adversary="minimalist", text="y", severity="", id="MIN-2")
+    rebuttals = [
+        Rebuttal(Evaluation(concern=high, verdict="dismissed", reasoning=""), "r", True),
+        Rebuttal(Evaluation(concern=high, verdict="dismissed", reasoning=""), "r", False),
+        Rebuttal(Evaluation(concern=unset, verdict="dismissed", reasoning=""), "r", True),
+    ]
+    result = GauntletResult(
+        concerns=[high, unset],
+        evaluations=[r.evaluation for r in rebuttals],
+        rebuttals=rebuttals,
+        final_concerns=[],
+        adversary_model="a",
+        eval_model="e",
+        total_time=0.0,
+        total_cost=0.0,
+    )
+
+    stats = result.get_adversary_stats()
+
+    assert stats["minimalist"]["rebuttal_by_severity"] == {
+        "high": {"won": 1, "lost": 1},
+        "medium": {"won": 1, "lost": 0},
+        "low": {"won": 0, "lost": 0},
+    }
+    assert stats["paranoid_security"]["rebuttal_by_severity"]["high"] == {"won": 0, "lost": 0}
+
+
+def test_concern_null_labels_fall_back_to_defaults():
+    """Persisted concerns with null severity/source_model still load."""
+    concern = Concern(adversary="minimalist", text="x", severity=None, source_model=None)
+
+    assert concern.severity == "medium"
+    assert concern.source_model == ""
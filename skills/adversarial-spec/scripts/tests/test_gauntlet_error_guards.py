@@ -106,7 +106,7 @@ class TestPhase4ErrorGuard:
 
     def test_name_error_propagates(self, monkeypatch):
         """NameError in evaluation must NOT produce deferred fallback."""
-        def raise_name_error(model, system_prompt, user_message, timeout, codex_reasoning):
+        def raise_name_error(model, system_prompt, user_message, timeout, codex_reasoning, **kwargs):
             raise NameError("name 'undefined_var' is not defined")
 
         monkeypatch.setattr("gauntlet.phase_4_evaluation.call_model", raise_name_error)
@@ -119,7 +119,7 @@ class TestPhase4ErrorGuard:
 
     def test_connection_error_caught_defers(self, monkeypatch, capsys):
         """Network errors should be caught and produce deferred verdicts."""
-        def raise_connection(model, system_prompt, user_message, timeout, codex_reasoning):
+        def raise_connection(model, system_prompt, user_message, timeout, codex_reasoning, **kwargs):
             raise ConnectionError("Connection refused")
 
         monkeypatch.setattr("gauntlet.phase_4_evaluation.call_model", raise_connection)
@@ -185,7 +185,7 @@ class TestPhase6ErrorGuard:
 
     def test_syntax_error_propagates(self, monkeypatch):
         """SyntaxError must NOT trigger conservative fallback."""
-        def raise_syntax(model, system_prompt, user_message, timeout, codex_reasoning):
+        def raise_syntax(model, system_prompt, user_message, timeout, codex_reasoning, **kwargs):
             raise SyntaxError("invalid syntax")
 
         monkeypatch.setattr("gauntlet.phase_6_adjudication.call_model", raise_syntax)
@@ -202,7 +202,7 @@ class TestPhase6ErrorGuard:
 
     def test_os_error_caught_returns_all_surviving(self, monkeypatch, capsys):
         """OSError should be caught, all challenged concerns survive."""
-        def raise_os(model, system_prompt, user_message, timeout, codex_reasoning):
+        def raise_os(model, system_prompt, user_message, timeout, codex_reasoning, **kwargs):
             raise OSError("disk full")
 
         monkeypatch.setattr("gauntlet.phase_6_adjudication.call_model", raise_os)
@@ -0,0 +1,74 @@
+"""Tests for gauntlet JSON helpers."""
+
+from enum import Enum
+
+from gauntlet.core_types import Concern
+from gauntlet.json_utils import (
+    ObjectEndDetector,
+    decode_first_object,
+    dumpb,
+    dumps,
+    extract_first_json,
+    loads,
+)
+
+
+def test_extract_first_json_ignores_trailing_braces():
+    text = 'Here you go:\n{"decisions": [{"verdict": "upheld"}]}\nNote: {not json}'
+    assert extract_first_json(text) == '{"decisions": [{"verdict": "upheld"}]}'
+
+
+def test_extract_first_json_skips_braces_inside_strings():
+    text = '{"reasoning": "uses {braces} and \\"quotes}\\"", "n": 1} trailing'
+    span = extract_first_json(text)
+    assert loads(span) == {"reasoning": 'uses {braces} and "quotes}"', "n": 1}
+
+
+def test_extract_first_json_returns_none_without_balanced_object():
+    assert extract_first_json("no json here") is None
+    assert extract_first_json('{"open": ') is None
+
+
+def test_decode_first_object_skips_prose_braces_and_trailing_text():
+    text = 'Thinking about {the spec}...\n{"evaluations": [{"verdict": "accepted"}]} done {x}'
+    assert decode_first_object(text) == {"evaluations": [{"verdict": "accepted"}]}
+    assert decode_first_object("no json {here}") is None
+
+
+def test_decode_first_object_whole_reply_and_brace_wrapped_prose():
+    assert decode_first_object('  {"decisions": []}\n') == {"decisions": []}
+    # Starts and ends with a brace but is not one object: falls back to the scan.
+    assert decode_first_object('{note} {"n": 1}') == {"n": 1}
+
+
+def test_object_end_detector_spans_chunks_and_ignores_string_braces():
+    detector = ObjectEndDetector()
+    chunks = ["Sure: ", '{"a": "}\\"', '}", "b": {', '"c": 1}', "} trailing {"]
+    assert [detector.feed(c) for c in chunks] == [False, False, False, False, True]
+
+
+def test_object_end_detector_skips_balanced_prose_braces():
+    detector = ObjectEndDetector()
+    chunks = ["I'll fill in {concern_index} for each", ' concern:\n{"evaluations": [', "]}", " done"]
+    assert [detector.feed(c) for c in chunks] == [False, False, True, False]
+
+
+def test_dumps_round_trips_and_encodes_dataclasses():
+    class Color(Enum):
+        RED = "red"
+
+    data = {"a": [1, 2], "b": "ü", "c": Color.RED, "d": Concern(adversary="x", text="t", id="X-1")}
+
+    decoded = loads(dumps(data, indent=True))
+
+    assert decoded["b"] == "ü"
+    assert decoded["c"] == "red"
+    assert decoded["d"]["id"] == "X-1"
+
+
+def test_dumpb_returns_utf8_bytes():
+    payload = dumpb({"b": "ü", "n": [1]}, indent=True)
+
+    assert isinstance(payload, bytes)
+    assert "ü".encode("utf-8") in payload
+    assert loads(payload) == {"b": "ü", "n": [1]}
@@ -81,14 +81,14 @@ def test_gemini_free_tier_rate_limit_staggers_single_launches(monkeypatch):
 
 
 @pytest.mark.parametrize(
-    ("model_name", "handler_name"),
+    ("model_name", "route"),
     [
-        ("codex/gpt-5.5", "call_codex_model"),
-        ("gemini-cli/gemini-3.1-pro-preview", "call_gemini_cli_model"),
-        ("claude-cli/claude-opus-4-7", "call_claude_cli_model"),
+        ("codex/gpt-5.5", "codex"),
+        ("gemini-cli/gemini-3.1-pro-preview", "gemini-cli"),
+        ("claude-cli/claude-opus-4-7", "claude-cli"),
     ],
 )
-def test_call_model_records_cli_usage_once(monkeypatch, model_name: str, handler_name: str):
+def test_call_model_records_cli_usage_once(monkeypatch, model_name: str, route: str):
     calls = []
 
     class Tracker:
@@ -100,7 +100,8 @@ def test_call_model_records_cli_usage_once(monkeypatch, model_name: str, handler
         assert kwargs["model"] == model_name
         return "ok", 11, 7
 
-    monkeypatch.setattr(MODULE, handler_name, fake_handler)
+    _, takes_reasoning = MODULE._CLI_ROUTES[route]
+    monkeypatch.setitem(MODULE._CLI_ROUTES, route, (fake_handler, takes_reasoning))
     monkeypatch.setattr(MODULE.token_tracking, "tracker", Tracker())
 
     assert call_model(model_name, "system", "user") == ("ok", 11, 7)
@@ -134,3 +135,340 @@ def test_call_model_records_litellm_usage_once(monkeypatch):
 
     assert call_model("gpt-4o", "system", "user") == ("ok", 13, 5)
     assert calls == [("gpt-4o", 13, 5)]
+
+
+def test_response_cache_serves_repeat_calls_from_disk(monkeypatch, tmp_path):
+    cache = MODULE.response_cache
+    monkeypatch.setenv("ASPEC_CACHE", "1")
+    monkeypatch.setattr(cache, "RESPONSE_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(cache, "diskcache", None)
+    monkeypatch.setattr(cache, "_store", None)
+    monkeypatch.setattr(cache, "_hits", 0)
+    monkeypatch.setattr(cache, "_lookups", 0)
+    calls = []
+
+    def fake_handler(**kwargs):  # noqa: ANN001
+        calls.append(kwargs["user_message"])
+        return f"reply to {kwargs['user_message']}", 11, 7
+
+    monkeypatch.setitem(MODULE._CLI_ROUTES, "codex", (fake_handler, True))
+
+    assert call_model("codex/gpt-5.5", "system", "user") == ("reply to user", 11, 7)
+    assert call_model("codex/gpt-5.5", "system", "user") == ("reply to user", 11, 7)
+    assert call_model("codex/gpt-5.5", "system", "other") == ("reply to other", 11, 7)
+    assert calls == ["user", "other"]
+    assert cache.cache_stats() == (1, 3)
+
+    monkeypatch.setattr(cache, "_disabled", True)
+    call_model("codex/gpt-5.5", "system", "user")
+    assert calls == ["user", "other", "user"]
+
+
+def test_litellm_system_prompt_marked_cacheable_for_anthropic_only(monkeypatch):
+    seen = {}
+
+    class Message:
+        content = "ok"
+
+    class Choice:
+        message = Message()
+
+    class Response:
+        choices = [Choice()]
+        usage = None
+
+    def fake_completion(**kwargs):
+        seen[kwargs["model"]] = kwargs["messages"][0]
+        return Response()
+
+    monkeypatch.setattr(MODULE, "completion", fake_completion)
+
+    call_model("claude-sonnet-4-20250514", "system", "user")
+    call_model("gpt-4o", "system", "user")
+
+    assert seen["claude-sonnet-4-20250514"]["content"] == [
+        {"type": "text", "text": "system", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert seen["gpt-4o"] == {"role": "system", "content": "system"}
+
+
+def test_cache_prefix_adds_user_breakpoint_for_anthropic_only(monkeypatch):
+    seen = {}
+
+    class Message:
+        content = "ok"
+
+    class Choice:
+        message = Message()
+
+    class Response:
+        choices = [Choice()]
+        usage = None
+
+    def fake_completion(**kwargs):
+        seen[kwargs["model"]] = kwargs["messages"][1]
+        return Response()
+
+    monkeypatch.setattr(MODULE, "completion", fake_completion)
+
+    prefix = "## SPECIFICATION\nspec\n\n"
+    call_model("claude-sonnet-4-20250514", "system", prefix + "concerns", cache_prefix=prefix)
+    call_model("gpt-4o", "system", prefix + "concerns", cache_prefix=prefix)
+
+    assert seen["claude-sonnet-4-20250514"]["content"] == [
+        {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": "concerns"},
+    ]
+    assert seen["gpt-4o"] == {"role": "user", "content": prefix + "concerns"}
+
+
+def test_latency_optimized_only_sets_bedrock_performance_config(monkeypatch):
+    seen = {}
+
+    class Message:
+        content = "ok"
+
+    class Choice:
+        message = Message()
+
+    class Response:
+        choices = [Choice()]
+        usage = None
+
+    def fake_completion(**kwargs):
+        seen[kwargs["model"]] = kwargs
+        return Response()
+
+    monkeypatch.setattr(MODULE, "completion", fake_completion)
+
+    bedrock = "bedrock/anthropic.claude-opus-4-7"
+    call_model(bedrock, "system", "user", latency_optimized=True)
+    call_model("claude-opus-4-7", "system", "user", latency_optimized=True)
+    call_model("bedrock/anthropic.claude-3-haiku", "system", "user")
+
+    assert seen[bedrock]["performanceConfig"] == {"latency": "optimized"}
+    assert "performanceConfig" not in seen["claude-opus-4-7"]
+    assert "performanceConfig" not in seen["bedrock/anthropic.claude-3-haiku"]
+
+
+def test_stop_after_json_streams_and_stops_at_object_end(monkeypatch):
+    consumed = []
+
+    class Delta:
+        def __init__(self, content):
+            self.content = content
+
+    class Choice:
+        def __init__(self, content):
+            self.delta = Delta(content)
+
+    class Chunk:
+        usage = None
+
+        def __init__(self, content):
+            self.choices = [Choice(content)]
+
+    def stream():
+        for text in ['{"evaluations": [', '{"verdict": "ok"}', ']}', " and more", " prose"]:
+            consumed.append(text)
+            yield Chunk(text)
+
+    seen = {}
+
+    def fake_completion(**kwargs):
+        seen.update(kwargs)
+        return stream()
+
+    monkeypatch.setattr(MODULE, "completion", fake_completion)
+
+    content, input_tokens, output_tokens = call_model(
+        "gpt-4o", "system", "user", stop_after_json=True
+    )
+
+    assert content == '{"evaluations": [{"verdict": "ok"}]}'
+    assert seen["stream"] is True
+    assert consumed[-1] == "]}"
+    assert input_tokens > 0 and output_tokens > 0
+
+
+def test_stop_after_json_retries_in_full_when_cut_stream_has_no_json(monkeypatch):
+    class Delta:
+        def __init__(self, content):
+            self.content = content
+
+    class Choice:
+        def __init__(self, content):
+            self.delta = Delta(content)
+            self.message = Delta(content)
+
+    class Chunk:
+        usage = None
+
+        def __init__(self, content):
+            self.choices = [Choice(content)]
+
+    class Response:
+        choices = [Choice('{"evaluations": []}')]
+        usage = None
+
+    calls = []
+
+    def fake_completion(**kwargs):
+        calls.append(kwargs.get("stream", False))
+        if kwargs.get("stream"):
+            return iter([Chunk("{not json}"), Chunk(' {"evaluations": []}')])
+        return Response()
+
+    monkeypatch.setattr(MODULE, "completion", fake_completion)
+    # Force the stream to stop on the first balanced span.
+    monkeypatch.setattr(MODULE.json_utils.ObjectEndDetector, "_decodes", lambda self: True)
+
+    content, _, _ = call_model("gpt-4o", "system", "user", stop_after_json=True)
+
+    assert calls == [True, False]
+    assert content == '{"evaluations": []}'
+
+
+def test_rate_controller_aimd_adjusts_rate(monkeypatch):
+    monkeypatch.setenv("CLAUDE_PAID_TIER", "true")
+    sleeps = []
+    monkeypatch.setattr(MODULE.time, "sleep", sleeps.append)
+
+    controller = MODULE.RateController("claude-sonnet-4-6")
+    assert controller.current_rate == 1200.0
+
+    controller.on_throttle(3.0)
+    assert controller.current_rate == 600.0
+    assert sleeps == [3.0]
+
+    controller.on_success()
+    assert controller.current_rate == 600.0 + MODULE.RATE_ADDITIVE_INCREASE
+
+    controller.current_rate = controller.ceiling
+    controller.on_success()
+    assert controller.current_rate == controller.ceiling
+
+
+def test_rate_controller_env_limits_cap_rpm_and_prompt_tokens(monkeypatch):
+    monkeypatch.setenv("GAUNTLET_RPM_GEMINI_CLI", "30")
+    monkeypatch.setenv("GAUNTLET_TPM_GEMINI_CLI", "6000")
+    sleeps = []
+    monkeypatch.setattr(MODULE.time, "sleep", sleeps.append)
+    clock = [100.0]
+    monkeypatch.setattr(MODULE.time, "monotonic", lambda: clock[0])
+
+    controller = MODULE.RateController("gemini-cli/gemini-3-flash-preview")
+    assert controller.current_rate == controller.ceiling == 30.0
+
+    controller.on_success()
+    assert controller.current_rate == 30.0
+
+    controller.acquire(prompt_tokens=5000)
+    assert sleeps == []
+
+    def advance(seconds):  # noqa: ANN001
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(MODULE.time, "sleep", advance)
+    # 1000 tokens left; 3000 more refill at 100/s.
+    controller.acquire(prompt_tokens=4000)
+    assert sleeps == [30.0]
+
+
+def test_call_model_retries_after_rate_limit(monkeypatch):
+    class RateLimitError(Exception):
+        status_code = 429
+
+    attempts = []
+
+    def fake_handler(**kwargs):  # noqa: ANN001
+        attempts.append(kwargs["model"])
+        if len(attempts) == 1:
+            raise RateLimitError("slow down")
+        return "ok", 1, 1
+
+    class Tracker:
+        def record_call(self, model, input_tokens, output_tokens):  # noqa: ANN001
+            return 0.0
+
+    monkeypatch.setitem(MODULE._CLI_ROUTES, "codex", (fake_handler, True))
+    monkeypatch.setattr(MODULE.token_tracking, "tracker", Tracker())
+    monkeypatch.setattr(MODULE, "_rate_controllers", {})
+    monkeypatch.setattr(MODULE.time, "sleep", lambda seconds: None)
+
+    assert call_model("codex/gpt-5.5", "system", "user") == ("ok", 1, 1)
+    assert len(attempts) == 2
+    assert MODULE.get_rate_controller("codex/gpt-5.5").current_rate == 150.0 + MODULE.RATE_ADDITIVE_INCREASE
+
+
+def test_timeout_for_caps_fast_models_only():
+    assert MODULE.timeout_for("gpt-4o-mini", 1800) == 120
+    assert MODULE.timeout_for("gemini/gemini-3-flash", 1800) == 240
+    assert MODULE.timeout_for("gpt-4o-mini", 60) == 60
+    assert MODULE.timeout_for("claude-opus-4-7", 1800) == 1800
+    assert MODULE.timeout_for("gemini-cli/gemini-3-flash-preview", 1800) == 1800
+
+
+def test_call_model_retries_once_after_capped_timeout(monkeypatch):
+    class Timeout(Exception):  # noqa: N818 - _TIMEOUT_ERROR_NAMES matches this name
+        pass
+
+    timeouts = []
+
+    def fake_completion(**kwargs):  # noqa: ANN001
+        timeouts.append(kwargs["timeout"])
+        raise Timeout("request timed out")
+
+    class Tracker:
+        def record_call(self, model, input_tokens, output_tokens):  # noqa: ANN001
+            return 0.0
+
+    monkeypatch.setattr(MODULE, "completion", fake_completion)
+    monkeypatch.setattr(MODULE.token_tracking, "tracker", Tracker())
+    monkeypatch.setattr(MODULE, "_rate_controllers", {})
+
+    with pytest.raises(Timeout):
+        call_model("gpt-4o-mini", "system", "user", timeout=1800)
+    assert timeouts == [120, 120]
+
+
+def test_bulkhead_shares_one_semaphore_per_provider():
+    bulkhead = MODULE.Bulkhead(limit=2)
+
+    assert bulkhead.acquire("gemini/gemini-3-pro") is bulkhead.acquire("gemini/gemini-3-flash")
+    assert bulkhead.acquire("codex/gpt-5.5") is not bulkhead.acquire("gemini/gemini-3-pro")
+
+    with bulkhead.slot("codex/gpt-5.5"), bulkhead.slot("codex/gpt-5.5"):
+        assert not bulkhead.acquire("codex/gpt-5.5").acquire(blocking=False)
+
+
+def test_bulkhead_limits_are_overridable_per_provider(monkeypatch):
+    monkeypatch.setenv("GAUNTLET_CONCURRENCY_GEMINI_CLI", "3")
+    bulkhead = MODULE.Bulkhead(limit=16)
+
+    assert bulkhead.limit_for("gemini-cli/gemini-3-pro") == 3
+    assert bulkhead.limit_for("codex/gpt-5.5") == 16
+
+    held = bulkhead.acquire("codex/gpt-5.5")
+    bulkhead.set_limit("codex", 1)
+    assert bulkhead.limit_for("codex/gpt-5.5") == 1
+    sem = bulkhead.acquire("codex/gpt-5.5")
+    assert sem is not held
+    assert sem.acquire(blocking=False)
+    assert not sem.acquire(blocking=False)
+
+
+def test_provider_limits_reject_unknown_providers(monkeypatch):
+    bulkhead = MODULE.Bulkhead(limit=16)
+
+    with pytest.raises(ValueError, match="Unknown provider 'openai'"):
+        bulkhead.set_limit("openai", 2)
+    bulkhead.set_limit("gpt-4o", 2)
+    assert bulkhead.limit_for("gpt-4o-mini") == 2
+
+    monkeypatch.setenv("GAUNTLET_CONCURRENCY_GEMINI_CLI", "3")
+    MODULE.check_provider_env_limits()
+    monkeypatch.setenv("GAUNTLET_RPM_ANTHROPIC", "60")
+    with pytest.raises(ValueError, match="GAUNTLET_RPM_ANTHROPIC"):
+        MODULE.check_provider_env_limits()
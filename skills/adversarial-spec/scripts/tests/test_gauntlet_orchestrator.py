@@ -14,6 +14,45 @@ from gauntlet.orchestrator import (
 from token_tracking import TokenTracker
 
 
+@pytest.fixture
+def stubbed_run(monkeypatch, tmp_path):
+    """Stub run_gauntlet's persistence and bookkeeping inside tmp_path.
+
+    Tests patch the phases they exercise (attacks, synthesis, filtering,
+    evaluation). Returns the token tracker and the phase metrics passed to
+    update_run_manifest.
+    """
+    run = SimpleNamespace(tracker=TokenTracker(), manifest_updates=[])
+
+    def fake_update_run_manifest(manifest_path, phase_metrics):  # noqa: ANN001
+        run.manifest_updates.append(phase_metrics)
+        return manifest_path or str(tmp_path / "manifest.json")
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("gauntlet.orchestrator.token_tracking.tracker", run.tracker)
+    monkeypatch.setattr("gauntlet.orchestrator.get_spec_hash", lambda spec: "a" * 64)
+    monkeypatch.setattr("gauntlet.orchestrator.get_config_hash", lambda *a, **kw: "cfg")
+    monkeypatch.setattr("gauntlet.orchestrator.save_checkpoint", lambda *a, **kw: None)
+    monkeypatch.setattr("gauntlet.orchestrator._track_dedup_stats", lambda **kw: None)
+    monkeypatch.setattr("gauntlet.orchestrator.add_resolved_concern", lambda *a, **kw: None)
+    monkeypatch.setattr("gauntlet.orchestrator.update_adversary_stats", lambda r: None)
+    monkeypatch.setattr("gauntlet.orchestrator.save_gauntlet_run", lambda r, s: str(tmp_path / "run.json"))
+    monkeypatch.setattr("gauntlet.orchestrator.calculate_medals", lambda *a, **kw: [])
+    monkeypatch.setattr("gauntlet.orchestrator.save_medal_reports", lambda m: str(tmp_path / "medals.txt"))
+    monkeypatch.setattr("gauntlet.orchestrator.update_run_manifest", fake_update_run_manifest)
+    monkeypatch.setattr("gauntlet.orchestrator.expand_clustered_evaluations", lambda e, cm: e)
+    monkeypatch.setattr("builtins.input", lambda prompt: "n")
+    return run
+
+
+def _synthesis(total_concerns: int) -> BigPictureSynthesis:
+    return BigPictureSynthesis(
+        total_concerns=total_concerns, unique_texts=total_concerns,
+        real_issues=[], hidden_connections=[], whats_missing=[],
+        meta_concern="", high_signal=[], raw_response="summary",
+    )
+
+
 def test_token_tracker_thread_safety():
     """Concurrent TokenTracker.record_call() calls must not lose data."""
     tracker = TokenTracker()
@@ -192,6 +231,53 @@ def test_run_gauntlet_records_phase_metrics_in_manifest(monkeypatch, tmp_path):
     assert result.spec_hash == "a" * 64
 
 
+def test_synthesis_overlaps_filtering_with_separate_token_metrics(monkeypatch, stubbed_run):
+    """Phase 2 runs while Phase 3 filters; each phase keeps its own token count."""
+    from gauntlet.orchestrator import run_gauntlet
+
+    tracker = stubbed_run.tracker
+    concern = Concern(adversary="paranoid_security", text="Guard the edge case.", id="PARA-1")
+    synthesis = _synthesis(1)
+    filtering_started = threading.Event()
+
+    def fake_synthesis(concerns, model, config):  # noqa: ANN001
+        # Only returns once Phase 3 has started, so a sequential run would stall.
+        assert filtering_started.wait(timeout=5)
+        tracker.record_call("codex/gpt-5.5", 40, 20)
+        return synthesis
+
+    def fake_filter(concerns, model, spec_hash, config):  # noqa: ANN001
+        filtering_started.set()
+        tracker.record_call("codex/gpt-5.5", 3, 1)
+        return concerns, [], []
+
+    monkeypatch.setattr(
+        "gauntlet.orchestrator.generate_attacks",
+        lambda spec, adversaries, models, config, prompts=None: ([concern], {}, {}),
+    )
+    monkeypatch.setattr("gauntlet.orchestrator.generate_big_picture_synthesis", fake_synthesis)
+    monkeypatch.setattr("gauntlet.orchestrator.filter_concerns_with_explanations", fake_filter)
+    monkeypatch.setattr(
+        "gauntlet.orchestrator.evaluate_concerns",
+        lambda spec, concerns, model, config: [
+            Evaluation(concern=concern, verdict="accepted", reasoning="fix it")
+        ],
+    )
+
+    run_gauntlet(
+        spec="# Test Spec",
+        adversaries=["paranoid_security"],
+        attack_models=["codex/gpt-5.5"],
+        eval_models=["claude-opus-4-7"],
+        allow_rebuttals=False,
+        use_multi_model=False,
+        run_final_boss=False,
+    )
+
+    by_phase = {u["phase"]: u for u in stubbed_run.manifest_updates if "phase" in u}
+    assert (by_phase["phase_2"]["input_tokens"], by_phase["phase_2"]["output_tokens"]) == (40, 20)
+    assert (by_phase["phase_3"]["input_tokens"], by_phase["phase_3"]["output_tokens"]) == (3, 1)
+
 # =============================================================================
 # T5: Tests for _load_approved_prompts
 # =============================================================================
@@ -347,6 +433,98 @@ class TestResolveAndFilterAdversaries:
         assert resolved == ["burned_oncall", "minimalist", "paranoid_security"]
 
 
+def test_resume_reuses_journaled_phase_4_batches(monkeypatch, stubbed_run):
+    """With --resume, concerns already in the evaluation journal are not re-evaluated."""
+    from gauntlet.orchestrator import run_gauntlet
+    from gauntlet.persistence import append_evaluation_journal, load_evaluation_journal
+
+    done = Concern(
+        adversary="paranoid_security", text="Already evaluated.", id="PARA-1",
+        source_model="codex/gpt-5.5",
+    )
+    todo = Concern(
+        adversary="paranoid_security", text="Still pending.", id="PARA-2",
+        source_model="codex/gpt-5.5",
+    )
+    synthesis = _synthesis(2)
+    evaluated: list[str] = []
+
+    monkeypatch.setattr(
+        "gauntlet.orchestrator.generate_attacks",
+        lambda spec, adversaries, models, config, prompts=None: (
+            [done, todo], {}, {"paranoid_security@codex/gpt-5.5": "1. x"},
+        ),
+    )
+    monkeypatch.setattr("gauntlet.orchestrator.generate_big_picture_synthesis", lambda c, m, cfg: synthesis)
+    monkeypatch.setattr("gauntlet.orchestrator.filter_concerns_with_explanations", lambda c, m, s, config: (c, [], []))
+
+    def fake_evaluate_concerns(spec, concerns, model, config):  # noqa: ANN001
+        evaluated.extend(c.id for c in concerns)
+        return [Evaluation(concern=c, verdict="accepted", reasoning="fresh") for c in concerns]
+
+    monkeypatch.setattr("gauntlet.orchestrator.evaluate_concerns", fake_evaluate_concerns)
+
+    append_evaluation_journal(
+        "a" * 64, "cfg", [Evaluation(concern=done, verdict="accepted", reasoning="journaled")],
+    )
+
+    result = run_gauntlet(
+        spec="# Test Spec",
+        adversaries=["paranoid_security"],
+        attack_models=["codex/gpt-5.5"],
+        eval_models=["claude-opus-4-7"],
+        allow_rebuttals=False,
+        use_multi_model=False,
+        run_final_boss=False,
+        resume=True,
+    )
+
+    assert evaluated == ["PARA-2"]
+    assert [(e.concern.id, e.reasoning) for e in result.evaluations] == [
+        ("PARA-1", "journaled"), ("PARA-2", "fresh"),
+    ]
+    assert {e.concern.id for e in load_evaluation_journal("a" * 64, "cfg")} == {"PARA-1", "PARA-2"}
+
+
+def test_fully_filtered_run_skips_evaluation_and_final_boss_prompt(monkeypatch, stubbed_run):
+    """Every concern already resolved: no Phase 4 calls and no Final Boss prompt."""
+    from gauntlet.orchestrator import run_gauntlet
+
+    concern = Concern(adversary="paranoid_security", text="c1", source_model="codex/gpt-5.5")
+    synthesis = _synthesis(1)
+
+    def fail(*args, **kwargs):  # noqa: ANN001
+        raise AssertionError("should not be called")
+
+    monkeypatch.setattr("builtins.input", fail)
+    monkeypatch.setattr(
+        "gauntlet.orchestrator.generate_attacks",
+        lambda spec, adversaries, models, config, prompts=None: (
+            [concern], {"paranoid_security": 1.0}, {"paranoid_security@codex/gpt-5.5": "1. c1"},
+        ),
+    )
+    monkeypatch.setattr("gauntlet.orchestrator.generate_big_picture_synthesis", lambda c, m, cfg: synthesis)
+    monkeypatch.setattr(
+        "gauntlet.orchestrator.filter_concerns_with_explanations",
+        lambda c, m, s, config: ([], c, []),
+    )
+    monkeypatch.setattr("gauntlet.orchestrator.evaluate_concerns", fail)
+    monkeypatch.setattr("gauntlet.orchestrator.clear_evaluation_journal", fail)
+
+    result = run_gauntlet(
+        spec="# Test Spec",
+        adversaries=["paranoid_security"],
+        attack_models=["codex/gpt-5.5"],
+        eval_models=["claude-opus-4-7"],
+        allow_rebuttals=True,
+        use_multi_model=False,
+        run_final_boss=False,
+    )
+
+    assert result.evaluations == []
+    assert result.final_boss_result is None
+
+
 # =============================================================================
 # T8: Quality gate integration in orchestrator
 # =============================================================================
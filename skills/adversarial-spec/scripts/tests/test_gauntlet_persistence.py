@@ -8,9 +8,14 @@ from gauntlet.persistence import (
     CONCERNS_PHASE,
     EVALUATION_PHASE,
     _write_json_atomic,
+    append_evaluation_journal,
+    calculate_explanation_confidence,
+    clear_evaluation_journal,
     format_path_safe,
     get_config_hash,
     get_spec_hash,
+    load_evaluation_journal,
+    load_gauntlet_run,
     load_partial_run,
     load_run_manifest,
     save_checkpoint,
@@ -45,11 +50,10 @@ def test_write_json_atomic_crash_safety(monkeypatch, checkpoint_dir):
     _write_json_atomic(target, {"key": "value"})
     original = json.loads(target.read_text())
 
-    def broken_dump(data, fp, indent=2):  # noqa: ANN001
-        fp.write('{"broken": ')
+    def broken_fsync(fd):  # noqa: ANN001
         raise OSError("disk full")
 
-    monkeypatch.setattr("gauntlet.persistence.json.dump", broken_dump)
+    monkeypatch.setattr("gauntlet.persistence.os.fsync", broken_fsync)
 
     with pytest.raises(OSError, match="disk full"):
         _write_json_atomic(target, {"key": "new-value"})
@@ -58,6 +62,15 @@ def test_write_json_atomic_crash_safety(monkeypatch, checkpoint_dir):
     assert list(checkpoint_dir.glob("*.tmp")) == []
 
 
+def test_write_json_atomic_compact_mode(checkpoint_dir):
+    target = checkpoint_dir / "compact.json"
+    _write_json_atomic(target, {"key": [1, 2]}, indent=None)
+
+    text = target.read_text()
+    assert text.endswith("\n") and text.count("\n") == 1
+    assert json.loads(text) == {"key": [1, 2]}
+
+
 def test_load_partial_run_valid_checkpoint(checkpoint_dir):
     """Matching checkpoint envelopes should deserialize into resumable objects."""
     config = GauntletConfig()
@@ -151,6 +164,35 @@ def test_concern_set_hash_mismatch_forces_reeval(checkpoint_dir, capsys):
     assert "concern set changed" in capsys.readouterr().err
 
 
+def test_evaluation_journal_replays_batches_and_skips_torn_lines(checkpoint_dir):
+    spec_hash = "ab12cd34" * 8
+    evaluation_a = Evaluation(
+        concern=_concern("paranoid_security", "Concern A", "PARA-1"),
+        verdict="accepted",
+        reasoning="valid",
+        votes={"accepted": 2},
+    )
+    evaluation_b = Evaluation(
+        concern=_concern("burned_oncall", "Concern B", "BURN-2"),
+        verdict="dismissed",
+        reasoning="invalid",
+    )
+
+    append_evaluation_journal(spec_hash, "cfg", [evaluation_a])
+    append_evaluation_journal(spec_hash, "other-cfg", [evaluation_b])
+    append_evaluation_journal(spec_hash, "cfg", [evaluation_b])
+    with open(checkpoint_dir / f"evaluations-{spec_hash[:8]}.jsonl", "ab") as fh:
+        fh.write(b'{"config_hash": "cfg", "evaluation": {"conc')
+
+    replayed = load_evaluation_journal(spec_hash, "cfg")
+
+    assert [e.concern.id for e in replayed] == ["PARA-1", "BURN-2"]
+    assert replayed[0].votes == {"accepted": 2}
+
+    clear_evaluation_journal(spec_hash)
+    assert load_evaluation_journal(spec_hash, "cfg") == []
+
+
 def test_config_hash_deterministic():
     """Config hashes should be stable and sensitive to meaningful changes."""
     config_a = GauntletConfig(timeout=300)
@@ -239,6 +281,16 @@ def test_spec_as_gauntleted_persisted_and_bindable(checkpoint_dir):
     assert get_spec_hash(persisted) == spec_hash
 
 
+def test_get_spec_hash_is_memoized_per_spec():
+    get_spec_hash.cache_clear()
+    spec = "# Spec\n" + "body " * 1000
+
+    first = get_spec_hash(spec)
+    assert get_spec_hash(spec) == first
+    assert get_spec_hash.cache_info().hits == 1
+    assert get_spec_hash(spec + "!") != first
+
+
 def test_update_run_manifest_preserves_spec_path_across_phases(checkpoint_dir):
     """The orchestrator's stamping mechanism records the path and never drops it.
 
@@ -274,3 +326,340 @@ def test_update_run_manifest_preserves_spec_path_across_phases(checkpoint_dir):
     assert manifest["spec_as_gauntleted_path"] == spec_path
     assert manifest["status"] == "completed"
     assert len(manifest["phases"]) == 1
+
+
+def test_load_gauntlet_run_memoizes_until_file_changes(monkeypatch, tmp_path):
+    """Repeated loads reuse the parsed run; rewriting the file invalidates it."""
+    monkeypatch.setattr("gauntlet.persistence.RUNS_DIR", tmp_path)
+    run_file = tmp_path / "run.json"
+    run_file.write_text(json.dumps({"spec_hash": "aaa"}))
+
+    first = load_gauntlet_run("run.json")
+    assert load_gauntlet_run("run.json") is first
+
+    run_file.write_text(json.dumps({"spec_hash": "bbbbbb"}))
+    assert load_gauntlet_run("run.json") == {"spec_hash": "bbbbbb"}
+    assert load_gauntlet_run("missing.json") is None
+
+
+def test_load_partial_run_accepts_legacy_sha256_data_hash(checkpoint_dir):
+    """Checkpoints written with the old SHA-256 integrity hash still resume."""
+    import hashlib
+
+    from gauntlet.persistence import _canonical_json
+
+    config = GauntletConfig()
+    spec_hash = "0badf00d" * 8
+    save_checkpoint(
+        "concerns", CONCERNS_PHASE, [_concern("minimalist", "x", "MIN-1")],
+        spec_hash, get_config_hash(config),
+    )
+    path = checkpoint_dir / f"concerns-{spec_hash[:8]}.json"
+    envelope = json.loads(path.read_text())
+    assert len(envelope["_meta"]["data_hash"]) == 32
+
+    envelope["_meta"]["data_hash"] = hashlib.sha256(
+        _canonical_json(envelope["data"]).encode()
+    ).hexdigest()
+    path.write_text(json.dumps(envelope))
+
+    partial = load_partial_run(spec_hash, config)
+
+    assert partial["phase_1"]["concerns"][0].id == "MIN-1"
+
+
+@pytest.fixture
+def stats_dir(monkeypatch, tmp_path):
+    """Isolate the adversary stats and resolved concerns databases."""
+    monkeypatch.setattr("gauntlet.persistence.STATS_FILE", tmp_path / "adversary_stats.json")
+    monkeypatch.setattr("gauntlet.persistence.STATS_LOG", tmp_path / "adversary_stats.log")
+    monkeypatch.setattr(
+        "gauntlet.persistence.RESOLVED_CONCERNS_FILE", tmp_path / "resolved_concerns.json"
+    )
+    monkeypatch.setattr(
+        "gauntlet.persistence.RESOLVED_CONCERNS_LOG", tmp_path / "resolved_concerns.log"
+    )
+    return tmp_path
+
+
+def _stats_result():
+    from gauntlet.core_types import GauntletResult
+
+    concern = _concern("minimalist", "too many layers", "MIN-1")
+    return GauntletResult(
+        concerns=[concern],
+        evaluations=[Evaluation(concern=concern, verdict="accepted", reasoning="yes")],
+        rebuttals=[],
+        final_concerns=[concern],
+        adversary_model="attack-model",
+        eval_model="eval-model",
+        total_time=1.0,
+        total_cost=0.5,
+    )
+
+
+def test_update_adversary_stats_appends_delta_without_rewriting_snapshot(stats_dir):
+    from gauntlet.persistence import load_adversary_stats, update_adversary_stats
+
+    update_adversary_stats(_stats_result())
+    stats = update_adversary_stats(_stats_result())
+
+    assert not (stats_dir / "adversary_stats.json").exists()
+    assert len((stats_dir / "adversary_stats.log").read_text().splitlines()) == 2
+    assert stats["total_runs"] == 2
+    reloaded = load_adversary_stats()
+    assert reloaded["total_runs"] == 2
+    assert reloaded["adversaries"]["minimalist"]["accepted"] == 2
+    assert reloaded["model_pairings"]["attack-model + eval-model"]["accepted"] == 2
+
+
+def test_adversary_stats_compaction_folds_log_exactly_once(monkeypatch, stats_dir):
+    from gauntlet.persistence import (
+        compact_adversary_stats,
+        load_adversary_stats,
+        update_adversary_stats,
+        write_json_atomic,
+    )
+
+    monkeypatch.setattr("gauntlet.persistence.LOG_COMPACT_THRESHOLD", 3)
+    for _ in range(3):
+        update_adversary_stats(_stats_result())
+
+    assert (stats_dir / "adversary_stats.log").read_text() == ""
+    assert load_adversary_stats()["total_runs"] == 3
+
+    # A crash after the snapshot write but before the log trim must not
+    # replay the already-folded records.
+    update_adversary_stats(_stats_result())
+    log_text = (stats_dir / "adversary_stats.log").read_text()
+    write_json_atomic(stats_dir / "adversary_stats.json", load_adversary_stats())
+    (stats_dir / "adversary_stats.log").write_text(log_text)
+    assert load_adversary_stats()["total_runs"] == 4
+
+    compact_adversary_stats()
+    assert (stats_dir / "adversary_stats.log").read_text() == ""
+    assert load_adversary_stats()["total_runs"] == 4
+
+
+def test_resolved_concern_updates_are_logged_and_replayed(stats_dir):
+    from gauntlet.persistence import (
+        add_resolved_concern,
+        load_resolved_concerns,
+        record_explanation_match,
+        save_resolved_concerns,
+        verify_explanation,
+    )
+
+    add_resolved_concern("pattern", "already handled", "minimalist")
+    explanation_id = load_resolved_concerns()["concerns"][0]["id"]
+    record_explanation_match(explanation_id)
+    record_explanation_match(explanation_id)
+    verify_explanation(explanation_id)
+
+    assert len((stats_dir / "resolved_concerns.log").read_text().splitlines()) == 4
+    concern = load_resolved_concerns()["concerns"][0]
+    assert concern["times_matched"] == 2
+    assert concern["verified_at"] is not None
+
+    save_resolved_concerns(load_resolved_concerns())
+    assert (stats_dir / "resolved_concerns.log").read_text() == ""
+    assert load_resolved_concerns()["concerns"][0]["times_matched"] == 2
+
+
+def test_run_bookkeeping_is_flushed_before_reads(stats_dir, capsys):
+    import threading
+
+    from gauntlet.persistence import (
+        add_resolved_concern,
+        load_resolved_concerns,
+        queue_run_bookkeeping,
+    )
+
+    release = threading.Event()
+    seen = []
+
+    def slow_add(pattern):
+        release.wait(5)
+        add_resolved_concern(pattern, "already handled", "minimalist")
+        # A read on the writer thread must not wait on the writer itself.
+        seen.extend(c["pattern"] for c in load_resolved_concerns()["concerns"])
+
+    def broken():
+        raise OSError("disk full")
+
+    queue_run_bookkeeping(slow_add, "pattern")
+    queue_run_bookkeeping(broken)
+    release.set()
+
+    assert [c["pattern"] for c in load_resolved_concerns()["concerns"]] == ["pattern"]
+    assert seen == ["pattern"]
+    assert "run bookkeeping broken failed: disk full" in capsys.readouterr().err
+
+
+def test_load_resolved_concerns_memoized_until_database_changes(monkeypatch, stats_dir):
+    from gauntlet import persistence
+    from gauntlet.persistence import (
+        add_resolved_concern,
+        load_resolved_concerns,
+        record_explanation_match,
+    )
+
+    add_resolved_concern("pattern", "already handled", "minimalist")
+    first = load_resolved_concerns()
+
+    calls = []
+    real_load = persistence._load_json_safe
+    monkeypatch.setattr(
+        persistence, "_load_json_safe", lambda path: calls.append(path) or real_load(path)
+    )
+
+    first["concerns"].clear()  # callers get their own copy
+    second = load_resolved_concerns()
+    assert calls == []
+    assert len(second["concerns"]) == 1
+
+    record_explanation_match(second["concerns"][0]["id"])
+    assert load_resolved_concerns()["concerns"][0]["times_matched"] == 1
+    assert len(calls) == 1
+
+
+@pytest.fixture
+def runs_index_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr("gauntlet.persistence.RUNS_INDEX_FILE", tmp_path / "runs_index.jsonl")
+    monkeypatch.setattr("gauntlet.persistence._LEGACY_RUNS_INDEX_FILE", tmp_path / "runs_index.json")
+    return tmp_path
+
+
+def test_runs_index_appends_lines_and_trims_to_limit(monkeypatch, runs_index_dir):
+    from gauntlet.persistence import _append_runs_index, _read_runs_index_tail
+
+    monkeypatch.setattr("gauntlet.persistence.RUNS_INDEX_LIMIT", 3)
+    monkeypatch.setattr("gauntlet.persistence.RUNS_INDEX_MAX_BYTES", 200)
+    monkeypatch.setattr("gauntlet.persistence._RUNS_INDEX_TAIL_BYTES", 64)
+
+    for i in range(10):
+        _append_runs_index({"file": f"run-{i}.json", "spec_hash": "abcdef12"})
+
+    lines = (runs_index_dir / "runs_index.jsonl").read_text().splitlines()
+    assert len(lines) <= 6
+    assert [e["file"] for e in _read_runs_index_tail(2)] == ["run-8.json", "run-9.json"]
+    # A window too small for `limit` entries falls back to the whole file.
+    assert _read_runs_index_tail(3)[-1]["file"] == "run-9.json"
+
+
+def test_runs_index_migrates_legacy_json_array(runs_index_dir):
+    from gauntlet.persistence import _append_runs_index, list_gauntlet_runs
+
+    legacy = {"runs": [{"file": "old.json", "timestamp": "2026-01-01T00:00:00", "spec_hash": "0ld"}]}
+    (runs_index_dir / "runs_index.json").write_text(json.dumps(legacy))
+    assert "[0ld]" in list_gauntlet_runs()
+
+    _append_runs_index({"file": "new.json", "timestamp": "2026-02-01T00:00:00", "spec_hash": "n3w"})
+
+    listing = list_gauntlet_runs()
+    assert listing.index("[n3w]") < listing.index("[0ld]")
+
+
+def test_adversary_stats_skip_idle_adversaries_and_keep_full_precision(stats_dir):
+    from gauntlet.persistence import _apply_adversary_stats_delta
+
+    idle = {key: 0 for key in (
+        "concerns_raised", "accepted", "acknowledged", "dismissed", "deferred",
+        "rebuttals_won", "rebuttals_lost", "dismissal_effort", "signal_score",
+    )}
+    active = {**idle, "concerns_raised": 3, "accepted": 1, "signal_score": 0.1234}
+    stats = {"adversaries": {}, "models": {}}
+
+    _apply_adversary_stats_delta(stats, {"adversaries": {"minimalist": active, "lazy": idle}})
+    before = dict(stats["adversaries"]["lazy"])
+    _apply_adversary_stats_delta(stats, {"adversaries": {"minimalist": idle, "lazy": idle}})
+
+    assert stats["adversaries"]["lazy"] == before
+    assert stats["adversaries"]["minimalist"]["acceptance_rate"] == 1 / 3
+    assert stats["adversaries"]["minimalist"]["avg_signal_score"] == 0.1234
+    assert stats["total_runs"] == 2
+
+
+def test_load_gauntlet_run_fields_stops_before_unrequested_payload(monkeypatch, tmp_path):
+    from gauntlet.persistence import load_gauntlet_run_fields
+
+    monkeypatch.setattr("gauntlet.persistence.RUNS_DIR", tmp_path)
+    # The trailing payload is not valid JSON: reaching it would fail the load.
+    (tmp_path / "run.json").write_text(
+        '{"timestamp": "2026-01-01", "spec_hash": "abc", "spec_length": 3, "result": {broken'
+    )
+
+    assert load_gauntlet_run_fields("run.json", {"spec_hash", "spec_length"}) == {
+        "spec_hash": "abc",
+        "spec_length": 3,
+    }
+    assert load_gauntlet_run_fields("run.json", {"result"}) is None
+    assert load_gauntlet_run_fields("missing.json", {"spec_hash"}) is None
+
+    (tmp_path / "ok.json").write_text(json.dumps({"spec_hash": "x", "result": {"concerns": []}}, indent=2))
+    assert load_gauntlet_run_fields("ok.json", {"result", "nope"}) == {"result": {"concerns": []}}
+
+
+def test_explanation_confidence_scores_age_spec_change_and_usage():
+    from datetime import datetime, timedelta
+
+    added = (datetime.now() - timedelta(days=40)).isoformat()
+    explanation = {
+        "confidence": 0.9, "added_at": added, "spec_hash": "old", "times_matched": 3,
+    }
+
+    first = calculate_explanation_confidence(explanation, "new")
+    assert first == calculate_explanation_confidence(dict(explanation), "new")
+    assert first[1] == "old (40d); spec changed; validated 3x"
+
+    assert calculate_explanation_confidence({"added_at": "not a date"}) == (0.45, "invalid date")
+    assert calculate_explanation_confidence(
+        {"added_at": datetime.now().isoformat() + "Z"}
+    ) == (0.9, "fresh")
+
+
+def test_adversary_stats_backfill_legacy_entries_and_derive_once_per_replay(stats_dir):
+    from gauntlet.persistence import _replay_adversary_stats_deltas
+
+    run = {key: 0 for key in (
+        "concerns_raised", "accepted", "acknowledged", "dismissed", "deferred",
+        "rebuttals_won", "rebuttals_lost", "dismissal_effort", "signal_score",
+    )}
+    run.update(concerns_raised=2, accepted=1, dismissed=1, dismissal_effort=40, signal_score=0.5)
+    legacy = {
+        "concerns_raised": 2, "accepted": 0, "dismissed": 0, "deferred": 0,
+        "rebuttals_won": 0, "rebuttals_lost": 0, "notable_finds": [],
+        "acceptance_rate": 0.0, "avg_dismissal_effort": 0, "avg_signal_score": 0.0,
+    }
+    stats = {"adversaries": {"minimalist": legacy}, "models": {}}
+
+    _replay_adversary_stats_deltas(stats, [{"adversaries": {"minimalist": run}}] * 2)
+
+    entry = stats["adversaries"]["minimalist"]
+    assert entry["concerns_raised"] == 6
+    assert entry["acknowledged"] == 0
+    assert entry["acceptance_rate"] == 2 / 6
+    assert entry["avg_dismissal_effort"] == 40
+    assert entry["avg_signal_score"] == 0.5
+    assert stats["total_runs"] == 2
+
+
+def test_queued_run_writes_land_after_flush_in_order(monkeypatch, runs_index_dir):
+    from gauntlet import persistence
+
+    appends = []
+    real_append = persistence._append_runs_index
+    monkeypatch.setattr(
+        persistence, "_append_runs_index",
+        lambda *entries: appends.append(len(entries)) or real_append(*entries),
+    )
+    monkeypatch.setattr(persistence, "RUNS_DIR", runs_index_dir / "runs")
+
+    paths = [runs_index_dir / "runs" / f"run-{i}.json" for i in range(3)]
+    for i, path in enumerate(paths):
+        persistence._queue_run_write(path, {"n": i}, {"file": path.name, "spec_hash": "abc"})
+    persistence.flush_gauntlet_runs()
+
+    assert [json.loads(p.read_text()) for p in paths] == [{"n": 0}, {"n": 1}, {"n": 2}]
+    assert sum(appends) == 3
+    assert [e["file"] for e in persistence._read_runs_index_tail(10)] == [p.name for p in paths]
@@ -5,7 +5,11 @@ import json
 import pytest
 from adversaries import MINIMALIST
 from gauntlet.core_types import Concern, GauntletConfig
-from gauntlet.phase_1_attacks import _parse_json_concerns, generate_attacks
+from gauntlet.phase_1_attacks import (
+    _parse_json_concerns,
+    generate_attacks,
+    parse_numbered_list,
+)
 
 
 def test_generate_attacks_rejects_empty_adversary_list():
@@ -157,6 +161,17 @@ def test_parse_handles_three_digit_with_paren_format(monkeypatch):
     assert len(concerns) == 5, f"Expected 5 concerns (98..102), got {len(concerns)}"
 
 
+def test_parse_keeps_leading_digits_of_item_text():
+    """Only the list marker is stripped; "2FA" must not lose its "2"."""
+    response = "1. 2FA codes are replayable\n   - within the window\n2) 404 pages leak paths"
+
+    concerns = parse_numbered_list(response, "paranoid_security", "test-model")
+
+    assert [c.text for c in concerns] == [
+        "2FA codes are replayable within the window",
+        "404 pages leak paths",
+    ]
+
 # =============================================================================
 # Severity extraction (Layer A.2): severity was previously dropped on the
 # floor — every parsed concern landed with `severity="medium"`. The parser
@@ -515,3 +530,56 @@ class TestJsonFallbackChain:
             models=["claude-opus-4-7"], config=GauntletConfig(),
         )
         assert captured["json_mode"] is True
+
+
+def test_generate_attacks_staggers_providers_side_by_side(monkeypatch):
+    """One provider's rate-limit pauses must not delay another provider's launches."""
+    clock = {"now": 0.0}
+    sleeps = []
+
+    def fake_sleep(seconds):  # noqa: ANN001
+        sleeps.append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr("gauntlet.phase_1_attacks.time.sleep", fake_sleep)
+    monkeypatch.setattr("gauntlet.phase_1_attacks.time.monotonic", lambda: clock["now"])
+    monkeypatch.setattr("gauntlet.phase_1_attacks.get_rate_limit_config", lambda model: (1, 10))
+    monkeypatch.setattr(
+        "gauntlet.phase_1_attacks.call_model",
+        lambda model, system_prompt, user_message, timeout, codex_reasoning, json_mode=False: ("1. Concern", 1, 1),
+    )
+
+    concerns, _, _ = generate_attacks(
+        spec="spec",
+        adversaries=["minimalist", "paranoid_security"],
+        models=["gemini/gemini-3-pro", "codex/gpt-5.5"],
+        config=GauntletConfig(),
+    )
+
+    assert len(concerns) == 4
+    assert sum(sleeps) == 10
+
+
+def test_generate_attacks_orders_concerns_by_pair_not_completion(monkeypatch):
+    """A slow first adversary still contributes its concerns first."""
+    import threading
+
+    second_done = threading.Event()
+
+    def fake_call_model(model, system_prompt, user_message, timeout, codex_reasoning, json_mode=False):
+        if MINIMALIST.persona in system_prompt:
+            assert second_done.wait(timeout=5)
+            return "1. Slow concern", 1, 1
+        second_done.set()
+        return "1. Fast concern", 1, 1
+
+    monkeypatch.setattr("gauntlet.phase_1_attacks.call_model", fake_call_model)
+
+    concerns, _, _ = generate_attacks(
+        spec="spec",
+        adversaries=["minimalist", "paranoid_security"],
+        models=["test-model"],
+        config=GauntletConfig(),
+    )
+
+    assert [c.text for c in concerns] == ["Slow concern", "Fast concern"]
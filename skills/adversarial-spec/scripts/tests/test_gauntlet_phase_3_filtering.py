@@ -0,0 +1,193 @@
+"""Regression tests for Phase 3 explanation filtering."""
+
+from datetime import datetime
+
+from gauntlet.core_types import Concern, GauntletConfig
+from gauntlet.phase_3_filtering import filter_concerns_with_explanations
+
+
+def _explanation(explanation_id: str, adversary: str) -> dict:
+    return {
+        "id": explanation_id,
+        "adversary": adversary,
+        "pattern": f"token replay {explanation_id}",
+        "explanation": "already handled",
+        "added_at": datetime.now().isoformat(),
+        "confidence": 0.9,
+        "spec_hash": "abc",
+    }
+
+
+def test_filter_loads_resolved_concerns_once(monkeypatch):
+    """The database is read once per filter pass, not once per concern.
+
+    The fake model answers in the per-concern MATCH format, so this also
+    covers the fallback when the batched response is not JSON.
+    """
+    loads = []
+    monkeypatch.setattr(
+        "gauntlet.phase_3_filtering.load_resolved_concerns",
+        lambda: loads.append(1) or {"concerns": [
+            _explanation("E-SEC", "paranoid_security"),
+            _explanation("E-GEN", "general"),
+        ]},
+    )
+    prompts = []
+
+    def fake_call_model(**kwargs):
+        prompts.append(kwargs["user_message"])
+        return ("MATCH: 0" if "drop me" in kwargs["user_message"] else "NO MATCH", 0, 0)
+
+    monkeypatch.setattr("gauntlet.phase_3_filtering.call_model", fake_call_model)
+    recorded = []
+    monkeypatch.setattr("gauntlet.phase_3_filtering.record_explanation_match", recorded.append)
+
+    concerns = [
+        Concern(adversary="paranoid_security", text="drop me: token replay", id="SEC-1"),
+        Concern(adversary="paranoid_security", text="keep me: token replay", id="SEC-2"),
+        Concern(adversary="minimalist", text="keep me too: token replay", id="MIN-1"),
+    ]
+
+    filtered, dropped, noted = filter_concerns_with_explanations(
+        concerns, "cheap-model", "abc", GauntletConfig()
+    )
+
+    assert loads == [1]
+    assert [c.id for c in dropped] == ["SEC-1"]
+    assert sorted(c.id for c in filtered) == ["MIN-1", "SEC-2"]
+    assert noted == []
+    assert recorded == ["E-SEC"]
+    minimalist_prompt = next(
+        p for p in prompts if p.startswith("NEW CONCERN:\nkeep me too")
+    )
+    assert "E-GEN" in minimalist_prompt and "E-SEC" not in minimalist_prompt
+
+
+def test_filter_matches_all_concerns_in_one_batched_call(monkeypatch):
+    monkeypatch.setattr(
+        "gauntlet.phase_3_filtering.load_resolved_concerns",
+        lambda: {"concerns": [
+            _explanation("E-SEC", "paranoid_security"),
+            _explanation("E-GEN", "general"),
+        ]},
+    )
+    calls = []
+
+    def fake_call_model(**kwargs):
+        calls.append(kwargs)
+        # Concern 2 (minimalist) claims the security-only explanation: ignored.
+        return ('{"matches": [{"c": 0, "e": 0}, {"c": 1, "e": null}, {"c": 2, "e": 0}]}', 0, 0)
+
+    monkeypatch.setattr("gauntlet.phase_3_filtering.call_model", fake_call_model)
+    recorded = []
+    monkeypatch.setattr("gauntlet.phase_3_filtering.record_explanation_match", recorded.append)
+
+    concerns = [
+        Concern(adversary="paranoid_security", text="drop me: token replay", id="SEC-1"),
+        Concern(adversary="paranoid_security", text="keep me: token replay", id="SEC-2"),
+        Concern(adversary="minimalist", text="keep me too: token replay", id="MIN-1"),
+    ]
+
+    filtered, dropped, _ = filter_concerns_with_explanations(
+        concerns, "cheap-model", "abc", GauntletConfig()
+    )
+
+    assert len(calls) == 1
+    assert calls[0]["json_mode"] is True
+    assert [c.id for c in dropped] == ["SEC-1"]
+    assert [c.id for c in filtered] == ["SEC-2", "MIN-1"]
+    assert recorded == ["E-SEC"]
+
+
+def test_filter_skips_model_when_no_explanation_overlaps(monkeypatch):
+    monkeypatch.setattr(
+        "gauntlet.phase_3_filtering.load_resolved_concerns",
+        lambda: {"concerns": [_explanation("E-SEC", "paranoid_security")]},
+    )
+    calls = []
+    monkeypatch.setattr(
+        "gauntlet.phase_3_filtering.call_model",
+        lambda **kwargs: calls.append(kwargs) or ("NO MATCH", 0, 0),
+    )
+
+    concerns = [
+        Concern(adversary="paranoid_security", text="Unbounded upload size", id="SEC-1"),
+    ]
+
+    filtered, dropped, noted = filter_concerns_with_explanations(
+        concerns, "cheap-model", "abc", GauntletConfig()
+    )
+
+    assert calls == []
+    assert [c.id for c in filtered] == ["SEC-1"]
+    assert dropped == [] and noted == []
+
+
+def test_filter_matches_reraised_concern_without_model(monkeypatch):
+    monkeypatch.setattr(
+        "gauntlet.phase_3_filtering.load_resolved_concerns",
+        lambda: {"concerns": [_explanation("E-SEC", "paranoid_security")]},
+    )
+    calls = []
+
+    def fake_call_model(**kwargs):
+        calls.append(kwargs)
+        return ('{"matches": []}', 0, 0)
+
+    monkeypatch.setattr("gauntlet.phase_3_filtering.call_model", fake_call_model)
+    recorded = []
+    monkeypatch.setattr("gauntlet.phase_3_filtering.record_explanation_match", recorded.append)
+
+    concerns = [
+        Concern(adversary="paranoid_security", text="keep me: token replay", id="SEC-1"),
+        Concern(adversary="paranoid_security", text="Token replay E-SEC!", id="SEC-2"),
+    ]
+
+    filtered, dropped, _ = filter_concerns_with_explanations(
+        concerns, "cheap-model", "abc", GauntletConfig()
+    )
+
+    assert [c.id for c in dropped] == ["SEC-2"]
+    assert [c.id for c in filtered] == ["SEC-1"]
+    assert recorded == ["E-SEC"]
+    assert len(calls) == 1
+    assert "Token replay E-SEC" not in calls[0]["user_message"]
+
+
+def test_negated_restatement_is_not_matched_locally(monkeypatch):
+    resolved = dict(
+        _explanation("E-SEC", "paranoid_security"),
+        pattern="Session tokens are validated on every request",
+    )
+    monkeypatch.setattr(
+        "gauntlet.phase_3_filtering.load_resolved_concerns",
+        lambda: {"concerns": [resolved]},
+    )
+    calls = []
+
+    def fake_call_model(**kwargs):
+        calls.append(kwargs)
+        return ('{"matches": []}', 0, 0)
+
+    monkeypatch.setattr("gauntlet.phase_3_filtering.call_model", fake_call_model)
+
+    concerns = [
+        Concern(
+            adversary="paranoid_security",
+            text="Session tokens are not validated on every request",
+            id="SEC-1",
+        ),
+        Concern(
+            adversary="paranoid_security",
+            text="Session tokens aren't validated on every request",
+            id="SEC-2",
+        ),
+    ]
+
+    filtered, dropped, _ = filter_concerns_with_explanations(
+        concerns, "cheap-model", "abc", GauntletConfig()
+    )
+
+    assert dropped == []
+    assert [c.id for c in filtered] == ["SEC-1", "SEC-2"]
+    assert len(calls) == 1
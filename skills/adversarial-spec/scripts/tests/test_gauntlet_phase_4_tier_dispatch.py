@@ -15,7 +15,12 @@ import pytest
 
 from gauntlet.batch_tiering import BatchTier
 from gauntlet.core_types import Concern, Evaluation, GauntletConfig
-from gauntlet.phase_4_evaluation import evaluate_concerns_multi_model
+from gauntlet.phase_4_evaluation import (
+    _batch_consensus,
+    evaluate_concerns,
+    evaluate_concerns_cascade,
+    evaluate_concerns_multi_model,
+)
 
 
 def _make_concern(idx: int, adversary: str = "architect", text_len: int = 100) -> Concern:
@@ -31,7 +36,7 @@ def _fake_call_model_factory(per_call_batch_sizes: list[int]):
     in the user_message, so evaluate_concerns can build Evaluation objects.
     """
 
-    def fake(model, system_prompt, user_message, timeout, codex_reasoning, json_mode=False):
+    def fake(model, system_prompt, user_message, timeout, codex_reasoning, json_mode=False, **kwargs):
         # Count concerns in this batch by counting "### Concern" headers in
         # the user message (matches the real format from evaluate_concerns).
         concern_count = user_message.count("### Concern")
@@ -102,6 +107,8 @@ def test_tier_dispatch_runs_each_tier_with_its_own_batch_size(monkeypatch):
         "gauntlet.phase_4_evaluation.call_model",
         _fake_call_model_factory(sizes_seen),
     )
+    # All six batches share one schedule now; skip the rate-limit wave pause.
+    monkeypatch.setattr("gauntlet.phase_4_evaluation.time.sleep", lambda seconds: None)
 
     evals = evaluate_concerns_multi_model(
         spec="dummy spec",
@@ -216,3 +223,237 @@ def test_tier_dispatch_equivalence_with_flat_when_single_tier_matches(monkeypatc
     assert len(flat_evals) == len(tier_evals) == 15
     # Same set of concern ids in both outputs.
     assert {e.concern.id for e in flat_evals} == {e.concern.id for e in tier_evals}
+
+
+def test_tier_dispatch_does_not_wait_for_previous_tier(monkeypatch):
+    """A slow easy-tier batch does not hold back the hard tier's launch."""
+    import threading
+
+    easy = [_make_concern(i) for i in range(2)]
+    hard = [_make_concern(i + 100) for i in range(2)]
+    hard_started = threading.Event()
+    record = _fake_call_model_factory([])
+    waited = []
+
+    def fake(model, system_prompt, user_message, timeout, codex_reasoning, json_mode=False, **kwargs):
+        if "Concern 0:" in user_message:
+            waited.append(hard_started.wait(timeout=5))
+        else:
+            hard_started.set()
+        return record(model, system_prompt, user_message, timeout, codex_reasoning, json_mode)
+
+    monkeypatch.setattr("gauntlet.phase_4_evaluation.call_model", fake)
+
+    evals = evaluate_concerns_multi_model(
+        spec="dummy spec",
+        concerns=[],
+        models=["model-a", "model-b"],
+        config=GauntletConfig(),
+        batch_size=[
+            BatchTier(name="easy", concerns=easy, batch_size=2),
+            BatchTier(name="hard", concerns=hard, batch_size=2),
+        ],
+    )
+
+    assert waited == [True, True]
+    assert [e.concern.id for e in evals] == [c.id for c in easy + hard]
+
+
+def test_multi_model_keeps_batch_order_when_batches_finish_out_of_order(monkeypatch):
+    """Consensus is built per batch as models finish; output stays in concern order."""
+    import threading
+
+    concerns = [_make_concern(i) for i in range(6)]
+    first_batch_release = threading.Event()
+    record = _fake_call_model_factory([])
+
+    def fake(model, system_prompt, user_message, timeout, codex_reasoning, json_mode=False, **kwargs):
+        if "Concern 0:" in user_message:
+            # Hold the first batch until a later batch has been answered.
+            first_batch_release.wait(timeout=5)
+        else:
+            first_batch_release.set()
+        return record(model, system_prompt, user_message, timeout, codex_reasoning, json_mode)
+
+    monkeypatch.setattr("gauntlet.phase_4_evaluation.call_model", fake)
+
+    evals = evaluate_concerns_multi_model(
+        spec="dummy spec",
+        concerns=concerns,
+        models=["model-a", "model-b"],
+        config=GauntletConfig(),
+        batch_size=2,
+    )
+
+    assert [e.concern.id for e in evals] == [c.id for c in concerns]
+    assert all(e.votes == {"accepted": 2} for e in evals)
+
+
+def test_multi_model_completes_batches_when_a_model_is_listed_twice(monkeypatch):
+    """A repeated model is scheduled and counted once, so every batch completes."""
+    concerns = [_make_concern(i) for i in range(4)]
+    calls = []
+    monkeypatch.setattr(
+        "gauntlet.phase_4_evaluation.call_model", _fake_call_model_factory(calls)
+    )
+
+    evals = evaluate_concerns_multi_model(
+        spec="dummy spec",
+        concerns=concerns,
+        models=["model-a", "model-a", "model-b"],
+        config=GauntletConfig(),
+        batch_size=2,
+    )
+
+    assert [e.concern.id for e in evals] == [c.id for c in concerns]
+    assert all(e.votes == {"accepted": 2} for e in evals)
+    assert len(calls) == 4
+
+
+def test_batches_a_model_failed_on_are_not_passed_to_on_batch(monkeypatch):
+    """Failure placeholders must not be journaled, or --resume never retries them."""
+    concerns = [_make_concern(i) for i in range(4)]
+    record = _fake_call_model_factory([])
+
+    def fake(model, system_prompt, user_message, timeout, codex_reasoning, json_mode=False, **kwargs):
+        if model == "model-b" and "Concern 0:" in user_message:
+            raise RuntimeError("provider outage")
+        return record(model, system_prompt, user_message, timeout, codex_reasoning, json_mode)
+
+    monkeypatch.setattr("gauntlet.phase_4_evaluation.call_model", fake)
+    journaled: list[list[Evaluation]] = []
+
+    evals = evaluate_concerns_multi_model(
+        spec="dummy spec",
+        concerns=concerns,
+        models=["model-a", "model-b"],
+        config=GauntletConfig(),
+        batch_size=2,
+        on_batch=journaled.append,
+    )
+
+    assert len(evals) == 4
+    assert [[e.concern.id for e in batch] for batch in journaled] == [
+        [concerns[2].id, concerns[3].id]
+    ]
+
+
+def test_evaluate_concerns_keys_verdicts_by_concern_index(monkeypatch):
+    """Reordered, repeated, out-of-range and missing items map back to batch order."""
+    concerns = [_make_concern(i) for i in range(3)]
+    reply = {"evaluations": [
+        {"concern_index": 2, "verdict": "accepted", "reasoning": "two"},
+        {"concern_index": 0, "verdict": "dismissed", "reasoning": "zero"},
+        {"concern_index": 2, "verdict": "dismissed", "reasoning": "repeat"},
+        {"concern_index": 7, "verdict": "accepted", "reasoning": "bogus"},
+    ]}
+
+    def fake(model, system_prompt, user_message, timeout, codex_reasoning, json_mode=False, **kwargs):
+        return json.dumps(reply), 10, 10
+
+    monkeypatch.setattr("gauntlet.phase_4_evaluation.call_model", fake)
+
+    evals = evaluate_concerns("spec", concerns, "model-a", GauntletConfig())
+
+    assert [e.concern.id for e in evals] == [c.id for c in concerns]
+    assert [e.verdict for e in evals] == ["dismissed", "deferred", "accepted"]
+    assert evals[2].reasoning == "two"
+
+
+def test_batch_api_models_use_one_job_and_fall_back_live(monkeypatch):
+    """With batch_api, the OpenAI model runs one job; unanswered batches go live."""
+    concerns = [_make_concern(i) for i in range(4)]
+    live_calls = []
+    record = _fake_call_model_factory([])
+
+    def fake(model, system_prompt, user_message, timeout, codex_reasoning, json_mode=False, **kwargs):
+        live_calls.append((model, "Concern 0:" in user_message))
+        return record(model, system_prompt, user_message, timeout, codex_reasoning, json_mode)
+
+    jobs = []
+
+    def fake_batch(model, requests):  # noqa: ANN001
+        jobs.append((model, [custom_id for custom_id, _, _ in requests]))
+        reply = {"evaluations": [
+            {"concern_index": i, "verdict": "accepted", "reasoning": "batched"} for i in range(2)
+        ]}
+        return {"1": (json.dumps(reply), 10, 10)}
+
+    monkeypatch.setattr("gauntlet.phase_4_evaluation.call_model", fake)
+    monkeypatch.setattr("gauntlet.phase_4_evaluation.run_chat_batch", fake_batch)
+
+    evals = evaluate_concerns_multi_model(
+        spec="dummy spec",
+        concerns=concerns,
+        models=["gpt-4o", "model-b"],
+        config=GauntletConfig(batch_api=True),
+        batch_size=2,
+    )
+
+    assert jobs == [("gpt-4o", ["0", "1"])]
+    # gpt-4o only goes live for batch 0, which its job did not answer.
+    assert sorted(call for call in live_calls if call[0] == "gpt-4o") == [("gpt-4o", True)]
+    assert [e.concern.id for e in evals] == [c.id for c in concerns]
+    assert all(e.votes == {"accepted": 2} for e in evals)
+
+
+def test_cascade_escalates_only_low_confidence_verdicts(monkeypatch):
+    """Confident cheap verdicts are final; the rest get ensemble consensus."""
+    concerns = [_make_concern(i) for i in range(4)]
+    # Cheap model: sure about 0 and 2, unsure about 1, no confidence for 3.
+    cheap_confidence = [0.95, 0.4, 0.8, None]
+    calls = []
+
+    def fake(model, system_prompt, user_message, timeout, codex_reasoning, json_mode=False, **kwargs):
+        texts = [c.text for c in concerns if c.text in user_message]
+        calls.append((model, len(texts), "CONFIDENCE" in system_prompt))
+        evaluations = []
+        for i, text in enumerate(texts):
+            item = {"concern_index": i, "verdict": "dismissed", "reasoning": model}
+            if model == "cheap":
+                confidence = cheap_confidence[int(text.split()[1].rstrip(":"))]
+                if confidence is not None:
+                    item["confidence"] = confidence
+            evaluations.append(item)
+        return json.dumps({"evaluations": evaluations}), 10, 10
+
+    monkeypatch.setattr("gauntlet.phase_4_evaluation.call_model", fake)
+    journaled = []
+
+    evals = evaluate_concerns_cascade(
+        "spec", concerns, "cheap", ["model-a", "model-b"], GauntletConfig(),
+        batch_size=2, on_batch=journaled.append,
+    )
+
+    # The first pass runs over the ensemble's batches, and only it is asked
+    # for a confidence.
+    assert sorted(calls) == [
+        ("cheap", 2, True), ("cheap", 2, True),
+        ("model-a", 2, False), ("model-b", 2, False),
+    ]
+    assert [e.concern.id for e in evals] == [c.id for c in concerns]
+    assert [e.reasoning.startswith("[Consensus") for e in evals] == [False, True, False, True]
+    assert evals[0].confidence == 0.95
+    assert [len(batch) for batch in journaled] == [2, 2]
+
+
+def test_batch_consensus_unanimous_and_split_columns():
+    """Unanimous columns skip the tally; splits tie-break toward accepted."""
+    batch = [_make_concern(0), _make_concern(1)]
+
+    def ev(concern, verdict, severity=""):  # noqa: ANN001
+        return Evaluation(concern=concern, verdict=verdict, reasoning=f"{verdict} because", severity=severity)
+
+    results = {
+        "lead": [ev(batch[0], "dismissed", "low"), ev(batch[1], "dismissed")],
+        "second": [ev(batch[0], "dismissed", "high"), ev(batch[1], "accepted")],
+    }
+
+    evals, disagreements = _batch_consensus(batch, results, ["lead", "second"])
+
+    assert disagreements == 1
+    assert [e.verdict for e in evals] == ["dismissed", "accepted"]
+    assert evals[0].votes == {"dismissed": 2}
+    assert evals[0].severity == "high"
+    assert evals[0].reasoning == "[Consensus: {'dismissed': 2}] dismissed because"
+    assert evals[1].votes == {"dismissed": 1, "accepted": 1}
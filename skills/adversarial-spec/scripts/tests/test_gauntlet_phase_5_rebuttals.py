@@ -0,0 +1,153 @@
+"""Regression tests for Phase 5 rebuttals."""
+
+import json
+
+from gauntlet.core_types import Concern, Evaluation, GauntletConfig
+from gauntlet.phase_5_rebuttals import run_rebuttals
+
+
+def _dismissed(concern_id: str, adversary: str, text: str, reasoning: str) -> Evaluation:
+    return Evaluation(
+        concern=Concern(adversary=adversary, text=text, id=concern_id),
+        verdict="dismissed",
+        reasoning=reasoning,
+    )
+
+
+def _challenge_all(user_message: str) -> str:
+    count = user_message.count("### Dismissal ")
+    return json.dumps({"rebuttals": [
+        {"index": i, "verdict": "challenged", "response": "the spec never defines retries"}
+        for i in range(1, count + 1)
+    ]})
+
+
+def test_near_duplicate_dismissals_share_one_rebuttal(monkeypatch):
+    """Same-adversary duplicates get one rebuttal; every dismissal gets a Rebuttal."""
+    calls = []
+
+    def fake_call_model(**kwargs):  # noqa: ANN001
+        calls.append(kwargs["user_message"])
+        if kwargs.get("json_mode"):
+            return _challenge_all(kwargs["user_message"]), 1, 1
+        return "CHALLENGED: the spec never defines retries", 1, 1
+
+    monkeypatch.setattr("gauntlet.phase_5_rebuttals.call_model", fake_call_model)
+
+    text = "Retry logic on the payment webhook has no idempotency key"
+    reasoning = "Idempotency is handled by the upstream queue"
+    evaluations = [
+        _dismissed("PARA-1", "paranoid_security", text, reasoning),
+        _dismissed("PARA-2", "paranoid_security", text + ".", reasoning),
+        _dismissed("BURN-1", "burned_oncall", text, reasoning),
+        _dismissed("PARA-3", "paranoid_security", "Session tokens never expire", "Out of scope"),
+    ]
+
+    rebuttals = run_rebuttals(evaluations, "test-model", GauntletConfig())
+
+    # One batched call for paranoid_security's two distinct dismissals, one
+    # plain call for burned_oncall.
+    assert len(calls) == 2
+    assert sorted(r.evaluation.concern.id for r in rebuttals) == [
+        "BURN-1", "PARA-1", "PARA-2", "PARA-3",
+    ]
+    assert all(r.sustained for r in rebuttals)
+    assert all(r.response.startswith("CHALLENGED:") for r in rebuttals)
+
+
+def test_batched_rebuttal_retries_uncovered_dismissals_individually(monkeypatch):
+    """Dismissals missing from a batched reply fall back to a plain call."""
+    calls = []
+
+    def fake_call_model(**kwargs):  # noqa: ANN001
+        calls.append(kwargs.get("json_mode", False))
+        if kwargs.get("json_mode"):
+            reply = {"rebuttals": [
+                {"index": 2, "verdict": "accepted", "response": "fair point"},
+                {"index": 9, "verdict": "challenged", "response": "no such dismissal"},
+            ]}
+            return "Here you go:\n" + json.dumps(reply), 1, 1
+        return "CHALLENGED: tokens are replayable", 1, 1
+
+    monkeypatch.setattr("gauntlet.phase_5_rebuttals.call_model", fake_call_model)
+
+    evaluations = [
+        _dismissed("PARA-1", "paranoid_security", "Session tokens never expire", "Out of scope"),
+        _dismissed("PARA-2", "paranoid_security", "Webhook payloads are unsigned", "Internal only"),
+    ]
+
+    rebuttals = run_rebuttals(evaluations, "test-model", GauntletConfig())
+
+    assert calls == [True, False]
+    by_id = {r.evaluation.concern.id: r for r in rebuttals}
+    assert by_id["PARA-1"].sustained is True
+    assert by_id["PARA-2"].sustained is False
+    assert by_id["PARA-2"].response == "ACCEPTED: fair point"
+
+
+def test_dismissal_citing_resolution_skips_model_call(monkeypatch):
+    """'Already addressed' dismissals are accepted locally without a model call."""
+    def fail(**kwargs):  # noqa: ANN001
+        raise AssertionError("rebuttal model should not be called")
+
+    monkeypatch.setattr("gauntlet.phase_5_rebuttals.call_model", fail)
+
+    evaluations = [
+        _dismissed("PARA-1", "paranoid_security", "No rate limiting", "Already addressed in section 4.2"),
+    ]
+
+    rebuttals = run_rebuttals(evaluations, "test-model", GauntletConfig())
+
+    assert len(rebuttals) == 1
+    assert rebuttals[0].sustained is False
+    assert rebuttals[0].response.startswith("AUTO-ACCEPTED")
+
+
+def test_unanimous_well_justified_dismissal_skips_model_call(monkeypatch):
+    """Only split or thinly-justified multi-model dismissals are rebutted."""
+    rebutted = []
+
+    def fake_call_model(**kwargs):  # noqa: ANN001
+        rebutted.append(kwargs["user_message"])
+        return "ACCEPTED: fine", 1, 1
+
+    monkeypatch.setattr("gauntlet.phase_5_rebuttals.call_model", fake_call_model)
+
+    long_reasoning = "[Consensus: {'dismissed': 2}] " + "The queue dedupes by message id. " * 8
+    unanimous = _dismissed("PARA-1", "paranoid_security", "Webhook replays double-charge", long_reasoning)
+    unanimous.votes = {"dismissed": 2}
+    split = _dismissed("BURN-1", "burned_oncall", "Pager storms on deploy", long_reasoning)
+    split.votes = {"dismissed": 2, "accepted": 1}
+    short = _dismissed("ARCH-1", "architect", "No schema versioning", "[Consensus: {'dismissed': 3}] Not needed")
+    short.votes = {"dismissed": 3}
+
+    rebuttals = run_rebuttals([unanimous, split, short], "test-model", GauntletConfig())
+
+    by_id = {r.evaluation.concern.id: r for r in rebuttals}
+    assert by_id["PARA-1"].response.startswith("AUTO-ACCEPTED")
+    assert by_id["PARA-1"].sustained is False
+    assert len(rebutted) == 2
+    assert not any("Webhook replays" in message for message in rebutted)
+
+
+def test_auth_error_stops_remaining_rebuttal_batches(monkeypatch):
+    """A 401 aborts the phase instead of repeating the failing call per batch."""
+    class AuthenticationError(Exception):
+        status_code = 401
+
+    calls = []
+
+    def reject(**kwargs):  # noqa: ANN001
+        calls.append(kwargs)
+        raise AuthenticationError("invalid api key")
+
+    monkeypatch.setattr("gauntlet.phase_5_rebuttals.call_model", reject)
+    monkeypatch.setattr("gauntlet.phase_5_rebuttals.get_rate_limit_config", lambda model: (1, 0))
+
+    evaluations = [
+        _dismissed(f"PARA-{i}", "paranoid_security", f"Distinct concern number {i} about {word}", "Not needed")
+        for i, word in enumerate(["caching", "tokens", "queues"])
+    ]
+
+    assert run_rebuttals(evaluations, "test-model", GauntletConfig()) == []
+    assert len(calls) == 1
@@ -0,0 +1,64 @@
+"""Regression tests for Phase 6 adjudication."""
+
+from gauntlet.core_types import Concern, Evaluation, GauntletConfig, Rebuttal
+from gauntlet.phase_6_adjudication import final_adjudication
+
+
+def _challenge(concern_id: str, severity: str = "high", votes=None) -> Rebuttal:  # noqa: ANN001
+    evaluation = Evaluation(
+        concern=Concern(adversary="paranoid_security", text=f"Concern {concern_id}", id=concern_id),
+        verdict="dismissed",
+        reasoning="reason",
+        severity=severity,
+        votes=votes or {},
+    )
+    return Rebuttal(evaluation=evaluation, response="CHALLENGED: no", sustained=True)
+
+
+def test_split_eval_vote_overturns_without_model_call(monkeypatch):
+    """Challenges dismissed by a minority of eval models skip adjudication."""
+    calls = []
+    monkeypatch.setattr(
+        "gauntlet.phase_6_adjudication.call_model",
+        lambda **kwargs: (calls.append(kwargs) or ('{"decisions": [{"challenge_index": 0, "verdict": "upheld"}]}', 0, 0)),
+    )
+
+    surviving = final_adjudication(
+        "spec",
+        [
+            _challenge("PARA-1", votes={"dismissed": 1, "accepted": 1, "acknowledged": 1}),
+            _challenge("PARA-2", votes={"dismissed": 2}),
+        ],
+        "test-model",
+        GauntletConfig(),
+    )
+
+    assert [c.id for c in surviving] == ["PARA-1"]
+    assert len(calls) == 1
+    assert "PARA-1" not in calls[0]["user_message"]
+
+
+def test_single_low_severity_challenge_skips_model_call(monkeypatch):
+    def fail(**kwargs):  # noqa: ANN001
+        raise AssertionError("adjudication model should not be called")
+
+    monkeypatch.setattr("gauntlet.phase_6_adjudication.call_model", fail)
+
+    surviving = final_adjudication("spec", [_challenge("PARA-1", severity="low")], "test-model", GauntletConfig())
+
+    assert [c.id for c in surviving] == ["PARA-1"]
+
+
+def test_min_challenges_env_skips_small_adjudications(monkeypatch):
+    monkeypatch.setenv("FINAL_ADJUDICATION_MIN_CHALLENGES", "3")
+
+    def fail(**kwargs):  # noqa: ANN001
+        raise AssertionError("adjudication model should not be called")
+
+    monkeypatch.setattr("gauntlet.phase_6_adjudication.call_model", fail)
+
+    surviving = final_adjudication(
+        "spec", [_challenge("PARA-1"), _challenge("PARA-2")], "test-model", GauntletConfig(),
+    )
+
+    assert [c.id for c in surviving] == ["PARA-1", "PARA-2"]
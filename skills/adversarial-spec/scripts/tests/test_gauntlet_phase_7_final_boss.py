@@ -0,0 +1,41 @@
+"""Regression tests for Phase 7 final boss response parsing."""
+
+from gauntlet.core_types import FinalBossVerdict, GauntletConfig
+from gauntlet.phase_7_final_boss import run_final_boss_review
+
+REFINE_RESPONSE = """Analysis
+VERDICT: REFINE
+CONCERNS TO ADDRESS:
+1. The retry policy is undefined for partial failures
+- short
+• Bullet concern about cache invalidation here
+   2) Another numbered concern with paren style
+not a list line
+VERDICT trailing
+3. Listed after the stop marker and ignored
+INVALID DISMISSALS: D1, d3 and D12
+PROCESS META-REPORT:
+The process was fine
+SELF META-REPORT: x
+I am confident
+```
+"""
+
+
+def test_final_boss_parses_concern_section_and_telemetry(monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+    monkeypatch.setattr(
+        "gauntlet.phase_7_final_boss.call_model", lambda **kwargs: (REFINE_RESPONSE, 1, 2)
+    )
+
+    result = run_final_boss_review("spec", "summary", [], [], GauntletConfig())
+
+    assert result.verdict == FinalBossVerdict.REFINE
+    assert result.concerns == [
+        "The retry policy is undefined for partial failures",
+        "Bullet concern about cache invalidation here",
+        "Another numbered concern with paren style",
+    ]
+    assert result.dismissal_review_stats.flagged_dismissals == ["D1", "D3", "D12"]
+    assert result.process_meta_report == "The process was fine"
+    assert result.self_meta_report == "I am confident"
@@ -113,6 +113,14 @@ class TestTokenTracker:
         # With multiplication by 1M, cost would be trillions
         assert cost < 1000  # Reasonable upper bound for 1M tokens
 
+    def test_rate_scale_discounts_cost(self):
+        tracker = TokenTracker()
+        live = tracker.record_call("gpt-4o", 1000, 500)
+        batch = tracker.record_call("gpt-4o", 1000, 500, rate_scale=0.5)
+
+        assert abs(batch - live / 2) < 1e-12
+        assert abs(tracker.by_model["gpt-4o"]["cost"] - live * 1.5) < 1e-12
+
     def test_default_values(self):
         # Mutation: changing default 0.0 to 1.0 would fail
         tracker = TokenTracker()
@@ -1303,3 +1311,26 @@ class TestIsOSeriesModel:
 
     def test_does_not_detect_empty_string(self):
         assert is_o_series_model("") is False
+
+
+class TestGetLitellmCompletion:
+    def test_installs_shared_http_pool_once(self):
+        import litellm
+        import models
+
+        saved_completion = models.completion
+        saved_session = litellm.client_session
+        try:
+            models.completion = None
+            litellm.client_session = None
+            first = models.get_litellm_completion()
+            session = litellm.client_session
+            assert session is not None
+
+            models.completion = None
+            assert models.get_litellm_completion() is first
+            assert litellm.client_session is session
+            session.close()
+        finally:
+            models.completion = saved_completion
+            litellm.client_session = saved_session
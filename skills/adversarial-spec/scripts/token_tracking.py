@@ -4,9 +4,36 @@ from __future__ import annotations
 
 import threading
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from providers import DEFAULT_COST, MODEL_COSTS
 
+# CLI-routed models are subscription-based and do not use token pricing.
+_CLI_PREFIXES = ("codex/", "gemini-cli/", "claude-cli/")
+_FREE_COST = {"input": 0.0, "output": 0.0}
+
+# Per-thread running totals, so work overlapped with other phases on a
+# background thread can still be attributed to its own phase.
+_thread_usage = threading.local()
+
+
+def thread_usage() -> tuple[int, int]:
+    """(input, output) tokens recorded so far by calls on the current thread."""
+    return getattr(_thread_usage, "input", 0), getattr(_thread_usage, "output", 0)
+
+
+@lru_cache(maxsize=None)
+def _per_token_rates(model: str) -> tuple[float, float]:
+    """(input, output) USD per token for a model; resolved once per name.
+
+    MODEL_COSTS is a static table and must not change at runtime: cached
+    rates are never refreshed (call _per_token_rates.cache_clear() after
+    patching it).
+    """
+    default = _FREE_COST if model.startswith(_CLI_PREFIXES) else DEFAULT_COST
+    costs = MODEL_COSTS.get(model, default)
+    return costs["input"] / 1_000_000, costs["output"] / 1_000_000
+
 
 @dataclass
 class TokenTracker:
@@ -18,31 +45,36 @@ class TokenTracker:
     by_model: dict = field(default_factory=dict)
     _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
 
-    def record_call(self, model: str, input_tokens: int, output_tokens: int) -> float:
-        """Record usage for a model call and return the cost."""
-        # CLI-routed models are subscription-based and do not use token pricing.
-        cli_prefixes = ("codex/", "gemini-cli/", "claude-cli/")
-        free_cost = {"input": 0.0, "output": 0.0}
-        default = free_cost if model.startswith(cli_prefixes) else DEFAULT_COST
-        costs = MODEL_COSTS.get(model, default)
-        cost = (input_tokens / 1_000_000 * costs["input"]) + (
-            output_tokens / 1_000_000 * costs["output"]
-        )
+    def record_call(
+        self, model: str, input_tokens: int, output_tokens: int, rate_scale: float = 1.0
+    ) -> float:
+        """Record usage for a model call and return the cost.
+
+        rate_scale multiplies the live per-token rates (e.g. batch pricing).
+        """
+        input_rate, output_rate = _per_token_rates(model)
+        cost = (input_tokens * input_rate + output_tokens * output_rate) * rate_scale
+
+        _thread_usage.input = getattr(_thread_usage, "input", 0) + input_tokens
+        _thread_usage.output = getattr(_thread_usage, "output", 0) + output_tokens
 
+        # Only the additions run under the lock; everything else is computed
+        # before it is taken.
         with self._lock:
             self.total_input_tokens += input_tokens
             self.total_output_tokens += output_tokens
             self.total_cost += cost
 
-            if model not in self.by_model:
-                self.by_model[model] = {
+            entry = self.by_model.get(model)
+            if entry is None:
+                entry = self.by_model[model] = {
                     "input_tokens": 0,
                     "output_tokens": 0,
                     "cost": 0.0,
                 }
-            self.by_model[model]["input_tokens"] += input_tokens
-            self.by_model[model]["output_tokens"] += output_tokens
-            self.by_model[model]["cost"] += cost
+            entry["input_tokens"] += input_tokens
+            entry["output_tokens"] += output_tokens
+            entry["cost"] += cost
 
         return cost
 